@@ -0,0 +1,25 @@
+"""Add index for task status lookups
+
+Revision ID: 3d7a9c2e5f41
+Revises: 8c1f4e2a9b3d
+Create Date: 2025-08-09 11:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d7a9c2e5f41'
+down_revision: Union[str, None] = '8c1f4e2a9b3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_tasks_status'), 'tasks', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_tasks_status'), table_name='tasks')
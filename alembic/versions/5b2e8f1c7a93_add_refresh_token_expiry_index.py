@@ -0,0 +1,27 @@
+"""Add index for refresh token expiry cleanup
+
+Revision ID: 5b2e8f1c7a93
+Revises: 3d7a9c2e5f41
+Create Date: 2025-08-10 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2e8f1c7a93'
+down_revision: Union[str, None] = '3d7a9c2e5f41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f('ix_refresh_tokens_expires_at'), 'refresh_tokens', ['expires_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_refresh_tokens_expires_at'), table_name='refresh_tokens')
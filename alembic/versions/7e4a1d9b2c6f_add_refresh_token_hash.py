@@ -0,0 +1,35 @@
+"""Look up refresh tokens by SHA-256 hash
+
+Revision ID: 7e4a1d9b2c6f
+Revises: 5b2e8f1c7a93
+Create Date: 2025-08-10 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e4a1d9b2c6f'
+down_revision: Union[str, None] = '5b2e8f1c7a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('refresh_tokens', sa.Column('token_hash', sa.LargeBinary(length=32), nullable=True))
+
+    # Hash on the server in one statement, which also works with --sql
+    op.execute("UPDATE refresh_tokens SET token_hash = sha256(convert_to(token, 'UTF8'))")
+
+    op.alter_column('refresh_tokens', 'token_hash', nullable=False)
+    op.create_index(op.f('ix_refresh_tokens_token_hash'), 'refresh_tokens', ['token_hash'], unique=True)
+    op.drop_index(op.f('ix_refresh_tokens_token'), table_name='refresh_tokens')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_refresh_tokens_token'), 'refresh_tokens', ['token'], unique=True)
+    op.drop_index(op.f('ix_refresh_tokens_token_hash'), table_name='refresh_tokens')
+    op.drop_column('refresh_tokens', 'token_hash')
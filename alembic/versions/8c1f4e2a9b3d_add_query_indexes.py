@@ -0,0 +1,36 @@
+"""Add indexes for active refresh tokens and build pagination
+
+Revision ID: 8c1f4e2a9b3d
+Revises: 302df03ebfee
+Create Date: 2025-08-02 10:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c1f4e2a9b3d'
+down_revision: Union[str, None] = '302df03ebfee'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Partial index: revoked tokens are never looked up by user again
+    op.create_index(
+        'ix_refresh_tokens_user_active',
+        'refresh_tokens',
+        ['user_id'],
+        unique=False,
+        postgresql_where=sa.text('is_revoked = false'),
+        sqlite_where=sa.text('is_revoked = 0'),
+    )
+    op.create_index(op.f('ix_builds_created_at'), 'builds', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_builds_created_at'), table_name='builds')
+    op.drop_index('ix_refresh_tokens_user_active', table_name='refresh_tokens')
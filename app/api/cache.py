@@ -0,0 +1,107 @@
+"""Response caching for read-heavy API endpoints."""
+
+import functools
+import hashlib
+import json
+from typing import Any, Callable, Iterable, Optional
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from app.infrastructure.cache.redis_client import RedisClient
+
+NON_KEY_ARGUMENTS = frozenset({"request", "current_user", "build_service", "auth_service"})
+
+
+def endpoint_cache_key(namespace: str, func: Callable, kwargs: dict) -> str:
+    """
+    Build cache key from endpoint arguments.
+
+    Injected dependencies (request, current user, services) are left out so
+    the key only depends on path and query parameters.
+
+    Args:
+        namespace: Cache namespace
+        func: Endpoint function
+        kwargs: Endpoint keyword arguments
+
+    Returns:
+        Cache key
+    """
+    key_args = {
+        name: str(value)
+        for name, value in sorted(kwargs.items())
+        if name not in NON_KEY_ARGUMENTS
+    }
+    digest = hashlib.md5(json.dumps(key_args, sort_keys=True).encode()).hexdigest()
+    return f"{namespace}:{func.__name__}:{digest}"
+
+
+def _get_redis(request: Optional[Request]) -> Optional[RedisClient]:
+    """Return Redis client connected at startup, if any."""
+    if request is None:
+        return None
+    return getattr(request.app.state, "redis_client", None)
+
+
+def _json_body(result: Any) -> Optional[str]:
+    """Return JSON body of a successful endpoint result, if cacheable."""
+    if isinstance(result, BaseModel):
+        return result.model_dump_json()
+    if isinstance(result, Response) and result.status_code == 200:
+        if result.media_type == "application/json":
+            return bytes(result.body).decode()
+    return None
+
+
+def cache_response(ttl: int, namespace: str) -> Callable:
+    """
+    Cache endpoint responses in Redis.
+
+    The decorated endpoint must accept ``request: Request``. Cached bodies
+    are returned as raw JSON responses, skipping response model validation.
+    Caching is skipped when the application has no Redis client on its state.
+
+    Args:
+        ttl: Time-to-live in seconds
+        namespace: Cache namespace used for keys and invalidation
+
+    Returns:
+        Decorated endpoint
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            redis_client = _get_redis(kwargs.get("request"))
+            if redis_client is None:
+                return await func(*args, **kwargs)
+
+            cache_key = endpoint_cache_key(namespace, func, kwargs)
+            cached_body = await redis_client.get(cache_key)
+            if cached_body is not None:
+                return Response(content=cached_body, media_type="application/json")
+
+            result = await func(*args, **kwargs)
+            body = _json_body(result)
+            if body is not None:
+                await redis_client.set(cache_key, body, ttl)
+            return result
+
+        return wrapper
+    return decorator
+
+
+async def clear_response_cache(request: Request, namespaces: Iterable[str]) -> None:
+    """
+    Drop cached responses for the given namespaces.
+
+    Args:
+        request: Current request
+        namespaces: Cache namespaces to clear
+    """
+    redis_client = _get_redis(request)
+    if redis_client is None:
+        return
+
+    for namespace in namespaces:
+        await redis_client.clear_pattern(f"{namespace}:*")
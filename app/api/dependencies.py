@@ -1,100 +1,178 @@
 """FastAPI dependency injection setup."""
 
-from typing import AsyncGenerator
-
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.ext.asyncio import AsyncSession
-
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional
+
+from fastapi import Depends, FastAPI, HTTPException, Request, status
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.security import optional_security, security
+from app.core.auth.batching import BatchedUserRepository, UserBatchLoader
+from app.core.auth.cache import (
+    AccessTokenCache,
+    CachedUserRepository,
+    TokenPayloadCache,
+    TokenUserCache,
+    UserLookupCache,
+)
 from app.core.auth.entities import User
 from app.core.auth.exceptions import (
     InvalidTokenException,
     ExpiredTokenException,
     UserNotFoundException,
 )
-from app.core.auth.services import AuthenticationService
+from app.core.auth.services import AuthenticationService, PasswordService, TokenService
 from app.core.services.build_service import BuildService
 from app.core.services.topology_service import TopologyService
-from app.infrastructure.database.session import get_session
+from app.infrastructure.database.session import get_session_maker
 from app.infrastructure.database.repositories.build_repository import SqlBuildRepository
 from app.infrastructure.database.repositories.task_repository import SqlTaskRepository
 from app.infrastructure.database.repositories.user_repository import SqlUserRepository
 from app.infrastructure.database.repositories.refresh_token_repository import SqlRefreshTokenRepository
 from app.infrastructure.cache.cache_service import CacheService
-from app.infrastructure.cache.redis_client import get_redis_client
+from app.infrastructure.cache.redis_client import RedisClient
+
+
+def init_app_services(app: FastAPI, redis_client: RedisClient) -> None:
+    """
+    Build stateless application-scoped services once and store them on app state.
+
+    Session-bound repositories are still created per request from the shared
+    session factory, so every request works with its own database session.
+
+    Args:
+        app: FastAPI application
+        redis_client: Connected Redis client
+    """
+    app.state.session_factory = get_session_maker()
+    app.state.password_service = PasswordService()
+    app.state.token_user_cache = TokenUserCache()
+    app.state.token_payload_cache = TokenPayloadCache()
+    app.state.access_token_cache = AccessTokenCache()
+    app.state.user_lookup_cache = UserLookupCache()
+    app.state.user_batch_loader = create_user_batch_loader(app.state.session_factory)
+    app.state.topology_service = TopologyService()
+    app.state.cache_service = CacheService(redis_client)
+
+
+def create_user_batch_loader(session_factory: async_sessionmaker) -> UserBatchLoader:
+    """
+    Create user batch loader querying through its own sessions.
+
+    Batches combine lookups from different requests, so they cannot use any
+    single request's session.
+
+    Args:
+        session_factory: Database session factory
+
+    Returns:
+        UserBatchLoader: User batch loader
+    """
+    async def load_users(user_ids: List[int]) -> Dict[int, User]:
+        async with session_factory() as session:
+            return await SqlUserRepository(session).get_users_by_ids(user_ids)
 
-security = HTTPBearer()
+    return UserBatchLoader(load_users)
 
-_auth_service: AuthenticationService = None
-_build_service: BuildService = None
 
+def _get_app_service(request: Request, name: str, factory: Callable[[], Any]) -> Any:
+    """Return app-scoped service, creating it lazily if lifespan did not."""
+    service = getattr(request.app.state, name, None)
+    if service is None:
+        service = factory()
+        setattr(request.app.state, name, service)
+    return service
 
-async def get_database_session() -> AsyncGenerator[AsyncSession, None]:
+
+async def get_database_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
     Provide database session for dependency injection.
 
+    The session is committed when the request handler succeeds and rolled
+    back otherwise.
+
+    Args:
+        request: Current request
+
     Yields:
         AsyncSession: Database session
     """
-    async for session in get_session():
-        yield session
+    session_factory = _get_app_service(request, "session_factory", get_session_maker)
+
+    async with session_factory() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
 
 
 async def get_auth_service(
-        session: AsyncSession = Depends(get_database_session)
+        request: Request,
+        session: AsyncSession = Depends(get_database_session),
 ) -> AuthenticationService:
     """
     Provide authentication service for dependency injection.
 
     Args:
+        request: Current request
         session: Database session
 
     Returns:
         AuthenticationService: Authentication service instance
     """
-    global _auth_service
-    if _auth_service is None:
-        from app.core.auth.services import PasswordService, TokenService
-
-        user_repo = SqlUserRepository(session)
-        refresh_token_repo = SqlRefreshTokenRepository(session)
-        password_service = PasswordService()
-        token_service = TokenService(user_repo, refresh_token_repo)
-
-        _auth_service = AuthenticationService(
+    session_factory = _get_app_service(request, "session_factory", get_session_maker)
+    user_batch_loader = _get_app_service(
+        request,
+        "user_batch_loader",
+        lambda: create_user_batch_loader(session_factory),
+    )
+    user_repo = CachedUserRepository(
+        BatchedUserRepository(SqlUserRepository(session), user_batch_loader),
+        _get_app_service(request, "user_lookup_cache", UserLookupCache),
+    )
+    refresh_token_repo = SqlRefreshTokenRepository(session)
+    password_service = _get_app_service(request, "password_service", PasswordService)
+    user_cache = _get_app_service(request, "token_user_cache", TokenUserCache)
+
+    return AuthenticationService(
+        user_repo,
+        refresh_token_repo,
+        password_service,
+        TokenService(
             user_repo,
             refresh_token_repo,
-            password_service,
-            token_service,
-        )
-
-    return _auth_service
+            _get_app_service(request, "token_payload_cache", TokenPayloadCache),
+            _get_app_service(request, "access_token_cache", AccessTokenCache),
+        ),
+        user_cache,
+    )
 
 
 async def get_build_service(
-        session: AsyncSession = Depends(get_database_session)
+        request: Request,
+        session: AsyncSession = Depends(get_database_session),
 ) -> BuildService:
     """
     Provide build service for dependency injection.
 
     Args:
+        request: Current request
         session: Database session
 
     Returns:
         BuildService: Build service instance
     """
-    global _build_service
-    if _build_service is None:
-        build_repo = SqlBuildRepository(session)
-        task_repo = SqlTaskRepository(session)
-        topology_service = TopologyService()
-
-        redis_client = get_redis_client()
-        cache_service = CacheService(redis_client)
+    topology_service = _get_app_service(request, "topology_service", TopologyService)
+    cache_service = getattr(request.app.state, "cache_service", None)
 
-        _build_service = BuildService(build_repo, task_repo, topology_service, cache_service)
-
-    return _build_service
+    return BuildService(
+        SqlBuildRepository(session),
+        SqlTaskRepository(session),
+        topology_service,
+        cache_service,
+    )
 
 
 async def get_current_user(
@@ -163,9 +241,9 @@ async def get_current_active_user(
 
 
 async def get_optional_user(
-        credentials: HTTPAuthorizationCredentials = Depends(security),
+        credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
         auth_service: AuthenticationService = Depends(get_auth_service),
-) -> User | None:
+) -> Optional[User]:
     """
     Get current user if token is provided and valid, None otherwise.
 
@@ -176,10 +254,10 @@ async def get_optional_user(
     Returns:
         User or None: Current user if authenticated, None otherwise
     """
-    if not credentials:
+    if credentials is None or not credentials.credentials:
         return None
 
     try:
-        return await get_current_user(credentials, auth_service)
-    except HTTPException:
-        return None
\ No newline at end of file
+        return await auth_service.get_current_user(credentials.credentials)
+    except (InvalidTokenException, ExpiredTokenException, UserNotFoundException):
+        return None
@@ -0,0 +1,79 @@
+"""Shared error handling for build endpoints."""
+
+import functools
+import logging
+from typing import Any, Callable
+
+from fastapi import HTTPException, status
+
+from app.core.exceptions import BuildNotFoundException, CircularDependencyException
+
+logger = logging.getLogger(__name__)
+
+
+def build_not_found(build_name: str) -> HTTPException:
+    """
+    Create 404 error for a missing build.
+
+    Args:
+        build_name: Name of the requested build
+
+    Returns:
+        HTTP exception to raise
+    """
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Build '{build_name}' not found",
+    )
+
+
+def circular_dependency(error: CircularDependencyException) -> HTTPException:
+    """
+    Create 409 error for a build with cyclic task dependencies.
+
+    Args:
+        error: Raised circular dependency exception
+
+    Returns:
+        HTTP exception to raise
+    """
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=f"Circular dependency detected: {error}",
+    )
+
+
+def handle_build_errors(failure_detail: str) -> Callable:
+    """
+    Translate build service errors of an endpoint into HTTP errors.
+
+    The decorated endpoint must accept a ``request`` body with a ``build``
+    field. Error responses are only built when an exception is raised, so
+    the success path runs without any extra work.
+
+    Args:
+        failure_detail: Detail returned for unexpected errors
+
+    Returns:
+        Decorated endpoint
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            try:
+                return await func(*args, **kwargs)
+            except BuildNotFoundException:
+                raise build_not_found(kwargs["request"].build)
+            except CircularDependencyException as e:
+                raise circular_dependency(e)
+            except HTTPException:
+                raise
+            except Exception:
+                logger.exception("%s '%s'", failure_detail, kwargs["request"].build)
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=failure_detail,
+                )
+
+        return wrapper
+    return decorator
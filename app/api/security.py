@@ -0,0 +1,9 @@
+"""Shared HTTP bearer authentication schemes."""
+
+from fastapi.security import HTTPBearer
+
+# Rejects requests without an Authorization header (403)
+security = HTTPBearer()
+
+# Lets anonymous requests through with credentials set to None
+optional_security = HTTPBearer(auto_error=False)
@@ -1,7 +1,6 @@
 """Authentication API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import HTTPBearer
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from app.api.dependencies import get_auth_service, get_current_active_user
 from .schemas import (
@@ -12,6 +11,7 @@ from .schemas import (
     UserResponse,
     RevokeTokensRequest,
     ErrorResponse,
+    user_response,
 )
 from app.core.auth.entities import User
 from app.core.auth.exceptions import (
@@ -26,7 +26,6 @@ from app.core.auth.exceptions import (
 from app.core.auth.services import AuthenticationService
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
-security = HTTPBearer()
 
 
 @router.post(
@@ -57,7 +56,7 @@ async def register_user(
             email=user_data.email,
             password=user_data.password,
         )
-        return UserResponse.model_validate(user)
+        return user_response(user)
     except UserAlreadyExistsException as e:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -146,10 +145,12 @@ async def refresh_token(
 
 @router.post(
     "/revoke",
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
     summary="Revoke tokens",
     description="Revoke current user's refresh tokens.",
     responses={
-        200: {"description": "Tokens revoked successfully"},
+        204: {"description": "Tokens revoked successfully"},
         401: {"model": ErrorResponse, "description": "Authentication required"},
     },
 )
@@ -157,7 +158,7 @@ async def revoke_tokens(
     request: RevokeTokensRequest,
     current_user: User = Depends(get_current_active_user),
     auth_service: AuthenticationService = Depends(get_auth_service),
-) -> dict:
+) -> Response:
     """
     Revoke user's refresh tokens.
     
@@ -166,7 +167,7 @@ async def revoke_tokens(
     """
     try:
         await auth_service.revoke_user_tokens(current_user.id, revoke_all=request.revoke_all)
-        return {"message": "Tokens revoked successfully"}
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
     except UserNotFoundException:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -193,4 +194,4 @@ async def get_current_user_info(
     Returns details about the currently authenticated user based on
     the provided access token.
     """
-    return UserResponse.model_validate(current_user)
\ No newline at end of file
+    return user_response(current_user)
\ No newline at end of file
@@ -1,81 +1,117 @@
 """Authentication API schemas."""
 
+import re
 from typing import Optional
 from datetime import datetime
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.core.auth.entities import User
+
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
 
 class UserRegistrationRequest(BaseModel):
     """User registration request schema."""
     
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "username": "john_doe",
+                "email": "john.doe@example.com",
+                "password": "secure_password_123",
+            },
+        },
+    )
+    
     username: str = Field(
         ...,
         min_length=3,
         max_length=50,
-        description="Username (3-50 characters)",
-        example="john_doe"
+        description="Username (3-50 characters)"
     )
-    email: EmailStr = Field(
+    email: str = Field(
         ...,
-        description="User email address",
-        example="john.doe@example.com"
+        max_length=254,
+        description="User email address"
     )
     password: str = Field(
         ...,
         min_length=8,
         max_length=128,
-        description="Password (8-128 characters)",
-        example="secure_password_123"
+        description="Password (8-128 characters)"
     )
 
+    @field_validator('email')
+    def validate_email(cls, v):
+        if not _EMAIL_RE.match(v):
+            raise ValueError('Invalid email address')
+        local_part, domain = v.rsplit('@', 1)
+        return f"{local_part}@{domain.lower()}"
+
 
 class UserLoginRequest(BaseModel):
     """User login request schema."""
     
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {"username": "john_doe", "password": "secure_password_123"},
+        },
+    )
+    
     username: str = Field(
         ...,
-        description="Username",
-        example="john_doe"
+        description="Username"
     )
     password: str = Field(
         ...,
-        description="Password",
-        example="secure_password_123"
+        description="Password"
     )
 
 
 class TokenResponse(BaseModel):
     """Token response schema."""
     
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+                "refresh_token": "abc123def456ghi789...",
+                "token_type": "bearer",
+                "expires_in": 1800,
+            },
+        },
+    )
+    
     access_token: str = Field(
         ...,
-        description="JWT access token",
-        example="eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9..."
+        description="JWT access token"
     )
     refresh_token: str = Field(
         ...,
-        description="Refresh token for obtaining new access tokens",
-        example="abc123def456ghi789..."
+        description="Refresh token for obtaining new access tokens"
     )
     token_type: str = Field(
         default="bearer",
-        description="Token type",
-        example="bearer"
+        description="Token type"
     )
     expires_in: int = Field(
         ...,
-        description="Access token expiration time in seconds",
-        example=1800
+        description="Access token expiration time in seconds"
     )
 
 
 class RefreshTokenRequest(BaseModel):
     """Refresh token request schema."""
     
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {"refresh_token": "abc123def456ghi789..."},
+        },
+    )
+    
     refresh_token: str = Field(
         ...,
-        description="Refresh token",
-        example="abc123def456ghi789..."
+        description="Refresh token"
     )
 
 
@@ -84,59 +120,95 @@ class UserResponse(BaseModel):
     
     id: int = Field(
         ...,
-        description="User unique identifier",
-        example=1
+        description="User unique identifier"
     )
     username: str = Field(
         ...,
-        description="Username",
-        example="john_doe"
+        description="Username"
     )
     email: str = Field(
         ...,
-        description="User email address",
-        example="john.doe@example.com"
+        description="User email address"
     )
     is_active: bool = Field(
         ...,
-        description="Whether user account is active",
-        example=True
+        description="Whether user account is active"
     )
     created_at: Optional[datetime] = Field(
         None,
-        description="Account creation timestamp",
-        example="2023-01-01T12:00:00Z"
+        description="Account creation timestamp"
     )
     updated_at: Optional[datetime] = Field(
         None,
-        description="Last account update timestamp",
-        example="2023-01-01T12:00:00Z"
+        description="Last account update timestamp"
     )
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        extra="forbid",
+        json_schema_extra={
+            "example": {
+                "id": 1,
+                "username": "john_doe",
+                "email": "john.doe@example.com",
+                "is_active": True,
+                "created_at": "2023-01-01T12:00:00Z",
+                "updated_at": "2023-01-01T12:00:00Z",
+            },
+        },
+    )
+
+
+def user_response(user: User) -> UserResponse:
+    """
+    Build user response from a trusted user entity without validation.
+
+    Args:
+        user: User entity loaded from the database
+
+    Returns:
+        UserResponse: Response schema instance
+    """
+    return UserResponse.model_construct(
+        id=user.id,
+        username=user.username,
+        email=user.email,
+        is_active=user.is_active,
+        created_at=user.created_at,
+        updated_at=user.updated_at,
+    )
 
 
 class RevokeTokensRequest(BaseModel):
     """Revoke tokens request schema."""
     
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {"revoke_all": False},
+        },
+    )
+    
     revoke_all: bool = Field(
         default=False,
-        description="Whether to revoke all user tokens",
-        example=False
+        description="Whether to revoke all user tokens"
     )
 
 
 class ErrorResponse(BaseModel):
     """Error response schema."""
     
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {"error": "Invalid credentials", "type": "AuthenticationError"},
+        },
+    )
+    
     error: str = Field(
         ...,
-        description="Error message",
-        example="Invalid credentials"
+        description="Error message"
     )
     type: str = Field(
         ...,
-        description="Error type",
-        example="AuthenticationError"
-    )
\ No newline at end of file
+        description="Error type"
+    )
@@ -1,12 +1,22 @@
 """Build management API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import Any, Dict
 
-from app.api.dependencies import get_build_service, get_current_active_user
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.cache import cache_response, clear_response_cache
+from app.api.dependencies import (
+    get_build_service,
+    get_current_active_user,
+    get_database_session,
+)
 from .schemas import (
     BuildCreateRequest,
     BuildResponse,
     BuildListResponse,
+    build_response,
 )
 from app.core.auth.entities import User
 from app.core.domain.entities import Build
@@ -15,6 +25,20 @@ from app.core.services.build_service import BuildService
 
 router = APIRouter(prefix="/builds", tags=["Build Management"])
 
+BUILDS_CACHE_NAMESPACE = "saber:builds"
+
+
+def _build_to_dict(build: Build) -> Dict[str, Any]:
+    """Convert build entity to response payload without model validation."""
+    return {
+        "name": build.name,
+        "tasks": build.tasks,
+        "status": build.status,
+        "created_at": build.created_at,
+        "updated_at": build.updated_at,
+        "error_message": build.error_message,
+    }
+
 
 @router.get(
     "/",
@@ -26,12 +50,14 @@ router = APIRouter(prefix="/builds", tags=["Build Management"])
         401: {"description": "Authentication required"},
     },
 )
+@cache_response(ttl=30, namespace=BUILDS_CACHE_NAMESPACE)
 async def list_builds(
+    request: Request,
     limit: int = Query(50, ge=1, le=100, description="Maximum number of builds to return"),
     offset: int = Query(0, ge=0, description="Number of builds to skip"),
     current_user: User = Depends(get_current_active_user),
     build_service: BuildService = Depends(get_build_service),
-) -> BuildListResponse:
+) -> ORJSONResponse:
     """
     Get a paginated list of all available builds.
     
@@ -39,16 +65,12 @@ async def list_builds(
     Builds include their task lists and current status.
     """
     try:
-        all_builds = await build_service.get_all_builds()
-        builds_list = list(all_builds.values())
+        builds, total_count = await build_service.paginate_builds(limit, offset)
         
-        total_count = len(builds_list)
-        paginated_builds = builds_list[offset:offset + limit]
-        
-        return BuildListResponse(
-            builds=[BuildResponse.model_validate(build) for build in paginated_builds],
-            total=total_count,
-        )
+        return ORJSONResponse({
+            "builds": [_build_to_dict(build) for build in builds],
+            "total": total_count,
+        })
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -70,9 +92,11 @@ async def list_builds(
     },
 )
 async def create_build(
+    request: Request,
     build_data: BuildCreateRequest,
     current_user: User = Depends(get_current_active_user),
     build_service: BuildService = Depends(get_build_service),
+    session: AsyncSession = Depends(get_database_session),
 ) -> BuildResponse:
     """
     Create a new build configuration.
@@ -81,13 +105,6 @@ async def create_build(
     Build names must be unique across the system.
     """
     try:
-        existing_build = await build_service.get_build(build_data.name)
-        if existing_build:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Build '{build_data.name}' already exists",
-            )
-        
         build = Build(
             name=build_data.name,
             tasks=build_data.tasks,
@@ -95,7 +112,17 @@ async def create_build(
         )
         
         created_build = await build_service.create_build(build)
-        return BuildResponse.model_validate(created_build)
+        if created_build is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Build '{build_data.name}' already exists",
+            )
+        
+        # The session dependency commits only after the response is sent,
+        # so commit first or a concurrent read could re-cache the old rows
+        await session.commit()
+        await clear_response_cache(request, [BUILDS_CACHE_NAMESPACE])
+        return build_response(created_build)
         
     except HTTPException:
         raise
@@ -117,7 +144,9 @@ async def create_build(
         401: {"description": "Authentication required"},
     },
 )
+@cache_response(ttl=60, namespace=BUILDS_CACHE_NAMESPACE)
 async def get_build(
+    request: Request,
     build_name: str,
     current_user: User = Depends(get_current_active_user),
     build_service: BuildService = Depends(get_build_service),
@@ -136,7 +165,7 @@ async def get_build(
                 detail=f"Build '{build_name}' not found",
             )
         
-        return BuildResponse.model_validate(build)
+        return build_response(build)
         
     except HTTPException:
         raise
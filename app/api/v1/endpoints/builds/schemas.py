@@ -1,41 +1,44 @@
 """Build management API schemas."""
 
-from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from app.core.domain.entities import Build
 from app.core.domain.enums import BuildStatus
 
 
 class BuildCreateRequest(BaseModel):
     """Build creation request schema."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        str_strip_whitespace=True,
+        json_schema_extra={
+            "example": {
+                "name": "frontend_build",
+                "tasks": ["compile_core", "compile_ui", "run_tests"],
+            },
+        },
+    )
     
     name: str = Field(
         ...,
         min_length=1,
         max_length=100,
-        description="Build name (must be unique)",
-        example="frontend_build"
+        description="Build name (must be unique)"
     )
-    tasks: List[str] = Field(
+    tasks: list[str] = Field(
         ...,
-        min_items=1,
-        description="List of task names included in this build",
-        example=["compile_core", "compile_ui", "run_tests"]
+        min_length=1,
+        description="List of task names included in this build"
     )
 
-    @field_validator('name')
-    def validate_name(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Build name cannot be empty')
-        return v.strip()
-
-    @field_validator('tasks')
+    @field_validator('tasks', mode='after')
     def validate_tasks(cls, v):
-        if not v:
-            raise ValueError('Build must contain at least one task')
-        # Remove duplicates and empty strings
-        clean_tasks = [task.strip() for task in v if task and task.strip()]
+        # Names are already stripped by the model config, drop empty ones
+        # and duplicates while keeping the original order
+        clean_tasks = list(dict.fromkeys(task for task in v if task))
         if not clean_tasks:
             raise ValueError('Build must contain at least one valid task')
         return clean_tasks
@@ -43,124 +46,183 @@ class BuildCreateRequest(BaseModel):
 
 class BuildUpdateRequest(BaseModel):
     """Build update request schema."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        str_strip_whitespace=True,
+        json_schema_extra={
+            "example": {
+                "tasks": ["compile_core", "compile_ui", "run_tests", "package"],
+                "status": "running",
+            },
+        },
+    )
     
-    tasks: Optional[List[str]] = Field(
+    tasks: list[str] | None = Field(
         None,
-        description="Updated list of task names",
-        example=["compile_core", "compile_ui", "run_tests", "package"]
+        min_length=1,
+        description="Updated list of task names"
     )
-    status: Optional[BuildStatus] = Field(
+    status: BuildStatus | None = Field(
         None,
-        description="Updated build status",
-        example="running"
+        description="Updated build status"
     )
 
-    @field_validator('tasks')
+    @field_validator('tasks', mode='after')
     def validate_tasks(cls, v):
         if v is not None:
-            if not v:
-                raise ValueError('Build must contain at least one task')
-            return [task.strip() for task in v if task and task.strip()]
+            return [task for task in v if task]
         return v
 
 
 class BuildResponse(BaseModel):
     """Build response schema."""
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "name": "frontend_build",
+                "tasks": ["compile_core", "compile_ui", "run_tests"],
+                "status": "pending",
+                "created_at": "2023-01-01T12:00:00Z",
+                "updated_at": "2023-01-01T12:00:00Z",
+                "error_message": "Task 'compile_ui' failed: syntax error",
+            },
+        },
+    )
     
     name: str = Field(
         ...,
-        description="Build name",
-        example="frontend_build"
+        description="Build name"
     )
-    tasks: List[str] = Field(
+    tasks: list[str] = Field(
         ...,
-        description="List of task names in this build",
-        example=["compile_core", "compile_ui", "run_tests"]
+        description="List of task names in this build"
     )
     status: str = Field(
         ...,
-        description="Current build status",
-        example="pending"
+        description="Current build status"
     )
-    created_at: Optional[datetime] = Field(
+    created_at: datetime | None = Field(
         None,
-        description="Build creation timestamp",
-        example="2023-01-01T12:00:00Z"
+        description="Build creation timestamp"
     )
-    updated_at: Optional[datetime] = Field(
+    updated_at: datetime | None = Field(
         None,
-        description="Last build update timestamp",
-        example="2023-01-01T12:00:00Z"
+        description="Last build update timestamp"
     )
-    error_message: Optional[str] = Field(
+    error_message: str | None = Field(
         None,
-        description="Error details if build failed",
-        example="Task 'compile_ui' failed: syntax error"
+        description="Error details if build failed"
     )
 
-    class Config:
-        from_attributes = True
+
+def build_response(build: Build) -> BuildResponse:
+    """
+    Build response from a trusted build entity without validation.
+
+    Args:
+        build: Build entity loaded from the database
+
+    Returns:
+        BuildResponse: Response schema instance
+    """
+    return BuildResponse.model_construct(
+        name=build.name,
+        tasks=build.tasks,
+        status=build.status.value,
+        created_at=build.created_at,
+        updated_at=build.updated_at,
+        error_message=build.error_message,
+    )
 
 
 class BuildListResponse(BaseModel):
     """Build list response schema."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "example": {"total": 5},
+        },
+    )
     
-    builds: List[BuildResponse] = Field(
+    builds: list[BuildResponse] = Field(
         ...,
         description="List of builds",
     )
     total: int = Field(
         ...,
-        description="Total number of builds",
-        example=5
+        description="Total number of builds"
     )
 
 
 class BuildExecutionRequest(BaseModel):
     """Build execution request schema."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        str_strip_whitespace=True,
+        json_schema_extra={
+            "example": {"async_execution": True, "force_restart": False},
+        },
+    )
     
     async_execution: bool = Field(
         default=True,
-        description="Whether to execute build asynchronously",
-        example=True
+        description="Whether to execute build asynchronously"
     )
     force_restart: bool = Field(
         default=False,
-        description="Force restart if build is already running",
-        example=False
+        description="Force restart if build is already running"
     )
 
 
 class BuildExecutionResponse(BaseModel):
     """Build execution response schema."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "build_name": "frontend_build",
+                "execution_id": "exec_build_12345",
+                "status": "running",
+                "started_at": "2023-01-01T12:00:00Z",
+                "estimated_duration": 300,
+                "async_execution": True,
+            },
+        },
+    )
     
     build_name: str = Field(
         ...,
-        description="Name of the executed build",
-        example="frontend_build"
+        description="Name of the executed build"
     )
     execution_id: str = Field(
         ...,
-        description="Unique execution identifier",
-        example="exec_build_12345"
+        description="Unique execution identifier"
     )
     status: str = Field(
         ...,
-        description="Current execution status",
-        example="running"
+        description="Current execution status"
     )
     started_at: datetime = Field(
         ...,
-        description="Execution start timestamp",
-        example="2023-01-01T12:00:00Z"
+        description="Execution start timestamp"
     )
-    estimated_duration: Optional[int] = Field(
+    estimated_duration: int | None = Field(
         None,
-        description="Estimated execution time in seconds",
-        example=300
+        description="Estimated execution time in seconds"
     )
     async_execution: bool = Field(
         ...,
-        description="Whether execution is asynchronous",
-        example=True
-    )
\ No newline at end of file
+        description="Whether execution is asynchronous"
+    )
@@ -1,14 +1,21 @@
 """Execute build endpoint routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, Depends, Response
 
 from app.api.dependencies import get_build_service
+from app.api.errors import handle_build_errors
 from app.core.services.build_service import BuildService
-from app.core.exceptions import BuildNotFoundException, CircularDependencyException
 from .schemas import ExecuteBuildRequest, ExecuteBuildResponse
 
 router = APIRouter()
 
+# Only the build name varies in the response, other fields are constant
+_EXECUTE_BUILD_BODY_TEMPLATE = (
+    b'{"build_name":%s,"status":"running",'
+    b'"message":"Build execution started successfully"}'
+)
+
 
 @router.post(
     "/execute_build",
@@ -33,10 +40,11 @@ router = APIRouter()
         500: {"description": "Internal server error"},
     },
 )
+@handle_build_errors("Failed to execute build")
 async def execute_build(
     request: ExecuteBuildRequest,
     build_service: BuildService = Depends(get_build_service),
-) -> ExecuteBuildResponse:
+) -> Response:
     """
     Execute a build with topological task ordering.
     
@@ -50,38 +58,17 @@ async def execute_build(
         build_service: Build service dependency
         
     Returns:
-        ExecuteBuildResponse with build status
+        JSON body matching ExecuteBuildResponse
         
     Raises:
         HTTPException: If build not found or circular dependencies detected
     """
-    try:
-        # Validate build exists by checking if we can get tasks
-        await build_service.get_topological_sort(request.build)
-        
-        # Simplified implementation - just return success status
-        # In real system this would start async execution via Celery
-        return ExecuteBuildResponse(
-            build_name=request.build,
-            status="running",
-            message="Build execution started successfully"
-        )
-        
-    except BuildNotFoundException:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Build '{request.build}' not found",
-        )
-    except CircularDependencyException as e:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Circular dependency detected: {str(e)}",
-        )
-    except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.exception(f"Failed to execute build {request.build}: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to execute build",
-        )
\ No newline at end of file
+    # Validate build exists by checking if we can get tasks
+    await build_service.get_topological_sort(request.build)
+    
+    # Simplified implementation - just return success status
+    # In real system this would start async execution via Celery
+    return Response(
+        content=_EXECUTE_BUILD_BODY_TEMPLATE % orjson.dumps(request.build),
+        media_type="application/json",
+    )
@@ -1,43 +1,58 @@
 """Execute build endpoint schemas."""
 
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ExecuteBuildRequest(BaseModel):
     """Request schema for executing a build."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        str_strip_whitespace=True,
+        json_schema_extra={
+            "example": {"build": "frontend_build", "algorithm": "kahn"},
+        },
+    )
     
     build: str = Field(
         ...,
         min_length=1,
-        description="Name of the build to execute",
-        example="frontend_build"
+        description="Name of the build to execute"
     )
     
-    algorithm: Optional[str] = Field(
+    algorithm: str | None = Field(
         None,
-        description="Sorting algorithm to use (kahn or dfs)",
-        example="kahn"
+        description="Sorting algorithm to use (kahn or dfs)"
     )
 
 
 class ExecuteBuildResponse(BaseModel):
     """Response schema for build execution."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "build_name": "frontend_build",
+                "status": "running",
+                "message": "Build execution started successfully",
+            },
+        },
+    )
     
     build_name: str = Field(
         ...,
-        description="Name of the executed build",
-        example="frontend_build"
+        description="Name of the executed build"
     )
     
     status: str = Field(
         ...,
-        description="Current status of the build",
-        example="running"
+        description="Current status of the build"
     )
     
     message: str = Field(
         ...,
-        description="Status message",
-        example="Build execution started successfully"
+        description="Status message"
     )
\ No newline at end of file
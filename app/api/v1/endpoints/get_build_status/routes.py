@@ -1,10 +1,12 @@
 """Get build status endpoint routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime, timezone
+from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 
 from app.api.dependencies import get_build_service
+from app.api.errors import handle_build_errors
 from app.core.services.build_service import BuildService
-from app.core.exceptions import BuildNotFoundException
 from .schemas import GetBuildStatusRequest, BuildStatusResponse
 
 router = APIRouter()
@@ -34,10 +36,11 @@ router = APIRouter()
         500: {"description": "Internal server error"},
     },
 )
+@handle_build_errors("Failed to get build status")
 async def get_build_status(
     request: GetBuildStatusRequest,
     build_service: BuildService = Depends(get_build_service),
-) -> BuildStatusResponse:
+) -> ORJSONResponse:
     """
     Get current status of a build.
     
@@ -56,33 +59,18 @@ async def get_build_status(
     Raises:
         HTTPException: If build not found
     """
-    try:
-        # Validate build exists and get tasks
-        sorted_tasks = await build_service.get_topological_sort(request.build)
-        
-        # Simplified implementation - return mock status
-        # In real system this would query actual build/task status from DB
-        from datetime import datetime
-        task_statuses = {task: "pending" for task in sorted_tasks.tasks}
-        
-        return BuildStatusResponse(
-            build_name=request.build,
-            status="pending",
-            created_at=datetime.now(),
-            tasks=sorted_tasks.tasks,
-            task_statuses=task_statuses
-        )
-        
-    except BuildNotFoundException:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Build '{request.build}' not found",
-        )
-    except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.exception(f"Failed to get build status for {request.build}: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to get build status",
-        )
\ No newline at end of file
+    # Validate build exists and get tasks
+    sorted_tasks = await build_service.get_topological_sort(request.build)
+    
+    # Simplified implementation - return mock status
+    # In real system this would query actual build/task status from DB
+    task_statuses = dict.fromkeys(sorted_tasks.tasks, "pending")
+    
+    response = BuildStatusResponse.model_construct(
+        build_name=request.build,
+        status="pending",
+        created_at=datetime.now(timezone.utc),
+        tasks=sorted_tasks.tasks,
+        task_statuses=task_statuses
+    )
+    return ORJSONResponse(response.model_dump(mode="json"))
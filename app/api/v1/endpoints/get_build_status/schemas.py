@@ -1,50 +1,66 @@
 """Get build status endpoint schemas."""
 
-from pydantic import BaseModel, Field
-from typing import Dict, Optional
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 
 class GetBuildStatusRequest(BaseModel):
     """Request schema for getting build status."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        str_strip_whitespace=True,
+        json_schema_extra={
+            "example": {"build": "frontend_build"},
+        },
+    )
     
     build: str = Field(
         ...,
         min_length=1,
-        description="Name of the build to check status",
-        example="frontend_build"
+        description="Name of the build to check status"
     )
 
 
 class BuildStatusResponse(BaseModel):
     """Response schema for build status."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "build_name": "frontend_build",
+                "status": "completed",
+                "created_at": "2025-07-26T10:30:00Z",
+                "tasks": ["compile_exe", "pack_build"],
+                "task_statuses": {"compile_exe": "completed", "pack_build": "completed"},
+            },
+        },
+    )
     
     build_name: str = Field(
         ...,
-        description="Name of the build",
-        example="frontend_build"
+        description="Name of the build"
     )
     
     status: str = Field(
         ...,
-        description="Current status of the build",
-        example="completed"
+        description="Current status of the build"
     )
     
-    created_at: Optional[datetime] = Field(
+    created_at: datetime | None = Field(
         None,
-        description="When the build was created",
-        example="2025-07-26T10:30:00Z"
+        description="When the build was created"
     )
     
     tasks: list[str] = Field(
         ...,
-        description="List of tasks in the build",
-        example=["compile_exe", "pack_build"]
+        description="List of tasks in the build"
     )
     
-    task_statuses: Optional[Dict[str, str]] = Field(
+    task_statuses: dict[str, str] | None = Field(
         None,
-        description="Status of each task in the build",
-        example={"compile_exe": "completed", "pack_build": "completed"}
+        description="Status of each task in the build"
     )
\ No newline at end of file
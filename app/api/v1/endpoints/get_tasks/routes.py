@@ -1,11 +1,11 @@
 """Get tasks endpoint routes according to technical requirements."""
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 
 from app.api.dependencies import get_build_service
+from app.api.errors import handle_build_errors
 from app.core.services.build_service import BuildService
-from app.core.exceptions import BuildNotFoundException, CircularDependencyException
 from .schemas import GetTasksRequest
 
 router = APIRouter()
@@ -13,7 +13,8 @@ router = APIRouter()
 
 @router.post(
     "/get_tasks",
-    response_model=List[str],
+    response_model=None,
+    response_class=ORJSONResponse,
     summary="Get sorted tasks for a build",
     description="Returns a list of task names sorted according to their dependencies. This endpoint complies with the technical requirements.",
     responses={
@@ -30,10 +31,11 @@ router = APIRouter()
         500: {"description": "Internal server error"},
     },
 )
+@handle_build_errors("Failed to get tasks for build")
 async def get_tasks(
     request: GetTasksRequest,
     build_service: BuildService = Depends(get_build_service),
-) -> List[str]:
+) -> ORJSONResponse:
     """
     Get topologically sorted tasks for a build.
     
@@ -47,33 +49,13 @@ async def get_tasks(
         build_service: Build service dependency
         
     Returns:
-        List of task names in execution order
+        JSON array of task names in execution order
         
     Raises:
         HTTPException: If build not found or circular dependencies detected
     """
-    try:
-        # Get topological sort for the build
-        result = await build_service.get_topological_sort(request.build)
-        
-        # Return only the sorted task names as required by the spec
-        return result.tasks
-        
-    except BuildNotFoundException:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Build '{request.build}' not found",
-        )
-    except CircularDependencyException as e:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Circular dependency detected: {str(e)}",
-        )
-    except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.exception(f"Failed to get tasks for build {request.build}: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to get tasks for build",
-        )
\ No newline at end of file
+    # Get topological sort for the build
+    result = await build_service.get_topological_sort(request.build)
+    
+    # Return only the sorted task names as required by the spec
+    return ORJSONResponse(result.tasks)
@@ -1,7 +1,6 @@
 """Schemas for get_tasks endpoint."""
 
-from typing import List
-from pydantic import BaseModel, Field, RootModel
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class GetTasksRequest(BaseModel):
@@ -10,27 +9,17 @@ class GetTasksRequest(BaseModel):
     build: str = Field(
         ...,
         description="Name of the build to get tasks for",
-        min_length=1,
-        example="make_tests"
+        min_length=1
     )
     
-    model_config = {
-        "json_schema_extra": {
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        str_strip_whitespace=True,
+        json_schema_extra={
             "example": {
                 "build": "make_tests"
             }
-        }
-    }
-
+        },
+    )
 
-class GetTasksResponse(RootModel[List[str]]):
-    """Response schema for get_tasks endpoint - just a list of task names."""
-    
-    model_config = {
-        "json_schema_extra": {
-            "example": [
-                "compile_exe",
-                "pack_build"
-            ]
-        }
-    }
\ No newline at end of file
@@ -1,58 +1,67 @@
 """Log management API schemas."""
 
-from typing import Dict, Any
-from pydantic import BaseModel, Field
+from typing import Any
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class LogStatisticsResponse(BaseModel):
     """Log statistics response schema."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "task": "get_log_statistics",
+                "timestamp": "2023-01-01T12:00:00Z",
+                "logs_directory": "/app/logs",
+                "total_size_mb": 45.67,
+                "files_count": {
+                    "current_logs": 2,
+                    "rotated_logs": 5,
+                    "archives": 10,
+                    "total": 17,
+                },
+                "current_logs": {
+                    "saber.log": {
+                        "size_bytes": 8388608,
+                        "size_mb": 8.0,
+                        "modified": "2023-01-01T12:00:00",
+                    },
+                },
+            },
+        },
+    )
     
     task: str = Field(
         ...,
-        description="Task name",
-        example="get_log_statistics"
+        description="Task name"
     )
     timestamp: str = Field(
         ...,
-        description="Statistics collection timestamp",
-        example="2023-01-01T12:00:00Z"
+        description="Statistics collection timestamp"
     )
     logs_directory: str = Field(
         ...,
-        description="Path to logs directory",
-        example="/app/logs"
+        description="Path to logs directory"
     )
     total_size_mb: float = Field(
         ...,
-        description="Total size of all logs in MB",
-        example=45.67
+        description="Total size of all logs in MB"
     )
-    files_count: Dict[str, int] = Field(
+    files_count: dict[str, int] = Field(
         ...,
-        description="Count of different file types",
-        example={
-            "current_logs": 2,
-            "rotated_logs": 5,
-            "archives": 10,
-            "total": 17
-        }
+        description="Count of different file types"
     )
-    current_logs: Dict[str, Any] = Field(
+    current_logs: dict[str, Any] = Field(
         ...,
-        description="Current log files information",
-        example={
-            "saber.log": {
-                "size_bytes": 8388608,
-                "size_mb": 8.0,
-                "modified": "2023-01-01T12:00:00"
-            }
-        }
+        description="Current log files information"
     )
-    rotated_logs: Dict[str, Any] = Field(
+    rotated_logs: dict[str, Any] = Field(
         ...,
         description="Rotated log files information"
     )
-    archives: Dict[str, Any] = Field(
+    archives: dict[str, Any] = Field(
         ...,
         description="Archive files information"
     )
@@ -60,84 +69,102 @@ class LogStatisticsResponse(BaseModel):
 
 class LogArchiveResponse(BaseModel):
     """Log archiving response schema."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "task": "archive_old_logs",
+                "timestamp": "2023-01-01T12:00:00Z",
+                "task_id": "a1b2c3d4-e5f6-7890-abcd-ef1234567890",
+                "status": "started",
+                "message": "Log archiving task started successfully",
+                "archives_created": 0,
+                "total_size_archived_mb": 0.0,
+            },
+        },
+    )
     
     task: str = Field(
         ...,
-        description="Task name",
-        example="archive_old_logs"
+        description="Task name"
     )
     timestamp: str = Field(
         ...,
-        description="Task execution timestamp",
-        example="2023-01-01T12:00:00Z"
+        description="Task execution timestamp"
     )
     task_id: str = Field(
         ...,
-        description="Celery task ID for tracking",
-        example="a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+        description="Celery task ID for tracking"
     )
     status: str = Field(
         ...,
-        description="Task execution status",
-        example="started"
+        description="Task execution status"
     )
     message: str = Field(
         ...,
-        description="Status message",
-        example="Log archiving task started successfully"
+        description="Status message"
     )
     archives_created: int = Field(
         ...,
-        description="Number of files archived (0 when started)",
-        example=0
+        description="Number of files archived (0 when started)"
     )
     total_size_archived_mb: float = Field(
         ...,
-        description="Total size archived in MB (0.0 when started)",
-        example=0.0
+        description="Total size archived in MB (0.0 when started)"
     )
 
 
 class LogCleanupResponse(BaseModel):
     """Log cleanup response schema."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "task": "cleanup_old_archives",
+                "timestamp": "2023-01-01T12:00:00Z",
+                "task_id": "a1b2c3d4-e5f6-7890-abcd-ef1234567890",
+                "status": "started",
+                "message": "Archive cleanup task started successfully",
+                "retention_days": 7,
+                "archives_cleaned": 0,
+                "space_freed_mb": 0.0,
+            },
+        },
+    )
     
     task: str = Field(
         ...,
-        description="Task name",
-        example="cleanup_old_archives"
+        description="Task name"
     )
     timestamp: str = Field(
         ...,
-        description="Task execution timestamp",
-        example="2023-01-01T12:00:00Z"
+        description="Task execution timestamp"
     )
     task_id: str = Field(
         ...,
-        description="Celery task ID for tracking",
-        example="a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+        description="Celery task ID for tracking"
     )
     status: str = Field(
         ...,
-        description="Task execution status",
-        example="started"
+        description="Task execution status"
     )
     message: str = Field(
         ...,
-        description="Status message",
-        example="Archive cleanup task started successfully"
+        description="Status message"
     )
     retention_days: int = Field(
         ...,
-        description="Archive retention period in days",
-        example=7
+        description="Archive retention period in days"
     )
     archives_cleaned: int = Field(
         ...,
-        description="Number of archives cleaned (0 when started)",
-        example=0
+        description="Number of archives cleaned (0 when started)"
     )
     space_freed_mb: float = Field(
         ...,
-        description="Space freed in MB (0.0 when started)",
-        example=0.0
+        description="Space freed in MB (0.0 when started)"
     )
\ No newline at end of file
@@ -1,15 +1,62 @@
 """Health check API routes."""
 
-from datetime import datetime
-from fastapi import APIRouter, Depends, status
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from fastapi import APIRouter, Depends, Response, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_database_session
 from .schemas import HealthResponse, DetailedHealthResponse, ReadinessResponse, LivenessResponse  
 from app.infrastructure.cache.redis_client import get_redis_client
+from app.utils.timestamps import utc_now_iso
 
 router = APIRouter(prefix="/health", tags=["Health Check"])
 
+_SELECT_1 = text("SELECT 1")
+
+# Readiness results are reused for a short window so probe bursts coalesce
+_READINESS_CHECK_TTL = 0.25
+_readiness_results: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+# Pre-encoded probe bodies, only the timestamp is substituted per request
+_BASIC_HEALTH_BODY_TEMPLATE = b'{"status":"healthy","timestamp":"%s"}'
+_LIVE_BODY_TEMPLATE = b'{"alive":true,"timestamp":"%s"}'
+
+
+async def _readiness_check(
+    name: str,
+    check: Callable[[], Awaitable[Any]],
+) -> Dict[str, Any]:
+    """
+    Run dependency readiness check with a short-lived result cache.
+
+    Args:
+        name: Dependency name used as cache key
+        check: Callable performing one round-trip to the dependency
+
+    Returns:
+        Check result with status and latency or error
+    """
+    now = time.monotonic()
+    cached = _readiness_results.get(name)
+    if cached is not None and now - cached[0] < _READINESS_CHECK_TTL:
+        return cached[1]
+
+    try:
+        start_time = time.perf_counter()
+        await check()
+        latency = (time.perf_counter() - start_time) * 1000
+        result = {"status": "ready", "latency_ms": round(latency, 2)}
+    except Exception as e:
+        result = {"status": "not_ready", "error": str(e)}
+
+    _readiness_results[name] = (now, result)
+    return result
+
 
 @router.get(
     "/",
@@ -21,16 +68,16 @@ router = APIRouter(prefix="/health", tags=["Health Check"])
         503: {"description": "Service is unhealthy"},
     },
 )
-async def basic_health_check() -> HealthResponse:
+async def basic_health_check() -> Response:
     """
     Basic health check endpoint.
     
     Returns minimal health status information without dependency checks.
     Useful for load balancer health checks.
     """
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.utcnow().isoformat() + "Z",
+    return Response(
+        content=_BASIC_HEALTH_BODY_TEMPLATE % utc_now_iso().encode(),
+        media_type="application/json",
     )
 
 
@@ -46,7 +93,7 @@ async def basic_health_check() -> HealthResponse:
 )
 async def detailed_health_check(
     session: AsyncSession = Depends(get_database_session),
-) -> DetailedHealthResponse:
+) -> ORJSONResponse:
     """
     Perform detailed health check of the application and its dependencies.
     
@@ -57,36 +104,34 @@ async def detailed_health_check(
     
     Returns overall health status and individual service statuses.
     """
-    services = {}
-    overall_status = "healthy"
-    
-    try:
-        from sqlalchemy import text
-        await session.execute(text("SELECT 1"))
-        services["database"] = "healthy"
-    except Exception:
-        services["database"] = "unhealthy"
-        overall_status = "unhealthy"
-    
-    try:
-        redis_client = get_redis_client()
-        redis_healthy = await redis_client.ping()
-        services["redis"] = "healthy" if redis_healthy else "unhealthy"
-        if not redis_healthy:
-            overall_status = "unhealthy"
-    except Exception:
-        services["redis"] = "unhealthy"
-        overall_status = "unhealthy"
-    
+    async def check_database() -> bool:
+        await session.execute(_SELECT_1)
+        return True
+
+    async def check_redis() -> bool:
+        return bool(await get_redis_client().ping())
+
+    # Database and Redis are independent, check them concurrently
+    database_healthy, redis_healthy = await asyncio.gather(
+        check_database(), check_redis(), return_exceptions=True
+    )
+    services = {
+        "database": "healthy" if database_healthy is True else "unhealthy",
+        "redis": "healthy" if redis_healthy is True else "unhealthy",
+    }
+    overall_status = (
+        "healthy" if all(v == "healthy" for v in services.values()) else "unhealthy"
+    )
     services["celery"] = "not_configured"
     
-    return DetailedHealthResponse(
+    response = DetailedHealthResponse.model_construct(
         status=overall_status,
         version="1.0.0",
-        timestamp=datetime.utcnow().isoformat() + "Z",
+        timestamp=utc_now_iso(),
         services=services,
         uptime="unknown",
     )
+    return ORJSONResponse(response.model_dump(mode="json"))
 
 
 @router.get(
@@ -101,42 +146,26 @@ async def detailed_health_check(
 )
 async def readiness_check(
     session: AsyncSession = Depends(get_database_session),
-) -> ReadinessResponse:
+) -> ORJSONResponse:
     """
     Readiness probe for Kubernetes deployments.
     
     Checks if the application is ready to accept traffic by verifying
     that all critical dependencies are available and responsive.
     """
-    checks = {}
-    ready = True
-    
-    try:
-        from sqlalchemy import text
-        import time
-        start_time = time.perf_counter()
-        await session.execute(text("SELECT 1"))
-        latency = (time.perf_counter() - start_time) * 1000
-        checks["database"] = {"status": "ready", "latency_ms": round(latency, 2)}
-    except Exception as e:
-        checks["database"] = {"status": "not_ready", "error": str(e)}
-        ready = False
-    
-    try:
-        redis_client = get_redis_client()
-        import time
-        start_time = time.perf_counter()
-        await redis_client.ping()
-        latency = (time.perf_counter() - start_time) * 1000
-        checks["redis"] = {"status": "ready", "latency_ms": round(latency, 2)}
-    except Exception as e:
-        checks["redis"] = {"status": "not_ready", "error": str(e)}
-        ready = False
+    # Database and Redis are independent, check them concurrently
+    database_check, redis_check = await asyncio.gather(
+        _readiness_check("database", lambda: session.execute(_SELECT_1)),
+        _readiness_check("redis", lambda: get_redis_client().ping()),
+    )
+    checks = {"database": database_check, "redis": redis_check}
+    ready = all(check["status"] == "ready" for check in checks.values())
     
-    return ReadinessResponse(
+    response = ReadinessResponse.model_construct(
         ready=ready,
         checks=checks,
     )
+    return ORJSONResponse(response.model_dump(mode="json"))
 
 
 @router.get(
@@ -148,16 +177,16 @@ async def readiness_check(
         200: {"description": "Service is alive"},
     },
 )
-async def liveness_check() -> LivenessResponse:
+async def liveness_check() -> Response:
     """
     Liveness probe for Kubernetes deployments.
     
     Simple endpoint that indicates the application process is alive
     and responsive. Does not check dependencies.
     """
-    return LivenessResponse(
-        alive=True,
-        timestamp=datetime.utcnow().isoformat() + "Z",
+    return Response(
+        content=_LIVE_BODY_TEMPLATE % utc_now_iso().encode(),
+        media_type="application/json",
     )
 
 
@@ -1,86 +1,116 @@
 """Health check API schemas."""
 
-from typing import Dict, Any
-from pydantic import BaseModel, Field
+from typing import Any
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class HealthResponse(BaseModel):
     """Basic health check response schema."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "example": {"status": "healthy", "timestamp": "2023-01-01T12:00:00Z"},
+        },
+    )
     
     status: str = Field(
         ...,
-        description="Service health status",
-        example="healthy"
+        description="Service health status"
     )
     timestamp: str = Field(
         ...,
-        description="Response timestamp",
-        example="2023-01-01T12:00:00Z"
+        description="Response timestamp"
     )
 
 
 class DetailedHealthResponse(BaseModel):
     """Detailed health check response schema."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "status": "healthy",
+                "timestamp": "2023-01-01T12:00:00Z",
+                "services": {
+                    "database": "healthy",
+                    "redis": "healthy",
+                    "external_api": "degraded",
+                },
+                "version": "1.0.0",
+                "uptime": "2 days, 14:30:15",
+            },
+        },
+    )
     
     status: str = Field(
         ...,
-        description="Overall service health status",
-        example="healthy"
+        description="Overall service health status"
     )
     timestamp: str = Field(
         ...,
-        description="Response timestamp",
-        example="2023-01-01T12:00:00Z"
+        description="Response timestamp"
     )
-    services: Dict[str, str] = Field(
+    services: dict[str, str] = Field(
         ...,
-        description="Status of individual services",
-        example={
-            "database": "healthy",
-            "redis": "healthy",
-            "external_api": "degraded"
-        }
+        description="Status of individual services"
     )
     version: str = Field(
         ...,
-        description="Application version",
-        example="1.0.0"
+        description="Application version"
     )
     uptime: str = Field(
         ...,
-        description="Service uptime",
-        example="2 days, 14:30:15"
+        description="Service uptime"
     )
 
 
 class ReadinessResponse(BaseModel):
     """Readiness check response schema."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "ready": True,
+                "checks": {
+                    "database": {"status": "ready", "latency_ms": 5.2},
+                    "redis": {"status": "ready", "latency_ms": 1.1},
+                },
+            },
+        },
+    )
     
     ready: bool = Field(
         ...,
-        description="Whether service is ready to accept requests",
-        example=True
+        description="Whether service is ready to accept requests"
     )
-    checks: Dict[str, Any] = Field(
+    checks: dict[str, Any] = Field(
         ...,
-        description="Individual readiness checks",
-        example={
-            "database": {"status": "ready", "latency_ms": 5.2},
-            "redis": {"status": "ready", "latency_ms": 1.1}
-        }
+        description="Individual readiness checks"
     )
 
 
 class LivenessResponse(BaseModel):
     """Liveness check response schema."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "example": {"alive": True, "timestamp": "2023-01-01T12:00:00Z"},
+        },
+    )
     
     alive: bool = Field(
         ...,
-        description="Whether service is alive",
-        example=True
+        description="Whether service is alive"
     )
     timestamp: str = Field(
         ...,
-        description="Response timestamp",
-        example="2023-01-01T12:00:00Z"
+        description="Response timestamp"
     )
\ No newline at end of file
@@ -1,19 +1,23 @@
 """Log management API routes."""
 
-from datetime import datetime
-from fastapi import APIRouter, Depends
+import asyncio
+from fastapi import APIRouter, Depends, Request
 
+from app.api.cache import cache_response
 from app.api.dependencies import get_current_active_user
 from .schemas import LogStatisticsResponse, LogArchiveResponse, LogCleanupResponse
 from app.infrastructure.tasks.log_management import (
-    get_log_statistics,
+    collect_log_statistics,
     archive_old_logs,
     cleanup_old_archives
 )
 from app.core.auth.entities import User
+from app.utils.timestamps import utc_now_iso
 
 router = APIRouter(prefix="/logs", tags=["Log Management"])
 
+LOGS_CACHE_NAMESPACE = "saber:logs"
+
 
 @router.get(
     "/statistics",
@@ -25,7 +29,9 @@ router = APIRouter(prefix="/logs", tags=["Log Management"])
         401: {"description": "Authentication required"},
     },
 )
+@cache_response(ttl=30, namespace=LOGS_CACHE_NAMESPACE)
 async def get_log_file_statistics(
+    request: Request,
     current_user: User = Depends(get_current_active_user),
 ) -> LogStatisticsResponse:
     """
@@ -34,9 +40,9 @@ async def get_log_file_statistics(
     Returns information about current logs, rotated logs, and archives
     including file sizes and modification dates.
     """
-    # Execute Celery task synchronously for immediate response
-    result = get_log_statistics.apply()
-    return LogStatisticsResponse(**result.result)
+    # Scan log files in a worker thread to keep the event loop free
+    stats = await asyncio.to_thread(collect_log_statistics)
+    return LogStatisticsResponse(**stats)
 
 
 @router.post(
@@ -58,13 +64,13 @@ async def trigger_log_archiving(
     Compresses and archives rotated log files older than 1 day.
     This operation is normally performed automatically daily at 2 AM.
     """
-    # Execute Celery task asynchronously
-    task = archive_old_logs.delay()
+    # Publish Celery task from a worker thread, broker I/O is blocking
+    task = await asyncio.to_thread(archive_old_logs.delay)
     
     # Return immediately with task info
     return LogArchiveResponse(
         task="archive_old_logs",
-        timestamp=datetime.utcnow().isoformat() + "Z",
+        timestamp=utc_now_iso(),
         task_id=task.id,
         status="started",
         message="Log archiving task started successfully",
@@ -96,13 +102,13 @@ async def trigger_archive_cleanup(
     Args:
         retention_days: Number of days to keep archives before cleanup (default: 7)
     """
-    # Execute Celery task asynchronously
-    task = cleanup_old_archives.delay(retention_days=retention_days)
+    # Publish Celery task from a worker thread, broker I/O is blocking
+    task = await asyncio.to_thread(cleanup_old_archives.delay, retention_days=retention_days)
     
     # Return immediately with task info
     return LogCleanupResponse(
         task="cleanup_old_archives",
-        timestamp=datetime.utcnow().isoformat() + "Z",
+        timestamp=utc_now_iso(),
         task_id=task.id,
         status="started",
         message="Archive cleanup task started successfully",
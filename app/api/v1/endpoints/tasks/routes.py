@@ -1,13 +1,21 @@
 """Task management API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_build_service, get_current_active_user
+from app.api.cache import cache_response, clear_response_cache
+from app.api.dependencies import (
+    get_build_service,
+    get_current_active_user,
+    get_database_session,
+)
+from app.api.v1.endpoints.topology.routes import TOPOLOGY_CACHE_NAMESPACE
 from .schemas import (
     TaskCreateRequest,
     TaskUpdateRequest,
     TaskResponse,
     TaskListResponse,
+    task_response,
 )
 from app.core.auth.entities import User
 from app.core.domain.entities import Task
@@ -16,6 +24,8 @@ from app.core.services.build_service import BuildService
 
 router = APIRouter(prefix="/tasks", tags=["Task Management"])
 
+TASKS_CACHE_NAMESPACE = "saber:tasks"
+
 
 @router.get(
     "/",
@@ -27,7 +37,9 @@ router = APIRouter(prefix="/tasks", tags=["Task Management"])
         401: {"description": "Authentication required"},
     },
 )
+@cache_response(ttl=30, namespace=TASKS_CACHE_NAMESPACE)
 async def list_tasks(
+    request: Request,
     limit: int = Query(50, ge=1, le=100, description="Maximum number of tasks to return"),
     offset: int = Query(0, ge=0, description="Number of tasks to skip"),
     current_user: User = Depends(get_current_active_user),
@@ -40,14 +52,10 @@ async def list_tasks(
     Tasks include their dependencies and current status.
     """
     try:
-        all_tasks = await build_service._task_repository.get_all_tasks()
-        tasks_list = list(all_tasks.values())
-        
-        total_count = len(tasks_list)
-        paginated_tasks = tasks_list[offset:offset + limit]
+        tasks, total_count = await build_service._task_repository.paginate_tasks(limit, offset)
         
-        return TaskListResponse(
-            tasks=[TaskResponse.model_validate(task) for task in paginated_tasks],
+        return TaskListResponse.model_construct(
+            tasks=[task_response(task) for task in tasks],
             total=total_count,
         )
     except Exception as e:
@@ -71,9 +79,11 @@ async def list_tasks(
     },
 )
 async def create_task(
+    request: Request,
     task_data: TaskCreateRequest,
     current_user: User = Depends(get_current_active_user),
     build_service: BuildService = Depends(get_build_service),
+    session: AsyncSession = Depends(get_database_session),
 ) -> TaskResponse:
     """
     Create a new task.
@@ -82,21 +92,25 @@ async def create_task(
     Task names must be unique across the system.
     """
     try:
-        existing_task = await build_service._task_repository.get_task(task_data.name)
-        if existing_task:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Task '{task_data.name}' already exists",
-            )
-        
         task = Task(
             name=task_data.name,
             dependencies=set(task_data.dependencies),
             status=TaskStatus.PENDING,
         )
         
-        created_task = await build_service._task_repository.save_task(task)
-        return TaskResponse.model_validate(created_task)
+        created_task = await build_service._task_repository.create_task(task)
+        if created_task is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Task '{task_data.name}' already exists",
+            )
+        
+        # The session dependency commits only after the response is sent,
+        # so commit first or a concurrent read could re-cache the old rows
+        await session.commit()
+        await build_service.invalidate_task_cache(created_task.name)
+        await clear_response_cache(request, [TASKS_CACHE_NAMESPACE, TOPOLOGY_CACHE_NAMESPACE])
+        return task_response(created_task)
         
     except HTTPException:
         raise
@@ -118,7 +132,9 @@ async def create_task(
         401: {"description": "Authentication required"},
     },
 )
+@cache_response(ttl=60, namespace=TASKS_CACHE_NAMESPACE)
 async def get_task(
+    request: Request,
     task_name: str,
     current_user: User = Depends(get_current_active_user),
     build_service: BuildService = Depends(get_build_service),
@@ -137,7 +153,7 @@ async def get_task(
                 detail=f"Task '{task_name}' not found",
             )
         
-        return TaskResponse.model_validate(task)
+        return task_response(task)
         
     except HTTPException:
         raise
@@ -161,10 +177,12 @@ async def get_task(
     },
 )
 async def update_task(
+    request: Request,
     task_name: str,
     task_update: TaskUpdateRequest,
     current_user: User = Depends(get_current_active_user),
     build_service: BuildService = Depends(get_build_service),
+    session: AsyncSession = Depends(get_database_session),
 ) -> TaskResponse:
     """
     Update an existing task.
@@ -173,23 +191,25 @@ async def update_task(
     Task name cannot be changed.
     """
     try:
-        existing_task = await build_service._task_repository.get_task(task_name)
-        if not existing_task:
+        dependencies = None
+        if task_update.dependencies is not None:
+            dependencies = set(task_update.dependencies)
+        
+        saved_task = await build_service._task_repository.patch_task(
+            task_name,
+            dependencies=dependencies,
+            status=task_update.status,
+        )
+        if not saved_task:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Task '{task_name}' not found",
             )
         
-        updated_task = Task(
-            name=existing_task.name,
-            dependencies=set(task_update.dependencies) if task_update.dependencies is not None else existing_task.dependencies,
-            status=task_update.status if task_update.status is not None else existing_task.status,
-            created_at=existing_task.created_at,
-            error_message=existing_task.error_message,
-        )
-        
-        saved_task = await build_service._task_repository.save_task(updated_task)
-        return TaskResponse.model_validate(saved_task)
+        await session.commit()
+        await build_service.invalidate_task_cache(task_name)
+        await clear_response_cache(request, [TASKS_CACHE_NAMESPACE, TOPOLOGY_CACHE_NAMESPACE])
+        return task_response(saved_task)
         
     except HTTPException:
         raise
@@ -212,9 +232,11 @@ async def update_task(
     },
 )
 async def delete_task(
+    request: Request,
     task_name: str,
     current_user: User = Depends(get_current_active_user),
     build_service: BuildService = Depends(get_build_service),
+    session: AsyncSession = Depends(get_database_session),
 ) -> dict:
     """
     Delete a task from the system.
@@ -236,6 +258,9 @@ async def delete_task(
                 detail="Failed to delete task",
             )
         
+        await session.commit()
+        await build_service.invalidate_task_cache(task_name)
+        await clear_response_cache(request, [TASKS_CACHE_NAMESPACE, TOPOLOGY_CACHE_NAMESPACE])
         return {"message": f"Task '{task_name}' deleted successfully"}
         
     except HTTPException:
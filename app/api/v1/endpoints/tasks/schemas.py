@@ -2,25 +2,36 @@
 
 from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from app.core.domain.entities import Task
 from app.core.domain.enums import TaskStatus
 
 
 class TaskCreateRequest(BaseModel):
     """Task creation request schema."""
     
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        str_strip_whitespace=True,
+        json_schema_extra={
+            "example": {
+                "name": "compile_frontend",
+                "dependencies": ["setup_environment", "install_dependencies"],
+            },
+        },
+    )
+
     name: str = Field(
         ...,
         min_length=1,
         max_length=100,
-        description="Task name (must be unique)",
-        example="compile_frontend"
+        description="Task name (must be unique)"
     )
     dependencies: List[str] = Field(
         default_factory=list,
-        description="List of task names this task depends on",
-        example=["setup_environment", "install_dependencies"]
+        description="List of task names this task depends on"
     )
 
     @field_validator('name')
@@ -29,125 +40,189 @@ class TaskCreateRequest(BaseModel):
             raise ValueError('Task name cannot be empty')
         return v.strip()
 
-    @field_validator('dependencies')
+    @field_validator('dependencies', mode='after')
     def validate_dependencies(cls, v):
-        # Remove duplicates and empty strings
-        return [dep.strip() for dep in v if dep and dep.strip()]
+        # Names are already stripped by the model config, drop empty ones
+        # and duplicates while keeping the original order
+        return list(dict.fromkeys(dep for dep in v if dep))
+
+    @model_validator(mode='after')
+    def validate_no_self_dependency(self):
+        if self.name in self.dependencies:
+            raise ValueError('Task cannot depend on itself')
+        return self
 
 
 class TaskUpdateRequest(BaseModel):
     """Task update request schema."""
     
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        str_strip_whitespace=True,
+        json_schema_extra={
+            "example": {"dependencies": ["setup_environment"], "status": "completed"},
+        },
+    )
+
     dependencies: Optional[List[str]] = Field(
         None,
-        description="Updated list of task dependencies",
-        example=["setup_environment"]
+        description="Updated list of task dependencies"
     )
     status: Optional[TaskStatus] = Field(
         None,
-        description="Updated task status",
-        example="completed"
+        description="Updated task status"
     )
 
-    @field_validator('dependencies')
+    @field_validator('dependencies', mode='after')
     def validate_dependencies(cls, v):
         if v is not None:
-            return [dep.strip() for dep in v if dep and dep.strip()]
+            return list(dict.fromkeys(dep for dep in v if dep))
         return v
 
 
 class TaskResponse(BaseModel):
     """Task response schema."""
     
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "name": "compile_frontend",
+                "dependencies": ["setup_environment", "install_dependencies"],
+                "status": "pending",
+                "created_at": "2023-01-01T12:00:00Z",
+                "updated_at": "2023-01-01T12:00:00Z",
+                "error_message": "Compilation failed: missing dependency",
+            },
+        },
+    )
+
     name: str = Field(
         ...,
-        description="Task name",
-        example="compile_frontend"
+        description="Task name"
     )
     dependencies: List[str] = Field(
         ...,
-        description="List of task dependencies",
-        example=["setup_environment", "install_dependencies"]
+        description="List of task dependencies"
     )
     status: str = Field(
         ...,
-        description="Current task status",
-        example="pending"
+        description="Current task status"
     )
     created_at: Optional[datetime] = Field(
         None,
-        description="Task creation timestamp",
-        example="2023-01-01T12:00:00Z"
+        description="Task creation timestamp"
     )
     updated_at: Optional[datetime] = Field(
         None,
-        description="Last task update timestamp", 
-        example="2023-01-01T12:00:00Z"
+        description="Last task update timestamp"
     )
     error_message: Optional[str] = Field(
         None,
-        description="Error details if task failed",
-        example="Compilation failed: missing dependency"
+        description="Error details if task failed"
     )
 
-    class Config:
-        from_attributes = True
+
+def task_response(task: Task) -> TaskResponse:
+    """
+    Build response from a trusted task entity without validation.
+
+    Args:
+        task: Task entity loaded from the database
+
+    Returns:
+        TaskResponse: Response schema instance
+    """
+    return TaskResponse.model_construct(
+        name=task.name,
+        dependencies=list(task.dependencies),
+        status=task.status.value,
+        created_at=task.created_at,
+        updated_at=task.updated_at,
+        error_message=task.error_message,
+    )
 
 
 class TaskListResponse(BaseModel):
     """Task list response schema."""
     
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "example": {"total": 10},
+        },
+    )
+
     tasks: List[TaskResponse] = Field(
         ...,
         description="List of tasks",
     )
     total: int = Field(
         ...,
-        description="Total number of tasks",
-        example=10
+        description="Total number of tasks"
     )
 
 
 class TaskExecutionRequest(BaseModel):
     """Task execution request schema."""
     
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        str_strip_whitespace=True,
+        json_schema_extra={
+            "example": {"async_execution": True, "force_restart": False},
+        },
+    )
+
     async_execution: bool = Field(
         default=True,
-        description="Whether to execute task asynchronously",
-        example=True
+        description="Whether to execute task asynchronously"
     )
     force_restart: bool = Field(
         default=False,
-        description="Force restart if task is already running",
-        example=False
+        description="Force restart if task is already running"
     )
 
 
 class TaskExecutionResponse(BaseModel):
     """Task execution response schema."""
     
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "task_name": "compile_frontend",
+                "execution_id": "exec_12345",
+                "status": "running",
+                "started_at": "2023-01-01T12:00:00Z",
+                "async_execution": True,
+            },
+        },
+    )
+
     task_name: str = Field(
         ...,
-        description="Name of the executed task",
-        example="compile_frontend"
+        description="Name of the executed task"
     )
     execution_id: str = Field(
         ...,
-        description="Unique execution identifier",
-        example="exec_12345"
+        description="Unique execution identifier"
     )
     status: str = Field(
         ...,
-        description="Current execution status",
-        example="running"
+        description="Current execution status"
     )
     started_at: datetime = Field(
         ...,
-        description="Execution start timestamp",
-        example="2023-01-01T12:00:00Z"
+        description="Execution start timestamp"
     )
     async_execution: bool = Field(
         ...,
-        description="Whether execution is asynchronous",
-        example=True
-    )
\ No newline at end of file
+        description="Whether execution is asynchronous"
+    )
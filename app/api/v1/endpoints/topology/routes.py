@@ -1,7 +1,8 @@
 """Topology sorting API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
+from app.api.cache import cache_response
 from app.api.dependencies import get_current_active_user, get_build_service
 from .schemas import SortResultResponse, CycleDetectionResponse, ValidationResponse
 from app.core.auth.entities import User
@@ -14,6 +15,8 @@ from app.core.exceptions import (
 
 router = APIRouter(prefix="/topology", tags=["Topology"])
 
+TOPOLOGY_CACHE_NAMESPACE = "saber:topology"
+
 
 @router.get(
     "/sort/{build_name}",
@@ -26,7 +29,9 @@ router = APIRouter(prefix="/topology", tags=["Topology"])
         409: {"description": "Cyclic dependency detected"},
     },
 )
+@cache_response(ttl=60, namespace=TOPOLOGY_CACHE_NAMESPACE)
 async def sort_build_tasks(
+    request: Request,
     build_name: str,
     current_user: User = Depends(get_current_active_user),
     build_service: BuildService = Depends(get_build_service),
@@ -89,7 +94,9 @@ async def sort_build_tasks(
         404: {"description": "Build not found"},
     },
 )
+@cache_response(ttl=60, namespace=TOPOLOGY_CACHE_NAMESPACE)
 async def detect_cycles(
+    request: Request,
     build_name: str,
     current_user: User = Depends(get_current_active_user),
     build_service: BuildService = Depends(get_build_service),
@@ -175,13 +182,12 @@ async def validate_build_dependencies(
         if not build:
             raise BuildNotFoundException(f"Build '{build_name}' not found")
         
-        cycles = await build_service.detect_cycles(build_name)
+        # One batched lookup instead of a query per task, reused for
+        # cycle detection so the build and its tasks are loaded only once
+        existing_tasks = await build_service._task_repository.get_tasks(build.tasks)
+        missing_tasks = [name for name in build.tasks if name not in existing_tasks]
         
-        missing_tasks = []
-        for task_name in build.tasks:
-            task = await build_service._task_repository.get_task(task_name)
-            if not task:
-                missing_tasks.append(task_name)
+        cycles = await build_service.detect_cycles(build_name, existing_tasks)
         
         sort_possible = len(cycles) == 0 and len(missing_tasks) == 0
         sorted_order = []
@@ -1,124 +1,156 @@
 """Topology analysis API schemas."""
 
 from typing import List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SortResultResponse(BaseModel):
     """Topology sort result response schema."""
     
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "build_name": "frontend_build",
+                "sorted_tasks": ["compile_core", "compile_ui", "run_tests", "package"],
+                "algorithm_used": "kahn",
+                "execution_time_ms": 1.23,
+                "total_tasks": 4,
+                "has_cycles": False,
+                "cycles": [],
+            },
+        },
+    )
+
     build_name: str = Field(
         ...,
-        description="Name of the sorted build",
-        example="frontend_build"
+        description="Name of the sorted build"
     )
     sorted_tasks: List[str] = Field(
         ...,
-        description="Tasks in topological execution order",
-        example=["compile_core", "compile_ui", "run_tests", "package"]
+        description="Tasks in topological execution order"
     )
     algorithm_used: str = Field(
         ...,
-        description="Algorithm used for sorting",
-        example="kahn"
+        description="Algorithm used for sorting"
     )
     execution_time_ms: float = Field(
         ...,
-        description="Time taken for sorting in milliseconds",
-        example=1.23
+        description="Time taken for sorting in milliseconds"
     )
     total_tasks: int = Field(
         ...,
-        description="Total number of tasks sorted",
-        example=4
+        description="Total number of tasks sorted"
     )
     has_cycles: bool = Field(
         ...,
-        description="Whether circular dependencies were detected",
-        example=False
+        description="Whether circular dependencies were detected"
     )
     cycles: List[List[str]] = Field(
         ...,
-        description="Detected cycles (if any)",
-        example=[]
+        description="Detected cycles (if any)"
     )
 
 
 class CycleDetectionResponse(BaseModel):
     """Cycle detection response schema."""
     
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "build_name": "frontend_build",
+                "has_cycles": False,
+                "cycles": [],
+                "total_cycles": 0,
+                "analysis_method": "depth_first_search",
+            },
+        },
+    )
+
     build_name: str = Field(
         ...,
-        description="Name of the analyzed build",
-        example="frontend_build"
+        description="Name of the analyzed build"
     )
     has_cycles: bool = Field(
         ...,
-        description="Whether circular dependencies were found",
-        example=False
+        description="Whether circular dependencies were found"
     )
     cycles: List[List[str]] = Field(
         ...,
-        description="List of detected cycles",
-        example=[]
+        description="List of detected cycles"
     )
     total_cycles: int = Field(
         ...,
-        description="Total number of cycles found",
-        example=0
+        description="Total number of cycles found"
     )
     analysis_method: str = Field(
         ...,
-        description="Method used for cycle detection",
-        example="depth_first_search"
+        description="Method used for cycle detection"
     )
 
 
 class ValidationResponse(BaseModel):
     """Build validation response schema."""
     
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "build_name": "frontend_build",
+                "is_valid": True,
+                "has_cycles": False,
+                "cycles": [],
+                "missing_tasks": [],
+                "total_tasks": 4,
+                "sort_possible": True,
+                "suggested_order": [
+                    "compile_core",
+                    "compile_ui",
+                    "run_tests",
+                    "package",
+                ],
+                "validation_timestamp": "2023-01-01T12:00:00Z",
+            },
+        },
+    )
+
     build_name: str = Field(
         ...,
-        description="Name of the validated build",
-        example="frontend_build"
+        description="Name of the validated build"
     )
     is_valid: bool = Field(
         ...,
-        description="Whether the build is valid",
-        example=True
+        description="Whether the build is valid"
     )
     has_cycles: bool = Field(
         ...,
-        description="Whether circular dependencies exist",
-        example=False
+        description="Whether circular dependencies exist"
     )
     cycles: List[List[str]] = Field(
         ...,
-        description="Detected cycles",
-        example=[]
+        description="Detected cycles"
     )
     missing_tasks: List[str] = Field(
         ...,
-        description="Tasks referenced but not found",
-        example=[]
+        description="Tasks referenced but not found"
     )
     total_tasks: int = Field(
         ...,
-        description="Total number of tasks in build",
-        example=4
+        description="Total number of tasks in build"
     )
     sort_possible: bool = Field(
         ...,
-        description="Whether topological sort is possible",
-        example=True
+        description="Whether topological sort is possible"
     )
     suggested_order: List[str] = Field(
         ...,
-        description="Suggested execution order (if sort possible)",
-        example=["compile_core", "compile_ui", "run_tests", "package"]
+        description="Suggested execution order (if sort possible)"
     )
     validation_timestamp: str = Field(
         ...,
-        description="When validation was performed",
-        example="2023-01-01T12:00:00Z"
-    )
\ No newline at end of file
+        description="When validation was performed"
+    )
@@ -1,47 +1,81 @@
 """Command line interface for Saber Build System."""
 
+# Heavy modules (Alembic, database, Redis) are imported inside the commands
+# that use them, so `--help` and lightweight commands start fast.
+
 import asyncio
 import click
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Coroutine, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from alembic.config import Config
+
+T = TypeVar("T")
+
+_runner: Optional[asyncio.Runner] = None
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run coroutine on the event loop shared by the current CLI invocation.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        Coroutine result
+    """
+    global _runner
+    if _runner is None:
+        _runner = asyncio.Runner()
+    return _runner.run(coro)
+
 
-from alembic import command
-from alembic.config import Config
+def _close_runner() -> None:
+    """Close the shared event loop, if one was started."""
+    global _runner
+    if _runner is not None:
+        _runner.close()
+        _runner = None
 
-from app.infrastructure.database.init_db import (
-    init_database,
-    check_database_health,
-    get_database_info,
-    load_yaml_data,
-)
-from app.infrastructure.cache.redis_client import get_redis_client
-from app.utils.logging import setup_logging
-from app.settings import get_settings
 
+@lru_cache(maxsize=1)
+def get_alembic_config() -> "Config":
+    """Get Alembic configuration, built once per process."""
+    from alembic.config import Config
 
-def get_alembic_config() -> Config:
-    """Get Alembic configuration."""
     project_root = Path(__file__).parent.parent
     alembic_ini_path = project_root / "alembic.ini"
     return Config(str(alembic_ini_path))
 
 
 @click.group()
-def cli():
+@click.pass_context
+def cli(ctx: click.Context):
     """Saber Build System CLI."""
+    from app.utils.logging import setup_logging
+
     setup_logging()
+    ctx.call_on_close(_close_runner)
 
 
 @cli.command()
 def init_db():
     """Initialize database with migrations and load data from YAML files."""
+    from app.infrastructure.database.init_db import init_database
+
     click.echo("Initializing database...")
-    asyncio.run(init_database())
+    run_async(init_database())
     click.echo("Database initialized successfully!")
 
 
 @cli.command()
 def migrate():
     """Run database migrations to the latest version."""
+    from alembic import command
+
     click.echo("Running database migrations...")
     alembic_cfg = get_alembic_config()
     command.upgrade(alembic_cfg, "head")
@@ -52,6 +86,8 @@ def migrate():
 @click.option('--message', '-m', required=True, help='Migration message')
 def create_migration(message: str):
     """Create a new migration file."""
+    from alembic import command
+
     click.echo(f"Creating migration: {message}")
     alembic_cfg = get_alembic_config()
     command.revision(alembic_cfg, message=message, autogenerate=True)
@@ -61,6 +97,8 @@ def create_migration(message: str):
 @cli.command()
 def current():
     """Show current migration version."""
+    from alembic import command
+
     alembic_cfg = get_alembic_config()
     command.current(alembic_cfg, verbose=True)
 
@@ -68,6 +106,8 @@ def current():
 @cli.command()
 def history():
     """Show migration history."""
+    from alembic import command
+
     alembic_cfg = get_alembic_config()
     command.history(alembic_cfg, verbose=True)
 
@@ -77,6 +117,8 @@ def history():
 @click.confirmation_option(prompt="Are you sure you want to downgrade the database?")
 def downgrade(revision: str):
     """Downgrade database to a previous migration."""
+    from alembic import command
+
     click.echo(f"Downgrading to revision: {revision}")
     alembic_cfg = get_alembic_config()
     command.downgrade(alembic_cfg, revision)
@@ -86,14 +128,21 @@ def downgrade(revision: str):
 @cli.command()
 def load_yaml():
     """Load or reload data from YAML files into the database."""
+    from app.infrastructure.database.init_db import load_yaml_data
+
     click.echo("Loading data from YAML files...")
-    asyncio.run(load_yaml_data())
+    run_async(load_yaml_data())
     click.echo("YAML data loaded successfully!")
 
 
 @cli.command()
 def check_db():
     """Check database connectivity and health."""
+    from app.infrastructure.database.init_db import (
+        check_database_health,
+        get_database_info,
+    )
+
     click.echo("Checking database health...")
 
     async def check():
@@ -110,53 +159,80 @@ def check_db():
             return 1
         return 0
 
-    exit_code = asyncio.run(check())
+    exit_code = run_async(check())
     exit(exit_code)
 
 
 @cli.command()
 def test_redis():
     """Test Redis connectivity."""
+    from app.infrastructure.cache.redis_client import get_redis_client
+
     click.echo("Testing Redis connection...")
 
     async def test():
+        # The client connects lazily through its connection pool
+        redis_client = get_redis_client()
         try:
-            redis_client = get_redis_client()
-            await redis_client.connect()
             is_healthy = await redis_client.ping()
 
             if is_healthy:
                 click.echo("✓ Redis connection is healthy")
 
-                test_key = "cli_test_key"
-                test_value = "test_value"
-                await redis_client.set(test_key, test_value)
-                retrieved = await redis_client.get(test_key)
-
-                if retrieved == test_value:
+                if await redis_client.check_roundtrip("cli_test_key", "test_value"):
                     click.echo("✓ Redis set/get operations work correctly")
                 else:
                     click.echo("✗ Redis set/get operations failed")
-
-                await redis_client.delete(test_key)
             else:
                 click.echo("✗ Redis ping failed")
                 return 1
-
-            await redis_client.disconnect()
         except Exception as e:
             click.echo(f"✗ Redis connection failed: {e}")
             return 1
+        finally:
+            await redis_client.disconnect()
 
         return 0
 
-    exit_code = asyncio.run(test())
+    exit_code = run_async(test())
+    exit(exit_code)
+
+
+@cli.command()
+def health():
+    """Check database and Redis connectivity concurrently."""
+    from app.infrastructure.cache.redis_client import get_redis_client
+    from app.infrastructure.database.init_db import check_database_health
+
+    async def check():
+        redis_client = get_redis_client()
+        try:
+            results = await asyncio.gather(
+                check_database_health(),
+                redis_client.ping(),
+                return_exceptions=True,
+            )
+        finally:
+            await redis_client.disconnect()
+
+        exit_code = 0
+        for name, result in zip(("Database", "Redis"), results):
+            if result is True:
+                click.echo(f"✓ {name} connection is healthy")
+            else:
+                click.echo(f"✗ {name} connection failed")
+                exit_code = 1
+        return exit_code
+
+    exit_code = run_async(check())
     exit(exit_code)
 
 
 @cli.command()
 def show_config():
     """Display current configuration settings."""
+    from app.settings import get_settings
+
     settings = get_settings()
 
     click.echo("Current configuration:")
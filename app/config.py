@@ -1,7 +1,7 @@
 """Application configuration management."""
 
-from functools import lru_cache
-from typing import List
+from functools import cached_property
+from typing import Tuple
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -19,7 +19,8 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
-        extra="ignore"
+        extra="ignore",
+        frozen=True,
     )
 
     database_url: str = Field(
@@ -52,8 +53,8 @@ class Settings(BaseSettings):
         description="Enable debug mode"
     )
     
-    cors_origins: List[str] = Field(
-        default=["http://localhost:8000", "http://localhost:3000"],
+    cors_origins: Tuple[str, ...] = Field(
+        default=("http://localhost:8000", "http://localhost:3000"),
         description="CORS allowed origins"
     )
     
@@ -111,29 +112,38 @@ class Settings(BaseSettings):
         default=7,
         description="Refresh token expiration time in days"
     )
+    
+    bcrypt_rounds: int = Field(
+        default=12,
+        description="bcrypt cost factor (log2 of key expansion rounds)"
+    )
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production environment."""
         return not self.debug
 
-    @property
+    @cached_property
     def database_is_sqlite(self) -> bool:
         """Check if using SQLite database."""
         return self.database_url.startswith("sqlite")
 
-    @property
+    @cached_property
     def database_is_postgres(self) -> bool:
         """Check if using PostgreSQL database."""
         return self.database_url.startswith("postgresql")
 
 
-@lru_cache
+_SETTINGS = Settings()
+
+
 def get_settings() -> Settings:
     """
-    Get cached application settings instance.
+    Get application settings instance.
+    
+    Settings are read once at import time and are immutable afterwards.
     
     Returns:
         Singleton settings instance
     """
-    return Settings()
\ No newline at end of file
+    return _SETTINGS
@@ -0,0 +1,199 @@
+"""Coalescing of concurrent user lookups into batched queries."""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from .entities import User
+from .interfaces import UserRepositoryInterface
+
+UserLoader = Callable[[List[int]], Awaitable[Dict[int, User]]]
+
+
+class UserBatchLoader:
+    """
+    Application-scoped loader grouping user lookups by ID.
+
+    A lookup arriving while no batch is in flight is sent at once. Lookups
+    arriving while a query runs are collected for up to ``max_wait``
+    seconds and resolved with a single bulk query, or sent early once
+    ``max_batch_size`` distinct IDs are pending. Only those lookups wait
+    longer than with a direct query, by at most ``max_wait`` (2 ms by
+    default).
+
+    Batches mix lookups from different requests, so ``load_users`` cannot
+    use a request's session. The loader built by
+    ``create_user_batch_loader`` checks out its own pooled connection for
+    every batch, in addition to the connection of each waiting request.
+    """
+
+    def __init__(
+        self,
+        load_users: UserLoader,
+        max_batch_size: int = 128,
+        max_wait: float = 0.002,
+    ) -> None:
+        """
+        Initialize loader.
+
+        Args:
+            load_users: Bulk lookup running in its own database session
+            max_batch_size: Maximum number of distinct IDs per query
+            max_wait: Seconds to wait for more lookups before querying
+        """
+        self._load_users = load_users
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._pending: Dict[int, List[asyncio.Future]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._running: Set[asyncio.Task] = set()
+
+    async def load(self, user_id: int) -> Optional[User]:
+        """
+        Get user by ID as part of the next batch.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            User entity if found, None otherwise
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(user_id, []).append(future)
+
+        if not self._running or len(self._pending) >= self._max_batch_size:
+            self._dispatch()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._max_wait, self._dispatch)
+
+        return await future
+
+    def _dispatch(self) -> None:
+        """Send pending lookups as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._resolve(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _resolve(self, batch: Dict[int, List[asyncio.Future]]) -> None:
+        """Run bulk lookup and hand results to waiting callers."""
+        try:
+            users = await self._load_users(list(batch))
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for user_id, futures in batch.items():
+            user = users.get(user_id)
+            for future in futures:
+                if not future.done():
+                    future.set_result(user)
+
+
+class BatchedUserRepository(UserRepositoryInterface):
+    """User repository decorator resolving ID lookups through a batch loader."""
+
+    def __init__(self, repository: UserRepositoryInterface, loader: UserBatchLoader) -> None:
+        """
+        Initialize repository.
+
+        Args:
+            repository: Session-bound user repository
+            loader: Shared user batch loader
+        """
+        self._repository = repository
+        self._loader = loader
+
+    async def get_user_by_id(self, user_id: int) -> Optional[User]:
+        """
+        Get user by ID through the batch loader.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            User entity if found, None otherwise
+        """
+        return await self._loader.load(user_id)
+
+    async def get_users_by_ids(self, user_ids: List[int]) -> Dict[int, User]:
+        """
+        Get multiple users by ID from the session-bound repository.
+
+        Args:
+            user_ids: User identifiers
+
+        Returns:
+            Dictionary mapping identifiers of found users to entities
+        """
+        return await self._repository.get_users_by_ids(user_ids)
+
+    async def get_user_by_username(self, username: str) -> Optional[User]:
+        """
+        Get user by username from the session-bound repository.
+
+        Args:
+            username: Username
+
+        Returns:
+            User entity if found, None otherwise
+        """
+        return await self._repository.get_user_by_username(username)
+
+    async def get_user_by_email(self, email: str) -> Optional[User]:
+        """
+        Get user by email from the session-bound repository.
+
+        Args:
+            email: Email address
+
+        Returns:
+            User entity if found, None otherwise
+        """
+        return await self._repository.get_user_by_email(email)
+
+    async def create_user(self, user: User) -> User:
+        """
+        Create new user.
+
+        Args:
+            user: User entity to create
+
+        Returns:
+            Created user entity with ID
+        """
+        return await self._repository.create_user(user)
+
+    async def update_user(self, user: User) -> User:
+        """
+        Update existing user.
+
+        Args:
+            user: User entity to update
+
+        Returns:
+            Updated user entity
+        """
+        return await self._repository.update_user(user)
+
+    async def delete_user(self, user_id: int) -> bool:
+        """
+        Delete user by ID.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            True if user was deleted, False if not found
+        """
+        return await self._repository.delete_user(user_id)
@@ -0,0 +1,455 @@
+"""In-process caches for authentication lookups."""
+
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+from .entities import TokenPayload, User
+from .interfaces import UserRepositoryInterface
+
+
+class TokenUserCache:
+    """
+    Bounded TTL cache mapping access tokens to resolved users.
+
+    Access tokens are immutable and short-lived, so repeated requests with
+    the same token can skip JWT verification and the user lookup. Entries
+    never outlive the token's own expiration.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 60.0) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of cached tokens
+            ttl: Maximum entry lifetime in seconds
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, User]]" = OrderedDict()
+        self._tokens_by_user: Dict[int, Set[str]] = {}
+
+    def __len__(self) -> int:
+        """Get number of cached tokens."""
+        return len(self._entries)
+
+    def get(self, token: str) -> Optional[User]:
+        """
+        Get cached user for token.
+
+        Args:
+            token: JWT access token
+
+        Returns:
+            Cached user or None if missing or expired
+        """
+        entry = self._entries.get(token)
+        if entry is None:
+            return None
+
+        expires_at, user = entry
+        if expires_at <= time.monotonic():
+            self._discard(token)
+            return None
+
+        self._entries.move_to_end(token)
+        return user
+
+    def set(self, token: str, user: User, token_exp: Optional[int] = None) -> None:
+        """
+        Cache user for token.
+
+        Args:
+            token: JWT access token
+            user: Resolved user
+            token_exp: Token expiration as Unix timestamp
+        """
+        ttl = self._ttl
+        if token_exp is not None:
+            ttl = min(ttl, token_exp - time.time())
+        if ttl <= 0:
+            return
+
+        self._discard(token)
+        self._entries[token] = (time.monotonic() + ttl, user)
+        self._tokens_by_user.setdefault(user.id, set()).add(token)
+
+        while len(self._entries) > self._maxsize:
+            oldest_token = next(iter(self._entries))
+            self._discard(oldest_token)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """
+        Drop all cached tokens of a user.
+
+        Args:
+            user_id: User identifier
+        """
+        for token in self._tokens_by_user.pop(user_id, set()):
+            self._entries.pop(token, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+        self._tokens_by_user.clear()
+
+    def _discard(self, token: str) -> None:
+        """Remove token entry and its user index reference."""
+        entry = self._entries.pop(token, None)
+        if entry is None:
+            return
+
+        user_id = entry[1].id
+        tokens = self._tokens_by_user.get(user_id)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_user[user_id]
+
+
+class TokenPayloadCache:
+    """
+    Bounded cache of verified access token payloads.
+
+    Decoding depends only on the token and the signing key, so a verified
+    payload stays valid for the token's whole lifetime. Callers still check
+    expiration on every use. The oldest entries are evicted first.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of cached tokens
+        """
+        self._maxsize = maxsize
+        self._entries: Dict[str, TokenPayload] = {}
+
+    def __len__(self) -> int:
+        """Get number of cached payloads."""
+        return len(self._entries)
+
+    def get(self, token: str) -> Optional[TokenPayload]:
+        """
+        Get verified payload of token.
+
+        Args:
+            token: JWT access token
+
+        Returns:
+            Cached payload or None if token was not verified yet
+        """
+        return self._entries.get(token)
+
+    def set(self, token: str, payload: TokenPayload) -> None:
+        """
+        Cache verified payload of token.
+
+        Args:
+            token: JWT access token
+            payload: Verified token payload
+        """
+        if token not in self._entries and len(self._entries) >= self._maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[token] = payload
+
+    def discard(self, token: str) -> None:
+        """
+        Drop cached payload of token.
+
+        Args:
+            token: JWT access token
+        """
+        self._entries.pop(token, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+
+class AccessTokenCache:
+    """
+    Short-lived cache of issued access tokens per user.
+
+    Bursts of logins or refreshes by the same user within ``ttl`` seconds
+    reuse one signed access token. The window is far shorter than the token
+    lifetime, so reused tokens remain valid for nearly their full term. The
+    token expiration is kept alongside so callers can report the time left.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 15.0) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of cached users
+            ttl: Seconds an issued token is reused for
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: "OrderedDict[Tuple[int, str], Tuple[float, str, int]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Get number of cached tokens."""
+        return len(self._entries)
+
+    def get(self, user: User) -> Optional[Tuple[str, int]]:
+        """
+        Get recently issued access token of user.
+
+        Args:
+            user: Token owner
+
+        Returns:
+            Cached access token and its expiration as Unix timestamp,
+            or None if missing or expired
+        """
+        key = (user.id, user.username)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, token, token_exp = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return token, token_exp
+
+    def set(self, user: User, token: str, token_exp: int) -> None:
+        """
+        Cache newly issued access token of user.
+
+        Args:
+            user: Token owner
+            token: Signed access token
+            token_exp: Token expiration as Unix timestamp
+        """
+        key = (user.id, user.username)
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + self._ttl, token, token_exp)
+
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+class UserLookupCache:
+    """
+    Short-lived cache of users by identifier and username.
+
+    Shared across requests so repeated lookups of the same user, for example
+    with a newly issued token, skip the database. Both keys point to a single
+    entry, so invalidating a user drops both at once.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 5.0) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of cached users
+            ttl: Entry lifetime in seconds
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: "OrderedDict[int, Tuple[float, User]]" = OrderedDict()
+        self._ids_by_username: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Get number of cached users."""
+        return len(self._entries)
+
+    def get_by_id(self, user_id: int) -> Optional[User]:
+        """
+        Get cached user by identifier.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Cached user or None if missing or expired
+        """
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+
+        expires_at, user = entry
+        if expires_at <= time.monotonic():
+            self.invalidate(user_id)
+            return None
+
+        self._entries.move_to_end(user_id)
+        return user
+
+    def get_by_username(self, username: str) -> Optional[User]:
+        """
+        Get cached user by username.
+
+        Args:
+            username: Username
+
+        Returns:
+            Cached user or None if missing or expired
+        """
+        user_id = self._ids_by_username.get(username)
+        if user_id is None:
+            return None
+        return self.get_by_id(user_id)
+
+    def set(self, user: User) -> None:
+        """
+        Cache user under its identifier and username.
+
+        Args:
+            user: User loaded from the repository
+        """
+        self.invalidate(user.id)
+        self._entries[user.id] = (time.monotonic() + self._ttl, user)
+        self._ids_by_username[user.username] = user.id
+
+        while len(self._entries) > self._maxsize:
+            oldest_user_id = next(iter(self._entries))
+            self.invalidate(oldest_user_id)
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        Drop cached user.
+
+        Args:
+            user_id: User identifier
+        """
+        entry = self._entries.pop(user_id, None)
+        if entry is not None:
+            self._ids_by_username.pop(entry[1].username, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+        self._ids_by_username.clear()
+
+
+class CachedUserRepository(UserRepositoryInterface):
+    """
+    User repository decorator serving id and username lookups from cache.
+
+    Writes invalidate the cached user right after the underlying repository
+    call, which is before the request commits. A concurrent lookup in that
+    window can cache the old row again, so readers may see it for up to the
+    cache TTL after an update or delete.
+    """
+
+    def __init__(self, repository: UserRepositoryInterface, cache: UserLookupCache) -> None:
+        """
+        Initialize repository.
+
+        Args:
+            repository: Underlying user repository
+            cache: Shared user lookup cache
+        """
+        self._repository = repository
+        self._cache = cache
+
+    async def get_user_by_id(self, user_id: int) -> Optional[User]:
+        """
+        Get user by ID, from cache when present.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            User entity if found, None otherwise
+        """
+        user = self._cache.get_by_id(user_id)
+        if user is None:
+            user = await self._repository.get_user_by_id(user_id)
+            if user is not None:
+                self._cache.set(user)
+        return user
+
+    async def get_users_by_ids(self, user_ids: List[int]) -> Dict[int, User]:
+        """
+        Get multiple users by ID from the underlying repository.
+
+        Args:
+            user_ids: User identifiers
+
+        Returns:
+            Dictionary mapping identifiers of found users to entities
+        """
+        return await self._repository.get_users_by_ids(user_ids)
+
+    async def get_user_by_username(self, username: str) -> Optional[User]:
+        """
+        Get user by username, from cache when present.
+
+        Args:
+            username: Username
+
+        Returns:
+            User entity if found, None otherwise
+        """
+        user = self._cache.get_by_username(username)
+        if user is None:
+            user = await self._repository.get_user_by_username(username)
+            if user is not None:
+                self._cache.set(user)
+        return user
+
+    async def get_user_by_email(self, email: str) -> Optional[User]:
+        """
+        Get user by email from the underlying repository.
+
+        Args:
+            email: Email address
+
+        Returns:
+            User entity if found, None otherwise
+        """
+        return await self._repository.get_user_by_email(email)
+
+    async def create_user(self, user: User) -> User:
+        """
+        Create new user.
+
+        Args:
+            user: User entity to create
+
+        Returns:
+            Created user entity with ID
+        """
+        return await self._repository.create_user(user)
+
+    async def update_user(self, user: User) -> User:
+        """
+        Update existing user and drop its cached entry.
+
+        The entry is dropped before the request commits, see the class
+        docstring for the resulting staleness window.
+
+        Args:
+            user: User entity to update
+
+        Returns:
+            Updated user entity
+        """
+        updated = await self._repository.update_user(user)
+        self._cache.invalidate(user.id)
+        return updated
+
+    async def delete_user(self, user_id: int) -> bool:
+        """
+        Delete user by ID and drop its cached entry.
+
+        The entry is dropped before the request commits, see the class
+        docstring for the resulting staleness window.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            True if user was deleted, False if not found
+        """
+        deleted = await self._repository.delete_user(user_id)
+        self._cache.invalidate(user_id)
+        return deleted
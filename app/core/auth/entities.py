@@ -1,11 +1,19 @@
 """Authentication domain entities."""
 
-from dataclasses import dataclass
-from datetime import datetime
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Optional
 
 
-@dataclass(frozen=True)
+def _utc_timestamp(value: datetime) -> float:
+    """Convert datetime to Unix timestamp, treating naive values as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+@dataclass(frozen=True, slots=True)
 class User:
     """
     User entity for authentication.
@@ -30,17 +38,53 @@ class User:
 
     def __post_init__(self) -> None:
         """Validate user data after initialization."""
+        if self.username and self.hashed_password and self.email.find("@") >= 0:
+            return
         if not self.username:
             raise ValueError("Username cannot be empty")
         if not self.email:
             raise ValueError("Email cannot be empty")
         if not self.hashed_password:
             raise ValueError("Hashed password cannot be empty")
-        if "@" not in self.email:
-            raise ValueError("Invalid email format")
+        raise ValueError("Invalid email format")
+
+    def __hash__(self) -> int:
+        """Hash by identifier; equal users always share it."""
+        return hash(self.id)
+
+    @classmethod
+    def from_trusted(
+        cls,
+        id: int,
+        username: str,
+        email: str,
+        hashed_password: str,
+        is_active: bool = True,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+    ) -> "User":
+        """
+        Create user from already validated data without running validation.
+
+        Intended for repositories rehydrating stored rows, which were
+        validated when they were written. API-facing code must use the
+        regular constructor.
 
+        Returns:
+            User entity
+        """
+        user = cls.__new__(cls)
+        object.__setattr__(user, "id", id)
+        object.__setattr__(user, "username", username)
+        object.__setattr__(user, "email", email)
+        object.__setattr__(user, "hashed_password", hashed_password)
+        object.__setattr__(user, "is_active", is_active)
+        object.__setattr__(user, "created_at", created_at)
+        object.__setattr__(user, "updated_at", updated_at)
+        return user
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class RefreshToken:
     """
     Refresh token entity for token management.
@@ -60,6 +104,7 @@ class RefreshToken:
     expires_at: datetime
     is_revoked: bool = False
     created_at: Optional[datetime] = None
+    _expires_ts: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate refresh token data."""
@@ -67,17 +112,51 @@ class RefreshToken:
             raise ValueError("Token cannot be empty")
         if self.user_id <= 0:
             raise ValueError("User ID must be positive")
+        object.__setattr__(self, "_expires_ts", _utc_timestamp(self.expires_at))
+
+    def __hash__(self) -> int:
+        """Hash by token string, which is unique even before the token is saved."""
+        return hash(self.token)
+
+    @classmethod
+    def from_trusted(
+        cls,
+        id: Optional[int],
+        user_id: int,
+        token: str,
+        expires_at: datetime,
+        is_revoked: bool = False,
+        created_at: Optional[datetime] = None,
+    ) -> "RefreshToken":
+        """
+        Create refresh token from already validated data without running validation.
+
+        Intended for repositories rehydrating stored rows. The expiration
+        timestamp used by ``is_expired`` is still computed.
+
+        Returns:
+            Refresh token entity
+        """
+        refresh_token = cls.__new__(cls)
+        object.__setattr__(refresh_token, "id", id)
+        object.__setattr__(refresh_token, "user_id", user_id)
+        object.__setattr__(refresh_token, "token", token)
+        object.__setattr__(refresh_token, "expires_at", expires_at)
+        object.__setattr__(refresh_token, "is_revoked", is_revoked)
+        object.__setattr__(refresh_token, "created_at", created_at)
+        object.__setattr__(refresh_token, "_expires_ts", _utc_timestamp(expires_at))
+        return refresh_token
 
     def is_expired(self) -> bool:
         """Check if refresh token is expired."""
-        return datetime.utcnow() >= self.expires_at
+        return time.time() >= self._expires_ts
 
     def is_valid(self) -> bool:
         """Check if refresh token is valid (not expired and not revoked)."""
         return not self.is_expired() and not self.is_revoked
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TokenPair:
     """
     Access and refresh token pair.
@@ -102,7 +181,7 @@ class TokenPair:
             raise ValueError("Refresh token cannot be empty")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TokenPayload:
     """
     JWT token payload data.
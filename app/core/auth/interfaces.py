@@ -1,7 +1,8 @@
 """Authentication service interfaces."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
 from .entities import User, RefreshToken, TokenPair, TokenPayload
 
@@ -9,6 +10,17 @@ from .entities import User, RefreshToken, TokenPair, TokenPayload
 class PasswordServiceInterface(ABC):
     """Interface for password hashing and verification."""
 
+    @property
+    @abstractmethod
+    def dummy_hash(self) -> str:
+        """
+        Hash verified instead of a missing user's password.
+        
+        Returns:
+            Hash with the same cost factor as real password hashes
+        """
+        pass
+
     @abstractmethod
     def hash_password(self, password: str) -> str:
         """
@@ -36,6 +48,33 @@ class PasswordServiceInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def hash_password_async(self, password: str) -> str:
+        """
+        Hash a password without blocking the event loop.
+        
+        Args:
+            password: Plain text password
+            
+        Returns:
+            Hashed password string
+        """
+        pass
+
+    @abstractmethod
+    async def verify_password_async(self, password: str, hashed_password: str) -> bool:
+        """
+        Verify password against hash without blocking the event loop.
+        
+        Args:
+            password: Plain text password
+            hashed_password: Stored password hash
+            
+        Returns:
+            True if password matches, False otherwise
+        """
+        pass
+
 
 class TokenServiceInterface(ABC):
     """Interface for JWT token operations."""
@@ -131,6 +170,19 @@ class UserRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_users_by_ids(self, user_ids: List[int]) -> Dict[int, User]:
+        """
+        Get multiple users by ID.
+        
+        Args:
+            user_ids: User identifiers
+            
+        Returns:
+            Dictionary mapping identifiers of found users to entities
+        """
+        pass
+
     @abstractmethod
     async def get_user_by_username(self, username: str) -> Optional[User]:
         """
@@ -226,6 +278,43 @@ class RefreshTokenRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_refresh_token_with_user(
+        self, token: str
+    ) -> Optional[Tuple[RefreshToken, Optional[User]]]:
+        """
+        Get refresh token and its owner with a single lookup.
+        
+        Args:
+            token: Refresh token string
+            
+        Returns:
+            Refresh token and owning user (None if missing), or None if
+            the token is not found
+        """
+        pass
+
+    @abstractmethod
+    async def rotate_refresh_token(
+        self, token: str, new_token: str, expires_at: datetime
+    ) -> Optional[RefreshToken]:
+        """
+        Atomically revoke refresh token and save its replacement.
+        
+        The replacement is issued to the owner of the revoked token. The SQL
+        implementation does this in one data-modifying CTE, which requires
+        PostgreSQL.
+        
+        Args:
+            token: Refresh token string being replaced
+            new_token: Replacement refresh token string
+            expires_at: Expiration of the replacement token
+            
+        Returns:
+            Saved replacement token, or None if the old token was not active
+        """
+        pass
+
     @abstractmethod
     async def revoke_refresh_token(self, token: str) -> bool:
         """
@@ -1,13 +1,22 @@
 """Authentication service implementations."""
 
+import asyncio
+import os
 import secrets
-from datetime import datetime, timedelta
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from datetime import datetime, timezone
+from typing import Optional, Tuple
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import bcrypt
+import orjson
+from jose import jwk, jws
+from jose.exceptions import JWSError
+from jose.utils import base64url_decode, base64url_encode
 
 from app.config import get_settings
+from .cache import AccessTokenCache, TokenPayloadCache, TokenUserCache
 from .entities import User, RefreshToken, TokenPair, TokenPayload
 from .exceptions import (
     InvalidCredentialsException,
@@ -25,6 +34,67 @@ from .interfaces import (
     RefreshTokenRepositoryInterface,
 )
 
+# bcrypt releases the GIL, so hashing scales with CPU count in threads
+_password_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="password-hash",
+)
+
+
+# Refresh tokens stay valid for 7 days
+_REFRESH_TOKEN_TTL_SECONDS = 7 * 86400
+
+
+def _refresh_token_expires_at() -> datetime:
+    """Get expiry timestamp for a refresh token issued now."""
+    return datetime.fromtimestamp(
+        time.time() + _REFRESH_TOKEN_TTL_SECONDS, tz=timezone.utc
+    )
+
+
+def _password_bytes(password: str) -> bytes:
+    """Encode password for bcrypt, which only uses the first 72 bytes."""
+    return password.encode("utf-8")[:72]
+
+
+@lru_cache(maxsize=4)
+def _dummy_hash(rounds: int) -> str:
+    """Build hash checked for logins naming an unknown user."""
+    return bcrypt.hashpw(b"x", bcrypt.gensalt(rounds=rounds)).decode("ascii")
+
+
+@lru_cache(maxsize=8)
+def _signing_key(secret_key: str, algorithm: str) -> jwk.Key:
+    """
+    Build JWT signing key once per secret.
+
+    jose parses a raw secret on every sign/verify call, while a prebuilt
+    key object is used as-is.
+
+    Args:
+        secret_key: Shared secret
+        algorithm: JWT algorithm
+
+    Returns:
+        Key object for signing and verification
+    """
+    return jwk.construct(secret_key, algorithm)
+
+
+@lru_cache(maxsize=8)
+def _header_prefix(algorithm: str) -> str:
+    """
+    Build encoded header segment written by jws.sign.
+
+    Args:
+        algorithm: JWT algorithm
+
+    Returns:
+        Base64url header followed by the segment separator
+    """
+    header = orjson.dumps({"alg": algorithm, "typ": "JWT"})
+    return base64url_encode(header).decode("ascii") + "."
+
 
 class PasswordService(PasswordServiceInterface):
     """
@@ -34,9 +104,20 @@ class PasswordService(PasswordServiceInterface):
     with configurable rounds for performance vs security balance.
     """
 
-    def __init__(self) -> None:
-        """Initialize password context with bcrypt."""
-        self._pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    def __init__(self, rounds: Optional[int] = None) -> None:
+        """
+        Initialize password service.
+        
+        Args:
+            rounds: bcrypt cost factor (defaults to settings)
+        """
+        self._rounds = rounds or get_settings().bcrypt_rounds
+        self._dummy_hash = _dummy_hash(self._rounds)
+
+    @property
+    def dummy_hash(self) -> str:
+        """Hash with the service cost factor matching no real password."""
+        return self._dummy_hash
 
     def hash_password(self, password: str) -> str:
         """
@@ -48,7 +129,8 @@ class PasswordService(PasswordServiceInterface):
         Returns:
             Hashed password string
         """
-        return self._pwd_context.hash(password)
+        salt = bcrypt.gensalt(rounds=self._rounds)
+        return bcrypt.hashpw(_password_bytes(password), salt).decode("ascii")
 
     def verify_password(self, password: str, hashed_password: str) -> bool:
         """
@@ -61,7 +143,38 @@ class PasswordService(PasswordServiceInterface):
         Returns:
             True if password matches, False otherwise
         """
-        return self._pwd_context.verify(password, hashed_password)
+        return bcrypt.checkpw(_password_bytes(password), hashed_password.encode("ascii"))
+
+    async def hash_password_async(self, password: str) -> str:
+        """
+        Hash a password in the password worker pool.
+        
+        Args:
+            password: Plain text password
+            
+        Returns:
+            Hashed password string
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _password_executor, self.hash_password, password
+        )
+
+    async def verify_password_async(self, password: str, hashed_password: str) -> bool:
+        """
+        Verify password against bcrypt hash in the password worker pool.
+        
+        Args:
+            password: Plain text password
+            hashed_password: Stored password hash
+            
+        Returns:
+            True if password matches, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _password_executor, self.verify_password, password, hashed_password
+        )
 
 
 class TokenService(TokenServiceInterface):
@@ -76,6 +189,8 @@ class TokenService(TokenServiceInterface):
         self,
         user_repository: UserRepositoryInterface,
         refresh_token_repository: RefreshTokenRepositoryInterface,
+        payload_cache: Optional[TokenPayloadCache] = None,
+        access_token_cache: Optional[AccessTokenCache] = None,
     ) -> None:
         """
         Initialize token service with repositories.
@@ -83,13 +198,19 @@ class TokenService(TokenServiceInterface):
         Args:
             user_repository: User data access interface
             refresh_token_repository: Refresh token data access interface
+            payload_cache: Optional cache of verified access token payloads
+            access_token_cache: Optional cache of recently issued access tokens
         """
         self._settings = get_settings()
         self._user_repository = user_repository
         self._refresh_token_repository = refresh_token_repository
+        self._payload_cache = payload_cache
+        self._access_token_cache = access_token_cache
         
         self._secret_key = self._settings.jwt_secret_key
         self._algorithm = "HS256"
+        self._signing_key = _signing_key(self._secret_key, self._algorithm)
+        self._header_prefix = _header_prefix(self._algorithm)
         self._access_token_expire_minutes = 30
         self._refresh_token_expire_days = 7
 
@@ -103,18 +224,46 @@ class TokenService(TokenServiceInterface):
         Returns:
             JWT access token string
         """
-        now = datetime.utcnow()
-        expire = now + timedelta(minutes=self._access_token_expire_minutes)
+        return self._issue_access_token(user, int(time.time()))[0]
+
+    def _issue_access_token(self, user: User, now: int) -> Tuple[str, int]:
+        """
+        Sign access token for user or reuse one issued moments ago.
+        
+        Args:
+            user: User entity
+            now: Current Unix timestamp
+            
+        Returns:
+            Tuple of JWT access token and its expiration as Unix timestamp
+        """
+        if self._access_token_cache is not None:
+            cached = self._access_token_cache.get(user)
+            if cached is not None:
+                return cached
         
         payload = {
             "sub": str(user.id),
             "username": user.username,
-            "exp": expire,
+            "exp": now + self._access_token_expire_minutes * 60,
             "iat": now,
             "token_type": "access",
         }
         
-        return jwt.encode(payload, self._secret_key, algorithm=self._algorithm)
+        # Signing pre-serialized claims lets orjson replace stdlib json
+        token = jws.sign(
+            orjson.dumps(payload), self._signing_key, algorithm=self._algorithm
+        )
+        
+        # The claims were built here, so the token is known to be valid and
+        # its first decode needs no signature check
+        if self._payload_cache is not None:
+            self._payload_cache.set(token, TokenPayload(**payload))
+        
+        if self._access_token_cache is not None:
+            self._access_token_cache.set(user, token, payload["exp"])
+            
+        return token, payload["exp"]
 
     def create_refresh_token(self, user: User) -> str:
         """
@@ -138,13 +287,15 @@ class TokenService(TokenServiceInterface):
         Returns:
             Token pair with access and refresh tokens
         """
-        access_token = self.create_access_token(user)
+        now = int(time.time())
+        access_token, access_token_exp = self._issue_access_token(user, now)
         refresh_token = self.create_refresh_token(user)
         
+        # A reused access token has less than the full lifetime left
         return TokenPair(
             access_token=access_token,
             refresh_token=refresh_token,
-            expires_in=self._access_token_expire_minutes * 60,
+            expires_in=access_token_exp - now,
         )
 
     def decode_token(self, token: str) -> TokenPayload:
@@ -161,23 +312,69 @@ class TokenService(TokenServiceInterface):
             InvalidTokenException: If token is invalid or malformed
             ExpiredTokenException: If token has expired
         """
+        if self._payload_cache is not None:
+            cached_payload = self._payload_cache.get(token)
+            if cached_payload is not None:
+                if cached_payload.exp < int(time.time()):
+                    self._payload_cache.discard(token)
+                    raise ExpiredTokenException()
+                return cached_payload
+        
         try:
-            payload = jwt.decode(
-                token, self._secret_key, algorithms=[self._algorithm]
-            )
+            payload = orjson.loads(self._verify_signature(token))
+            exp = payload["exp"]
+            if not isinstance(exp, int):
+                raise TypeError("Expiration must be an integer")
             
-            return TokenPayload(
+            token_payload = TokenPayload(
                 sub=payload["sub"],
                 username=payload["username"],
-                exp=payload["exp"],
+                exp=exp,
                 iat=payload["iat"],
                 token_type=payload.get("token_type", "access"),
             )
             
-        except JWTError as e:
-            if "expired" in str(e).lower():
-                raise ExpiredTokenException()
+        except (JWSError, KeyError, TypeError, ValueError) as e:
             raise InvalidTokenException(f"Token decode error: {e}")
+        
+        if exp < int(time.time()):
+            raise ExpiredTokenException()
+        
+        if self._payload_cache is not None:
+            self._payload_cache.set(token, token_payload)
+            
+        return token_payload
+
+    def _verify_signature(self, token: str) -> bytes:
+        """
+        Verify token signature and return its raw claims.
+        
+        Tokens with the header this service writes are checked directly
+        against the signing key, skipping jose's header decoding. Any other
+        header goes through jws.verify, which rejects foreign algorithms.
+        
+        Args:
+            token: JWT token string
+            
+        Returns:
+            Serialized claims
+            
+        Raises:
+            JWSError: If signature is invalid
+            ValueError: If token segments are not valid base64url
+        """
+        if not token.startswith(self._header_prefix):
+            return jws.verify(token, self._signing_key, algorithms=[self._algorithm])
+        
+        signing_input, _, signature = token.rpartition(".")
+        if not self._signing_key.verify(
+            signing_input.encode("ascii"), base64url_decode(signature.encode("ascii"))
+        ):
+            raise JWSError("Signature verification failed.")
+        
+        return base64url_decode(
+            signing_input[len(self._header_prefix):].encode("ascii")
+        )
 
     async def refresh_access_token(self, refresh_token: str) -> TokenPair:
         """
@@ -194,12 +391,14 @@ class TokenService(TokenServiceInterface):
             ExpiredTokenException: If refresh token has expired
             RevokedTokenException: If refresh token has been revoked
         """
-        token_entity = await self._refresh_token_repository.get_refresh_token(
+        token_and_user = await self._refresh_token_repository.get_refresh_token_with_user(
             refresh_token
         )
         
-        if not token_entity:
+        if not token_and_user:
             raise InvalidTokenException("Refresh token not found")
+        
+        token_entity, user = token_and_user
             
         if token_entity.is_revoked:
             raise RevokedTokenException()
@@ -207,7 +406,6 @@ class TokenService(TokenServiceInterface):
         if token_entity.is_expired():
             raise ExpiredTokenException()
             
-        user = await self._user_repository.get_user_by_id(token_entity.user_id)
         if not user:
             raise UserNotFoundException(str(token_entity.user_id))
             
@@ -231,6 +429,7 @@ class AuthenticationService:
         refresh_token_repository: RefreshTokenRepositoryInterface,
         password_service: PasswordServiceInterface,
         token_service: TokenServiceInterface,
+        user_cache: Optional[TokenUserCache] = None,
     ) -> None:
         """
         Initialize authentication service.
@@ -240,11 +439,13 @@ class AuthenticationService:
             refresh_token_repository: Refresh token data access interface
             password_service: Password hashing service
             token_service: Token management service
+            user_cache: Optional cache of users resolved from access tokens
         """
         self._user_repository = user_repository
         self._refresh_token_repository = refresh_token_repository
         self._password_service = password_service
         self._token_service = token_service
+        self._user_cache = user_cache
 
     async def authenticate_user(self, username: str, password: str) -> TokenPair:
         """
@@ -263,9 +464,13 @@ class AuthenticationService:
         """
         user = await self._get_user_by_username_or_email(username)
         
-        if not user or not self._password_service.verify_password(
-            password, user.hashed_password
-        ):
+        # Unknown users are checked against a dummy hash, so the response
+        # time does not reveal whether the account exists
+        password_valid = await self._password_service.verify_password_async(
+            password,
+            user.hashed_password if user else self._password_service.dummy_hash,
+        )
+        if not user or not password_valid:
             raise InvalidCredentialsException()
             
         if not user.is_active:
@@ -277,7 +482,7 @@ class AuthenticationService:
             id=None,
             user_id=user.id,
             token=token_pair.refresh_token,
-            expires_at=datetime.utcnow() + timedelta(days=7),
+            expires_at=_refresh_token_expires_at(),
         )
         
         await self._refresh_token_repository.save_refresh_token(refresh_token_entity)
@@ -293,19 +498,18 @@ class AuthenticationService:
             
         Returns:
             New token pair
+            
+        Raises:
+            RevokedTokenException: If the token was rotated concurrently
         """
         token_pair = await self._token_service.refresh_access_token(refresh_token)
         
-        await self._refresh_token_repository.revoke_refresh_token(refresh_token)
-        
-        refresh_token_entity = RefreshToken(
-            id=None,
-            user_id=int(self._token_service.decode_token(token_pair.access_token).sub),
-            token=token_pair.refresh_token,
-            expires_at=datetime.utcnow() + timedelta(days=7),
+        # Revoking the old token and saving the new one is a single statement
+        rotated = await self._refresh_token_repository.rotate_refresh_token(
+            refresh_token, token_pair.refresh_token, _refresh_token_expires_at()
         )
-        
-        await self._refresh_token_repository.save_refresh_token(refresh_token_entity)
+        if rotated is None:
+            raise RevokedTokenException()
         
         return token_pair
 
@@ -332,7 +536,7 @@ class AuthenticationService:
         if existing_email:
             raise UserAlreadyExistsException(email)
             
-        hashed_password = self._password_service.hash_password(password)
+        hashed_password = await self._password_service.hash_password_async(password)
         
         user = User(
             id=0,
@@ -354,7 +558,12 @@ class AuthenticationService:
         Returns:
             Number of tokens revoked
         """
-        return await self._refresh_token_repository.revoke_user_tokens(user_id)
+        revoked = await self._refresh_token_repository.revoke_user_tokens(user_id)
+        
+        if self._user_cache is not None:
+            self._user_cache.invalidate_user(user_id)
+            
+        return revoked
 
     async def get_current_user(self, token: str) -> User:
         """
@@ -371,8 +580,21 @@ class AuthenticationService:
             UserNotFoundException: If user not found
             InactiveUserException: If user is inactive
         """
+        if self._user_cache is not None:
+            cached_user = self._user_cache.get(token)
+            if cached_user is not None:
+                return cached_user
+        
         payload = self._token_service.decode_token(token)
+        user = await self._resolve_user(payload)
         
+        if self._user_cache is not None:
+            self._user_cache.set(token, user, payload.exp)
+            
+        return user
+
+    async def _resolve_user(self, payload: TokenPayload) -> User:
+        """Load active user referenced by token payload."""
         user = await self._user_repository.get_user_by_id(int(payload.sub))
         if not user:
             raise UserNotFoundException(payload.sub)
@@ -1,20 +1,20 @@
 """Domain entities for the build system."""
 
 from dataclasses import dataclass
-from typing import List, Optional, Set
+from typing import AbstractSet, FrozenSet, List, Optional
 from datetime import datetime
 
 from .enums import TaskStatus, BuildStatus
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Task:
     """
     Task entity representing a single build task.
     
     Attributes:
         name: Unique task identifier
-        dependencies: Set of task names this task depends on
+        dependencies: Immutable set of task names this task depends on
         status: Current execution status
         created_at: Task creation timestamp
         updated_at: Last update timestamp
@@ -22,7 +22,7 @@ class Task:
     """
     
     name: str
-    dependencies: Set[str]
+    dependencies: FrozenSet[str]
     status: TaskStatus = TaskStatus.PENDING
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
@@ -30,6 +30,8 @@ class Task:
 
     def __post_init__(self) -> None:
         """Validate task data after initialization."""
+        if type(self.dependencies) is not frozenset:
+            object.__setattr__(self, "dependencies", frozenset(self.dependencies))
         if not self.name:
             raise ValueError("Task name cannot be empty")
         if self.name in self.dependencies:
@@ -39,7 +41,7 @@ class Task:
         """Check if task has any dependencies."""
         return len(self.dependencies) > 0
 
-    def can_execute(self, completed_tasks: Set[str]) -> bool:
+    def can_execute(self, completed_tasks: AbstractSet[str]) -> bool:
         """
         Check if task can be executed based on completed dependencies.
         
@@ -52,7 +54,7 @@ class Task:
         return self.dependencies.issubset(completed_tasks)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Build:
     """
     Build entity representing a collection of tasks.
@@ -79,15 +81,19 @@ class Build:
             raise ValueError("Build name cannot be empty")
         if not self.tasks:
             raise ValueError("Build must contain at least one task")
-        if len(self.tasks) != len(set(self.tasks)):
-            raise ValueError("Build cannot contain duplicate tasks")
+        seen = set()
+        add = seen.add
+        for task_name in self.tasks:
+            if task_name in seen:
+                raise ValueError("Build cannot contain duplicate tasks")
+            add(task_name)
 
     def get_task_count(self) -> int:
         """Get total number of tasks in build."""
         return len(self.tasks)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SortedTaskList:
     """
     Result of topological sorting operation.
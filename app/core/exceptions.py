@@ -2,6 +2,9 @@
 
 from typing import List, Optional
 
+# TaskNotFoundException arguments starting with these are full messages
+_TASK_MESSAGE_PREFIXES = ("Missing tasks:", "Missing dependencies:")
+
 
 class DomainException(Exception):
     """Base exception for domain-related errors."""
@@ -29,7 +32,7 @@ class TaskNotFoundException(DomainException):
         Args:
             task_name_or_message: Name of the missing task or custom message
         """
-        if task_name_or_message.startswith("Missing tasks:") or task_name_or_message.startswith("Missing dependencies:"):
+        if task_name_or_message.startswith(_TASK_MESSAGE_PREFIXES):
             message = task_name_or_message
             super().__init__(message, task_name_or_message)
             self.task_name = None
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Integer, String, func
+from sqlalchemy import Boolean, DateTime, Index, Integer, LargeBinary, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.infrastructure.database.connection import Base
@@ -81,6 +81,14 @@ class RefreshTokenModel(Base):
     """
     
     __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        Index(
+            "ix_refresh_tokens_user_active",
+            "user_id",
+            postgresql_where=text("is_revoked = false"),
+            sqlite_where=text("is_revoked = 0"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer,
@@ -98,15 +106,22 @@ class RefreshTokenModel(Base):
     
     token: Mapped[str] = mapped_column(
         String(255),
+        nullable=False,
+        doc="The refresh token string"
+    )
+    
+    token_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32),
         unique=True,
         nullable=False,
         index=True,
-        doc="The refresh token string"
+        doc="SHA-256 digest of the token used for lookups"
     )
     
     expires_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        index=True,
         doc="Token expiration timestamp"
     )
     
@@ -1,9 +1,8 @@
 """Build orchestration service implementation."""
 
-import yaml
 import os
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from app.core.domain.entities import Build, SortedTaskList, Task
 from app.core.domain.enums import BuildStatus, SortAlgorithm, TaskStatus
@@ -17,6 +16,7 @@ from app.infrastructure.database.repositories.interfaces import (
     TaskRepositoryInterface,
 )
 from app.infrastructure.cache.cache_service import CacheService
+from app.utils.yaml_loader import YamlLoader
 from .interfaces import BuildServiceInterface, TopologyServiceInterface
 
 
@@ -95,7 +95,20 @@ class BuildService(BuildServiceInterface):
         """
         return await self._build_repository.get_all_builds()
 
-    async def create_build(self, build: Build) -> Build:
+    async def paginate_builds(self, limit: int, offset: int) -> Tuple[List[Build], int]:
+        """
+        Retrieve a page of builds.
+        
+        Args:
+            limit: Maximum number of builds to return
+            offset: Number of builds to skip
+            
+        Returns:
+            Tuple of builds on the page and total number of builds
+        """
+        return await self._build_repository.paginate_builds(limit, offset)
+
+    async def create_build(self, build: Build) -> Optional[Build]:
         """
         Create new build with comprehensive validation.
         
@@ -103,7 +116,7 @@ class BuildService(BuildServiceInterface):
             build: Build entity to create
             
         Returns:
-            Created build entity
+            Created build entity, or None if a build with this name exists
             
         Raises:
             TaskNotFoundException: If build references non-existent tasks
@@ -122,7 +135,7 @@ class BuildService(BuildServiceInterface):
         if missing_deps:
             raise TaskNotFoundException(f"Missing dependencies: {', '.join(missing_deps)}")
         
-        return await self._build_repository.save_build(build)
+        return await self._build_repository.create_build(build)
 
     async def update_build(self, build: Build) -> Build:
         """
@@ -156,7 +169,10 @@ class BuildService(BuildServiceInterface):
         if missing_deps:
             raise TaskNotFoundException(f"Missing dependencies: {', '.join(missing_deps)}")
         
-        return await self._build_repository.save_build(build)
+        saved_build = await self._build_repository.save_build(build)
+        if self._cache_service:
+            await self._cache_service.invalidate_build(build.name)
+        return saved_build
 
     async def delete_build(self, name: str) -> bool:
         """
@@ -168,7 +184,20 @@ class BuildService(BuildServiceInterface):
         Returns:
             True if build was deleted, False if not found
         """
-        return await self._build_repository.delete_build(name)
+        deleted = await self._build_repository.delete_build(name)
+        if deleted and self._cache_service:
+            await self._cache_service.invalidate_build(name)
+        return deleted
+
+    async def invalidate_task_cache(self, task_name: str) -> None:
+        """
+        Drop cached data derived from a task after it was changed.
+        
+        Args:
+            task_name: Name of created, updated or deleted task
+        """
+        if self._cache_service:
+            await self._cache_service.invalidate_task(task_name)
 
     async def get_sorted_tasks(
         self,
@@ -259,21 +288,19 @@ class BuildService(BuildServiceInterface):
             sorted_tasks = await self.get_sorted_tasks(build_name, algorithm, use_cache=False)
             
             tasks = await self._task_repository.get_tasks(build.tasks)
-            executed_tasks = []
-            
-            for task_name in sorted_tasks.tasks:
-                task = tasks[task_name]
-                
-                updated_task = Task(
-                    name=task.name,
-                    dependencies=task.dependencies,
+            executed_tasks = [
+                Task(
+                    name=tasks[task_name].name,
+                    dependencies=tasks[task_name].dependencies,
                     status=TaskStatus.COMPLETED,
-                    created_at=task.created_at,
+                    created_at=tasks[task_name].created_at,
                     error_message=None,
                 )
-                
-                await self._task_repository.save_task(updated_task)
-                executed_tasks.append(task_name)
+                for task_name in sorted_tasks.tasks
+            ]
+            
+            # Single batched write instead of a SELECT + flush per task
+            await self._task_repository.save_tasks(executed_tasks)
             
             final_build = Build(
                 name=build.name,
@@ -398,17 +425,60 @@ class BuildService(BuildServiceInterface):
         if not build:
             raise BuildNotFoundException(f"Build '{build_name}' not found")
         
-        # Get all tasks, not just build tasks - needed for dependency validation
-        all_tasks = await self._task_repository.get_all_tasks()
-        tasks = all_tasks
+        # Dependencies may live outside the build, so load its transitive
+        # dependency closure rather than only the build tasks
+        tasks = await self._get_tasks_with_dependencies(build.tasks)
+        
+        # Cache keys include a hash of the dependency graph, so results of an
+        # unchanged graph are reused without explicit invalidation
+        if self._cache_service:
+            cached_result = await self._cache_service.get_sorted_tasks(
+                build_name, SortAlgorithm.KAHN, build, tasks
+            )
+            if cached_result:
+                return cached_result
         
         cycles = self._topology_service.detect_cycles(tasks)
         if cycles:
             raise CircularDependencyException(f"Circular dependencies detected: {cycles}")
         
         sorted_result = await self._topology_service.sort_tasks(build, tasks)
+        
+        if self._cache_service:
+            await self._cache_service.cache_sorted_tasks(
+                sorted_result, SortAlgorithm.KAHN, build, tasks
+            )
+        
         return sorted_result
 
+    async def _get_tasks_with_dependencies(self, names: List[str]) -> Dict[str, Task]:
+        """
+        Load tasks together with everything they transitively depend on.
+        
+        Issues one batched lookup per dependency level instead of reading
+        every task in the system.
+        
+        Args:
+            names: Names of tasks to start from
+            
+        Returns:
+            Dictionary of found tasks, missing names are left out
+        """
+        tasks: Dict[str, Task] = {}
+        requested = set(names)
+        pending = list(names)
+        
+        while pending:
+            loaded = await self._task_repository.get_tasks(pending)
+            tasks.update(loaded)
+            new_dependencies = {
+                dep for task in loaded.values() for dep in task.dependencies
+            } - requested
+            requested |= new_dependencies
+            pending = sorted(new_dependencies)
+        
+        return tasks
+
     async def load_initial_data(self) -> None:
         """
         Load initial data from YAML configuration files.
@@ -417,9 +487,8 @@ class BuildService(BuildServiceInterface):
             # Load tasks
             tasks_path = "config/tasks.yaml"
             if os.path.exists(tasks_path):
-                with open(tasks_path, "r", encoding="utf-8") as f:
-                    tasks_data = yaml.safe_load(f)
-                    
+                tasks_data = await YamlLoader.load_yaml_file(tasks_path)
+                
                 for task_data in tasks_data.get("tasks", []):
                     task = Task(
                         name=task_data["name"],
@@ -432,9 +501,8 @@ class BuildService(BuildServiceInterface):
             # Load builds
             builds_path = "config/builds.yaml"
             if os.path.exists(builds_path):
-                with open(builds_path, "r", encoding="utf-8") as f:
-                    builds_data = yaml.safe_load(f)
-                    
+                builds_data = await YamlLoader.load_yaml_file(builds_path)
+                
                 for build_data in builds_data.get("builds", []):
                     build = Build(
                         name=build_data["name"],
@@ -447,12 +515,16 @@ class BuildService(BuildServiceInterface):
         except Exception as e:
             print(f"Warning: Could not load initial data: {e}")
 
-    async def detect_cycles(self, build_name: str) -> List[List[str]]:
+    async def detect_cycles(
+        self, build_name: str, tasks: Optional[Dict[str, Task]] = None
+    ) -> List[List[str]]:
         """
         Detect cycles in build dependencies.
         
         Args:
             build_name: Name of build to analyze
+            tasks: Build tasks already loaded by the caller, skips the
+                build and task lookups and the cache when given
             
         Returns:
             List of cycles found (empty if no cycles)
@@ -460,9 +532,21 @@ class BuildService(BuildServiceInterface):
         Raises:
             BuildNotFoundException: If build does not exist
         """
+        if tasks is not None:
+            return self._topology_service.detect_cycles(tasks)
+        
         build = await self._build_repository.get_build(build_name)
         if not build:
             raise BuildNotFoundException(f"Build '{build_name}' not found")
         
         tasks = await self._task_repository.get_tasks(build.tasks)
-        return self._topology_service.detect_cycles(tasks)
\ No newline at end of file
+        
+        if self._cache_service:
+            cached_cycles = await self._cache_service.get_cycles(build, tasks)
+            if cached_cycles is not None:
+                return cached_cycles
+        
+        cycles = self._topology_service.detect_cycles(tasks)
+        if self._cache_service:
+            await self._cache_service.cache_cycles(cycles, build, tasks)
+        return cycles
\ No newline at end of file
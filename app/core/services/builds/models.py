@@ -48,6 +48,7 @@ class BuildModel(Base):
         DateTime(timezone=True),
         nullable=False,
         server_default=func.now(),
+        index=True,
         doc="Build creation timestamp"
     )
     
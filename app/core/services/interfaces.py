@@ -216,7 +216,7 @@ class BuildServiceInterface(ABC):
         pass
 
     @abstractmethod
-    async def create_build(self, build: Build) -> Build:
+    async def create_build(self, build: Build) -> Optional[Build]:
         """
         Create new build with validation.
         
@@ -224,7 +224,7 @@ class BuildServiceInterface(ABC):
             build: Build entity to create
             
         Returns:
-            Created build entity
+            Created build entity, or None if a build with this name exists
             
         Raises:
             TaskNotFoundException: If build references non-existent tasks
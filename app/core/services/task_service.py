@@ -168,10 +168,9 @@ class TaskService(TaskServiceInterface):
         if not task.dependencies:
             return
             
-        all_tasks = await self._task_repository.get_all_tasks()
-        existing_deps = set(all_tasks.keys())
+        existing_deps = await self._task_repository.get_tasks(list(task.dependencies))
         
-        missing_deps = task.dependencies - existing_deps - {task.name}
+        missing_deps = task.dependencies - existing_deps.keys() - {task.name}
         
         if missing_deps:
             raise InvalidTaskDependencyException(task.name, list(missing_deps))
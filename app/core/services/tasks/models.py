@@ -36,6 +36,7 @@ class TaskModel(Base):
         String(50),
         nullable=False,
         default="pending",
+        index=True,
         doc="Current task execution status"
     )
     
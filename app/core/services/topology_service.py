@@ -172,8 +172,8 @@ class TopologyService(TopologyServiceInterface):
             CircularDependencyException: If circular dependencies detected
         """
         build_tasks = set(build.tasks)
-        in_degree = defaultdict(int)
-        graph = defaultdict(set)
+        in_degree: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = defaultdict(list)
         
         for task_name in build.tasks:
             task = tasks[task_name]
@@ -181,8 +181,10 @@ class TopologyService(TopologyServiceInterface):
             in_degree[task_name] = len(build_deps)
             
             for dep in build_deps:
-                graph[dep].add(task_name)
+                dependents[dep].append(task_name)
         
+        # Remaining in-degrees make readiness an O(1) check per edge,
+        # and dependent lists keep the order stable between runs
         queue = deque([task for task in build.tasks if in_degree[task] == 0])
         result = []
         
@@ -190,13 +192,13 @@ class TopologyService(TopologyServiceInterface):
             current = queue.popleft()
             result.append(current)
             
-            for neighbor in graph[current]:
+            for neighbor in dependents.get(current, ()):
                 in_degree[neighbor] -= 1
                 if in_degree[neighbor] == 0:
                     queue.append(neighbor)
         
         if len(result) != len(build.tasks):
-            remaining_tasks = set(build.tasks) - set(result)
+            remaining_tasks = build_tasks.difference(result)
             cycles = self._find_cycles_in_subgraph(remaining_tasks, tasks)
             if cycles:
                 raise CircularDependencyException(cycles[0])
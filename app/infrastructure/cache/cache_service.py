@@ -1,10 +1,11 @@
 """Cache service implementation for build system."""
 
 import hashlib
-import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from datetime import timedelta
 
+import orjson
+
 from app.core.domain.entities import Build, SortedTaskList, Task
 from app.core.domain.enums import SortAlgorithm
 from .redis_client import RedisClient
@@ -41,6 +42,10 @@ class CacheService:
         """Generate cache key for sorted tasks."""
         return f"sorted:{build_name}:{algorithm.value}:{config_hash}"
 
+    def _cycles_cache_key(self, build_name: str, config_hash: str) -> str:
+        """Generate cache key for detected cycles."""
+        return f"cycles:{build_name}:{config_hash}"
+
     def _user_session_key(self, user_id: int) -> str:
         """Generate cache key for user session."""
         return f"session:user:{user_id}"
@@ -58,7 +63,7 @@ class CacheService:
             tasks: Tasks dictionary
             
         Returns:
-            MD5 hash of configuration
+            SHA-256 hex digest of configuration
         """
         config_data = {
             "build_tasks": sorted(build.tasks),
@@ -68,8 +73,9 @@ class CacheService:
             },
         }
         
-        config_str = json.dumps(config_data, sort_keys=True)
-        return hashlib.md5(config_str.encode()).hexdigest()
+        return hashlib.sha256(
+            orjson.dumps(config_data, option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
 
     async def get_sorted_tasks(
         self,
@@ -146,6 +152,51 @@ class CacheService:
         
         return await self._redis.set(cache_key, cache_data, ttl)
 
+    async def get_cycles(
+        self, build: Build, tasks: Dict[str, Task]
+    ) -> Optional[List[List[str]]]:
+        """
+        Get cached cycle detection result.
+        
+        Args:
+            build: Build entity
+            tasks: Tasks dictionary
+            
+        Returns:
+            Cached list of cycles or None if not found
+        """
+        config_hash = self._config_hash(build, tasks)
+        cached_data = await self._redis.get(self._cycles_cache_key(build.name, config_hash))
+        if isinstance(cached_data, list):
+            return cached_data
+        return None
+
+    async def cache_cycles(
+        self,
+        cycles: List[List[str]],
+        build: Build,
+        tasks: Dict[str, Task],
+        ttl: timedelta = timedelta(hours=1),
+    ) -> bool:
+        """
+        Cache cycle detection result.
+        
+        Like sorted tasks, entries are keyed by the configuration hash, so
+        a changed graph never reads a result computed for the old one.
+        
+        Args:
+            cycles: Detected cycles
+            build: Build entity
+            tasks: Tasks dictionary
+            ttl: Cache time-to-live
+            
+        Returns:
+            True if cached successfully, False otherwise
+        """
+        config_hash = self._config_hash(build, tasks)
+        cache_key = self._cycles_cache_key(build.name, config_hash)
+        return await self._redis.set(cache_key, cycles, ttl)
+
     async def get_build(self, build_name: str) -> Optional[Build]:
         """
         Get cached build.
@@ -271,7 +322,9 @@ class CacheService:
         
         status_deleted = await self._redis.delete(self._build_status_key(build_name))
         
-        return build_deleted or sorted_deleted > 0 or status_deleted
+        cycles_deleted = await self._redis.clear_pattern(f"cycles:{build_name}:*")
+        
+        return build_deleted or sorted_deleted > 0 or status_deleted or cycles_deleted > 0
 
     async def invalidate_task(self, task_name: str) -> bool:
         """
@@ -287,7 +340,9 @@ class CacheService:
         
         sorted_deleted = await self._redis.clear_pattern("sorted:*")
         
-        return task_deleted or sorted_deleted > 0
+        cycles_deleted = await self._redis.clear_pattern("cycles:*")
+        
+        return task_deleted or sorted_deleted > 0 or cycles_deleted > 0
 
     async def set_user_session(
         self, user_id: int, session_data: Dict[str, Any], ttl: timedelta = timedelta(hours=24)
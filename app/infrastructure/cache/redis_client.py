@@ -18,37 +18,52 @@ class RedisClient:
     connection pooling, and error handling for enterprise applications.
     """
 
-    def __init__(self, redis_url: Optional[str] = None):
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        max_connections: Optional[int] = None,
+        pool_timeout: Optional[int] = None,
+    ):
         """
         Initialize Redis client.
         
         Args:
             redis_url: Redis connection URL (defaults to settings)
+            max_connections: Connection pool size (defaults to settings)
+            pool_timeout: Seconds to wait for a free pooled connection (defaults to settings)
         """
+        settings = get_settings()
         self._redis: Optional[Redis] = None
-        self._redis_url = redis_url or get_settings().redis_url
+        self._redis_url = redis_url or settings.redis_url
+        self._max_connections = max_connections or settings.redis_max_connections
+        self._pool_timeout = pool_timeout or settings.redis_pool_timeout
 
     async def connect(self) -> None:
         """
         Establish Redis connection.
         
-        Creates connection pool with optimized settings for high performance.
+        Creates a blocking connection pool: connections are opened lazily on
+        first use and reused afterwards, and callers wait for a free
+        connection instead of failing when the pool is exhausted.
         """
         if self._redis is None:
-            self._redis = redis.from_url(
+            pool = redis.BlockingConnectionPool.from_url(
                 self._redis_url,
+                max_connections=self._max_connections,
+                timeout=self._pool_timeout,
                 encoding="utf-8",
                 decode_responses=True,
-                max_connections=20,
                 retry_on_timeout=True,
                 socket_keepalive=True,
                 socket_keepalive_options={},
             )
+            self._redis = Redis(connection_pool=pool)
 
     async def disconnect(self) -> None:
-        """Close Redis connection."""
+        """Close Redis connection and its connection pool."""
         if self._redis:
             await self._redis.close()
+            await self._redis.connection_pool.disconnect()
             self._redis = None
 
     async def get(self, key: str) -> Optional[Any]:
@@ -219,6 +234,32 @@ class RedisClient:
         except Exception:
             return False
 
+    async def check_roundtrip(self, key: str, value: Any) -> bool:
+        """
+        Check that a value can be written, read back and deleted.
+
+        All three commands are sent in one non-transactional pipeline, so
+        the check costs a single round trip.
+
+        Args:
+            key: Temporary key to use
+            value: Value to write
+
+        Returns:
+            True if the value read back matches, False otherwise
+        """
+        await self.connect()
+        try:
+            serialized_value = json.dumps(value, default=str)
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.set(key, serialized_value)
+                pipe.get(key)
+                pipe.delete(key)
+                _, retrieved, _ = await pipe.execute()
+            return retrieved == serialized_value
+        except Exception:
+            return False
+
     async def get_info(self) -> dict:
         """
         Get Redis server information.
@@ -15,6 +15,8 @@ from app.infrastructure.database.repositories.task_repository import SqlTaskRepo
 from app.core.services.configuration_service import ConfigurationService
 from app.settings import get_settings
 
+INFO_TABLES = ("users", "builds", "tasks", "refresh_tokens")
+
 
 async def init_database() -> None:
     """Initialize database with Alembic migrations and load data from YAML files."""
@@ -177,22 +179,18 @@ async def check_database_health() -> bool:
 
 async def get_database_info() -> dict:
     """Get database information and statistics."""
+    # All table counts are fetched in one round trip
+    counts_query = " UNION ALL ".join(
+        f"SELECT '{table}', COUNT(*) FROM {table}" for table in INFO_TABLES
+    )
     try:
         session_maker = get_session_maker()
         async with session_maker() as session:
-            user_count = await session.execute(text("SELECT COUNT(*) FROM users"))
-            build_count = await session.execute(text("SELECT COUNT(*) FROM builds"))
-            task_count = await session.execute(text("SELECT COUNT(*) FROM tasks"))
-            token_count = await session.execute(text("SELECT COUNT(*) FROM refresh_tokens"))
+            result = await session.execute(text(counts_query))
 
             return {
                 "healthy": True,
-                "tables": {
-                    "users": user_count.scalar(),
-                    "builds": build_count.scalar(),
-                    "tasks": task_count.scalar(),
-                    "refresh_tokens": token_count.scalar(),
-                },
+                "tables": {table: count for table, count in result.all()},
                 "engine_info": str(get_session_maker().kw['bind'].url),
             }
     except Exception as e:
@@ -0,0 +1,41 @@
+"""Helpers for Alembic data migrations."""
+
+from typing import Iterator, Sequence
+
+from alembic import op
+from sqlalchemy import Row, Select
+
+
+def batched(query: Select, page: int = 100) -> Iterator[Sequence[Row]]:
+    """
+    Iterate over query results page by page inside a migration.
+
+    Each page is yielded inside ``autocommit_block()`` so writes made by the
+    caller are committed per page instead of in one migration-wide
+    transaction. This keeps memory and lock windows bounded by the page size.
+    The query must have a deterministic ``order_by`` and the caller must not
+    change the columns it orders by, otherwise pages can shift. Rows are
+    read through a live connection, so the helper cannot be used in offline
+    (``--sql``) migrations.
+
+    Args:
+        query: Select statement to paginate
+        page: Number of rows per page
+
+    Yields:
+        Rows of the current page
+    """
+    bind = op.get_bind()
+    offset = 0
+
+    while True:
+        rows = bind.execute(query.limit(page).offset(offset)).fetchall()
+        if not rows:
+            return
+
+        with op.get_context().autocommit_block():
+            yield rows
+
+        if len(rows) < page:
+            return
+        offset += page
@@ -1,8 +1,10 @@
 """SQLAlchemy implementation of build repository."""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, func
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.domain.entities import Build
@@ -85,6 +87,70 @@ class SqlBuildRepository(BuildRepositoryInterface):
             for model in models
         }
 
+    async def paginate_builds(self, limit: int, offset: int) -> Tuple[List[Build], int]:
+        """
+        Retrieve a page of builds ordered by creation time.
+        
+        Args:
+            limit: Maximum number of builds to return
+            offset: Number of builds to skip
+            
+        Returns:
+            Tuple of builds on the page and total number of builds
+        """
+        stmt = (
+            select(BuildModel)
+            .order_by(BuildModel.created_at, BuildModel.name)
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self.session.execute(stmt)
+        models = result.scalars().all()
+        
+        count_result = await self.session.execute(
+            select(func.count()).select_from(BuildModel)
+        )
+        total = count_result.scalar_one()
+        
+        return [self._model_to_entity(model) for model in models], total
+
+    async def create_build(self, build: Build) -> Optional[Build]:
+        """
+        Insert a new build unless one with the same name exists.
+        
+        Uses a single INSERT ... ON CONFLICT DO NOTHING RETURNING statement,
+        so the existence check and the insert cannot race.
+        
+        Args:
+            build: Build entity to create
+            
+        Returns:
+            Created build entity, or None if the name is already taken
+        """
+        if self.session.get_bind().dialect.name == "sqlite":
+            insert = sqlite_insert
+        else:
+            insert = postgresql_insert
+            
+        stmt = (
+            insert(BuildModel)
+            .values(
+                name=build.name,
+                tasks=build.tasks,
+                status=build.status.value,
+                error_message=build.error_message,
+            )
+            .on_conflict_do_nothing(index_elements=[BuildModel.name])
+            .returning(BuildModel)
+        )
+        result = await self.session.execute(stmt)
+        model = result.scalar_one_or_none()
+        
+        if not model:
+            return None
+            
+        return self._model_to_entity(model)
+
     async def save_build(self, build: Build) -> Build:
         """
         Save or update a build.
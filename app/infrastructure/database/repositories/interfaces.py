@@ -1,9 +1,10 @@
 """Repository interface definitions following SOLID principles."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from app.core.domain.entities import Build, SortedTaskList, Task
+from app.core.domain.enums import TaskStatus
 
 
 class TaskRepositoryInterface(ABC):
@@ -51,6 +52,54 @@ class TaskRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def paginate_tasks(self, limit: int, offset: int) -> Tuple[List[Task], int]:
+        """
+        Retrieve a page of tasks ordered by name.
+        
+        Args:
+            limit: Maximum number of tasks to return
+            offset: Number of tasks to skip
+            
+        Returns:
+            Tuple of tasks on the page and total number of tasks
+        """
+        pass
+
+    @abstractmethod
+    async def create_task(self, task: Task) -> Optional[Task]:
+        """
+        Insert a new task unless one with the same name exists.
+        
+        Args:
+            task: Task entity to create
+            
+        Returns:
+            Created task entity, or None if the name is already taken
+        """
+        pass
+
+    @abstractmethod
+    async def patch_task(
+        self,
+        name: str,
+        *,
+        dependencies: Optional[Set[str]] = None,
+        status: Optional[TaskStatus] = None,
+    ) -> Optional[Task]:
+        """
+        Update only the given fields of a task.
+        
+        Args:
+            name: Task name to update
+            dependencies: New task dependencies, unchanged if None
+            status: New task status, unchanged if None
+            
+        Returns:
+            Updated task entity, or None if the task does not exist
+        """
+        pass
+
     @abstractmethod
     async def save_task(self, task: Task) -> None:
         """
@@ -142,6 +191,33 @@ class BuildRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def paginate_builds(self, limit: int, offset: int) -> Tuple[List[Build], int]:
+        """
+        Retrieve a page of builds ordered by creation time.
+        
+        Args:
+            limit: Maximum number of builds to return
+            offset: Number of builds to skip
+            
+        Returns:
+            Tuple of builds on the page and total number of builds
+        """
+        pass
+
+    @abstractmethod
+    async def create_build(self, build: Build) -> Optional[Build]:
+        """
+        Insert a new build unless one with the same name exists.
+        
+        Args:
+            build: Build entity to create
+            
+        Returns:
+            Created build entity, or None if the name is already taken
+        """
+        pass
+
     @abstractmethod
     async def save_build(self, build: Build) -> None:
         """
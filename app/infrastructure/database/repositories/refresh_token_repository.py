@@ -1,12 +1,29 @@
 """Refresh token repository implementation."""
 
-from typing import Optional
-from datetime import datetime
+import hashlib
+from typing import Optional, Tuple
+from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, and_
+from sqlalchemy import delete, insert, literal, select, update, and_
 
-from app.core.auth.entities import RefreshToken
-from app.core.services.auth.models import RefreshTokenModel
+from app.core.auth.entities import RefreshToken, User
+from app.core.services.auth.models import RefreshTokenModel, UserModel
+
+
+def hash_token(token: str) -> bytes:
+    """
+    Compute lookup key of a refresh token.
+
+    Tokens are looked up by their fixed-size SHA-256 digest, which keeps the
+    unique index small regardless of token length.
+
+    Args:
+        token: Refresh token string
+
+    Returns:
+        SHA-256 digest of the token
+    """
+    return hashlib.sha256(token.encode()).digest()
 
 
 class SqlRefreshTokenRepository:
@@ -32,7 +49,7 @@ class SqlRefreshTokenRepository:
             RefreshToken entity if found, None otherwise
         """
         result = await self._session.execute(
-            select(RefreshTokenModel).where(RefreshTokenModel.token == token)
+            select(RefreshTokenModel).where(RefreshTokenModel.token_hash == hash_token(token))
         )
         token_model = result.scalar_one_or_none()
         
@@ -40,6 +57,43 @@ class SqlRefreshTokenRepository:
             return self._model_to_entity(token_model)
         return None
 
+    async def get_refresh_token_with_user(
+        self, token: str
+    ) -> Optional[Tuple[RefreshToken, Optional[User]]]:
+        """
+        Get refresh token together with its owner in one query.
+        
+        Args:
+            token: Refresh token string
+            
+        Returns:
+            RefreshToken entity and owning user (None if the user is gone),
+            or None if the token is not found
+        """
+        result = await self._session.execute(
+            select(RefreshTokenModel, UserModel)
+            .outerjoin(UserModel, UserModel.id == RefreshTokenModel.user_id)
+            .where(RefreshTokenModel.token_hash == hash_token(token))
+        )
+        row = result.one_or_none()
+        
+        if row is None:
+            return None
+        
+        token_model, user_model = row
+        user = None
+        if user_model is not None:
+            user = User.from_trusted(
+                id=user_model.id,
+                username=user_model.username,
+                email=user_model.email,
+                hashed_password=user_model.hashed_password,
+                is_active=user_model.is_active,
+                created_at=user_model.created_at,
+                updated_at=user_model.updated_at,
+            )
+        return self._model_to_entity(token_model), user
+
     async def save_refresh_token(
         self,
         refresh_token: RefreshToken,
@@ -56,6 +110,7 @@ class SqlRefreshTokenRepository:
         token_model = RefreshTokenModel(
             user_id=refresh_token.user_id,
             token=refresh_token.token,
+            token_hash=hash_token(refresh_token.token),
             expires_at=refresh_token.expires_at,
             is_revoked=refresh_token.is_revoked,
         )
@@ -76,12 +131,76 @@ class SqlRefreshTokenRepository:
         """
         result = await self._session.execute(
             update(RefreshTokenModel)
-            .where(RefreshTokenModel.token == token)
+            .where(RefreshTokenModel.token_hash == hash_token(token))
             .values(is_revoked=True)
         )
         
         return result.rowcount > 0
 
+    async def rotate_refresh_token(
+        self, token: str, new_token: str, expires_at: datetime
+    ) -> Optional[RefreshToken]:
+        """
+        Revoke refresh token and save its replacement in one statement.
+        
+        The replacement is inserted from the rows the revoking UPDATE
+        returns, so it belongs to the old token's user, is only saved if
+        the old token was still active, and a token cannot be rotated
+        twice. Data-modifying CTEs require PostgreSQL.
+        
+        Args:
+            token: Refresh token string being replaced
+            new_token: Replacement refresh token string
+            expires_at: Expiration of the replacement token
+            
+        Returns:
+            Saved replacement token, or None if the old token was not active
+        """
+        revoked = (
+            update(RefreshTokenModel)
+            .where(
+                and_(
+                    RefreshTokenModel.token_hash == hash_token(token),
+                    RefreshTokenModel.is_revoked == False
+                )
+            )
+            .values(is_revoked=True)
+            .returning(RefreshTokenModel.user_id)
+            .cte("revoked")
+        )
+        replacement = select(
+            revoked.c.user_id,
+            literal(new_token, RefreshTokenModel.token.type),
+            literal(hash_token(new_token), RefreshTokenModel.token_hash.type),
+            literal(expires_at, RefreshTokenModel.expires_at.type),
+            literal(False, RefreshTokenModel.is_revoked.type),
+        )
+        result = await self._session.execute(
+            insert(RefreshTokenModel)
+            .from_select(
+                ["user_id", "token", "token_hash", "expires_at", "is_revoked"],
+                replacement,
+            )
+            .returning(
+                RefreshTokenModel.id,
+                RefreshTokenModel.user_id,
+                RefreshTokenModel.created_at,
+            )
+        )
+        row = result.one_or_none()
+        
+        if row is None:
+            return None
+        
+        return RefreshToken.from_trusted(
+            id=row.id,
+            user_id=row.user_id,
+            token=new_token,
+            expires_at=expires_at,
+            is_revoked=False,
+            created_at=row.created_at,
+        )
+
     async def revoke_user_tokens(self, user_id: int) -> int:
         """
         Revoke all refresh tokens for a user.
@@ -112,17 +231,13 @@ class SqlRefreshTokenRepository:
         Returns:
             Number of tokens removed
         """
-        now = datetime.utcnow()
         result = await self._session.execute(
-            select(RefreshTokenModel).where(RefreshTokenModel.expires_at < now)
+            delete(RefreshTokenModel).where(
+                RefreshTokenModel.expires_at < datetime.now(timezone.utc)
+            )
         )
-        expired_tokens = result.scalars().all()
-        
-        for token_model in expired_tokens:
-            await self._session.delete(token_model)
-        
-        await self._session.flush()
-        return len(expired_tokens)
+
+        return result.rowcount
 
     def _model_to_entity(self, model: RefreshTokenModel) -> RefreshToken:
         """
@@ -134,7 +249,7 @@ class SqlRefreshTokenRepository:
         Returns:
             RefreshToken domain entity
         """
-        return RefreshToken(
+        return RefreshToken.from_trusted(
             id=model.id,
             user_id=model.user_id,
             token=model.token,
@@ -1,8 +1,10 @@
 """SQLAlchemy implementation of task repository."""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
-from sqlalchemy import select, delete, update
+from sqlalchemy import select, delete, func, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.domain.entities import Task
@@ -85,6 +87,114 @@ class SqlTaskRepository(TaskRepositoryInterface):
             for model in models
         }
 
+    async def paginate_tasks(self, limit: int, offset: int) -> Tuple[List[Task], int]:
+        """
+        Retrieve a page of tasks ordered by name.
+        
+        Args:
+            limit: Maximum number of tasks to return
+            offset: Number of tasks to skip
+            
+        Returns:
+            Tuple of tasks on the page and total number of tasks
+        """
+        stmt = (
+            select(TaskModel)
+            .order_by(TaskModel.name)
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self.session.execute(stmt)
+        models = result.scalars().all()
+        
+        count_result = await self.session.execute(
+            select(func.count()).select_from(TaskModel)
+        )
+        total = count_result.scalar_one()
+        
+        return [self._model_to_entity(model) for model in models], total
+
+    async def create_task(self, task: Task) -> Optional[Task]:
+        """
+        Insert a new task unless one with the same name exists.
+        
+        Uses a single INSERT ... ON CONFLICT DO NOTHING RETURNING statement,
+        so the existence check and the insert cannot race.
+        
+        Args:
+            task: Task entity to create
+            
+        Returns:
+            Created task entity, or None if the name is already taken
+        """
+        if self.session.get_bind().dialect.name == "sqlite":
+            insert = sqlite_insert
+        else:
+            insert = postgresql_insert
+            
+        stmt = (
+            insert(TaskModel)
+            .values(
+                name=task.name,
+                dependencies=list(task.dependencies),
+                status=task.status.value,
+                error_message=task.error_message,
+            )
+            .on_conflict_do_nothing(index_elements=[TaskModel.name])
+            .returning(TaskModel)
+        )
+        result = await self.session.execute(stmt)
+        model = result.scalar_one_or_none()
+        
+        if not model:
+            return None
+            
+        return self._model_to_entity(model)
+
+    async def patch_task(
+        self,
+        name: str,
+        *,
+        dependencies: Optional[Set[str]] = None,
+        status: Optional[TaskStatus] = None,
+    ) -> Optional[Task]:
+        """
+        Update only the given fields of a task.
+        
+        Uses a single UPDATE ... RETURNING statement, so no prior lookup
+        is needed to detect a missing task.
+        
+        Args:
+            name: Task name to update
+            dependencies: New task dependencies, unchanged if None
+            status: New task status, unchanged if None
+            
+        Returns:
+            Updated task entity, or None if the task does not exist
+        """
+        values = {}
+        if dependencies is not None:
+            values["dependencies"] = list(dependencies)
+        if status is not None:
+            values["status"] = status.value
+        
+        if not values:
+            return await self.get_task(name)
+        
+        stmt = (
+            update(TaskModel)
+            .where(TaskModel.name == name)
+            .values(**values)
+            .returning(TaskModel)
+        )
+        result = await self.session.execute(stmt)
+        model = result.scalar_one_or_none()
+        
+        if not model:
+            return None
+            
+        return self._model_to_entity(model)
+
     async def save_task(self, task: Task) -> Task:
         """
         Save or update a task.
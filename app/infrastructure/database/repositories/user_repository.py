@@ -1,6 +1,6 @@
 """User repository implementation."""
 
-from typing import Optional
+from typing import Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
@@ -41,6 +41,28 @@ class SqlUserRepository:
             return self._model_to_entity(user_model)
         return None
 
+    async def get_users_by_ids(self, user_ids: List[int]) -> Dict[int, User]:
+        """
+        Get multiple users by ID with a single query.
+        
+        Args:
+            user_ids: User IDs
+            
+        Returns:
+            Dictionary mapping IDs of found users to entities
+        """
+        if not user_ids:
+            return {}
+            
+        result = await self._session.execute(
+            select(UserModel).where(UserModel.id.in_(user_ids))
+        )
+        
+        return {
+            user_model.id: self._model_to_entity(user_model)
+            for user_model in result.scalars()
+        }
+
     async def get_user_by_username(self, username: str) -> Optional[User]:
         """
         Get user by username.
@@ -160,7 +182,7 @@ class SqlUserRepository:
         Returns:
             User domain entity
         """
-        return User(
+        return User.from_trusted(
             id=model.id,
             username=model.username,
             email=model.email,
@@ -1,6 +1,5 @@
 """Database session management."""
 
-from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from app.settings import get_settings
@@ -14,10 +13,22 @@ def get_engine():
     global _engine
     if _engine is None:
         settings = get_settings()
+        connect_args = {}
+        if settings.database_url.startswith("postgresql+asyncpg"):
+            # PostgreSQL JIT makes asyncpg's type introspection on new
+            # connections very slow and gives nothing for short OLTP queries
+            connect_args["server_settings"] = {"jit": "off"}
+
         _engine = create_async_engine(
             settings.database_url,
             echo=settings.debug,
             future=True,
+            pool_size=settings.max_connections,
+            max_overflow=settings.max_overflow,
+            pool_timeout=settings.connection_timeout,
+            pool_recycle=settings.pool_recycle,
+            pool_pre_ping=True,
+            connect_args=connect_args,
         )
     return _engine
 
@@ -35,25 +46,6 @@ def get_session_maker() -> async_sessionmaker[AsyncSession]:
     return _async_session_maker
 
 
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    """
-    Get database session for dependency injection.
-
-    Yields:
-        AsyncSession: Database session
-    """
-    session_maker = get_session_maker()
-    async with session_maker() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
-
-
 async def close_db_connections():
     """Close all database connections."""
     global _engine, _async_session_maker
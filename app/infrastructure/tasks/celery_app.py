@@ -24,7 +24,7 @@ celery_app.conf.update(
         "app.infrastructure.tasks.build_tasks.*": {"queue": "builds"},
         "app.infrastructure.tasks.task_execution.*": {"queue": "execution"},
         "app.infrastructure.tasks.maintenance_tasks.*": {"queue": "maintenance"},
-        "app.infrastructure.tasks.log_management.*": {"queue": "maintenance"},
+        "app.infrastructure.tasks.log_management.*": {"queue": "logs"},
     },
     
     task_serializer="json",
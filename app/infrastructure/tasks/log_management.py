@@ -28,7 +28,7 @@ class LogManagementTask(Task):
         logger.info(f"Log management task {task_id} completed successfully")
 
 
-@celery_app.task(base=LogManagementTask, bind=True)
+@celery_app.task(base=LogManagementTask, bind=True, ignore_result=True)
 def archive_old_logs(self) -> dict:
     """
     Archive old rotated log files.
@@ -104,7 +104,7 @@ def archive_old_logs(self) -> dict:
         }
 
 
-@celery_app.task(base=LogManagementTask, bind=True)
+@celery_app.task(base=LogManagementTask, bind=True, ignore_result=True)
 def cleanup_old_archives(self, retention_days: int = 7) -> dict:
     """
     Clean up old archived log files.
@@ -224,11 +224,13 @@ def _simulate_upload_to_external_storage(archive_path: Path) -> bool:
         return False
 
 
-@celery_app.task(base=LogManagementTask, bind=True)
-def get_log_statistics(self) -> dict:
+def collect_log_statistics() -> dict:
     """
     Collect statistics about log files and archives.
     
+    Scans the logs directory on disk, so callers in async code should run
+    it in a worker thread.
+    
     Returns:
         Dictionary with log file statistics
     """
@@ -304,6 +306,17 @@ def get_log_statistics(self) -> dict:
         }
 
 
+@celery_app.task(base=LogManagementTask, bind=True)
+def get_log_statistics(self) -> dict:
+    """
+    Collect statistics about log files and archives.
+    
+    Returns:
+        Dictionary with log file statistics
+    """
+    return collect_log_statistics()
+
+
 @celery_app.on_after_configure.connect
 def setup_periodic_tasks(sender, **kwargs):
     """Setup periodic log management tasks."""
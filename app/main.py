@@ -1,14 +1,17 @@
 """Main FastAPI application entry point."""
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+import time
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
+from app.api.dependencies import init_app_services
 from app.api.v1.endpoints.auth.routes import router as auth_router
 from app.api.v1.endpoints.health.routes import router as health_router
 from app.api.v1.endpoints.logs.routes import router as logs_router
@@ -24,47 +27,79 @@ from app.core.exceptions import (
     TaskNotFoundException,
     CircularDependencyException,
 )
-from app.infrastructure.cache.redis_client import get_redis_client
+from app.infrastructure.cache.redis_client import RedisClient, get_redis_client
+from app.infrastructure.database.session import close_db_connections, get_engine
 from app.utils.logging import setup_logging
 from app.settings import get_settings
 
+logger = logging.getLogger("app")
+
+
+async def _init_database() -> None:
+    """Create tables and load initial YAML data using the shared engine."""
+    from app.infrastructure.database.connection import Base
+    from app.infrastructure.services.yaml_loader import load_initial_data_to_db
+
+    # Init DB (without Alembic)
+    engine = get_engine()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    logger.info("Database tables created")
+
+    # Load initial data from YAML files
+    await load_initial_data_to_db(engine)
+    logger.info("Initial data loaded from YAML files")
+
+
+async def _init_redis() -> RedisClient:
+    """Connect the shared Redis client and check it responds."""
+    redis_client = get_redis_client()
+    await redis_client.connect()
+    if await redis_client.ping():
+        logger.info("Redis connection established")
+    else:
+        logger.warning("Redis ping failed")
+    return redis_client
+
+
+async def _prewarm_build_cache(app: FastAPI) -> None:
+    """Load all builds into the build cache in the background."""
+    from app.infrastructure.database.repositories.build_repository import SqlBuildRepository
+
+    try:
+        async with app.state.session_factory() as session:
+            builds = await SqlBuildRepository(session).get_all_builds()
+
+        for build in builds.values():
+            await app.state.cache_service.cache_build(build)
+        logger.info(f"Build cache warmed with {len(builds)} builds")
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        logger.exception("Build cache warm-up failed")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Handle application startup and shutdown events."""
-    logger = logging.getLogger("app")
     logger.info("Starting Saber Build System...")
 
     try:
         setup_logging()
         logger.info("Logging configured")
 
-        settings = get_settings()
-
-        # Init DB (without Alembic)
-        from sqlalchemy.ext.asyncio import create_async_engine
-        from app.infrastructure.database.connection import Base
-
-        engine = create_async_engine(settings.database_url)
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-        await engine.dispose()
-        logger.info("Database tables created")
-
-        # Redis init
-        redis_client = get_redis_client()
-        await redis_client.connect()
-        if await redis_client.ping():
-            logger.info("Redis connection established")
-        else:
-            logger.warning("Redis ping failed")
+        # Database and Redis do not depend on each other
+        _, redis_client = await asyncio.gather(
+            _init_database(),
+            _init_redis(),
+        )
 
         app.state.redis_client = redis_client
+        init_app_services(app, redis_client)
+        logger.info("Application services initialized")
 
-        # Load initial data from YAML files
-        from app.infrastructure.services.yaml_loader import load_initial_data_to_db
-        await load_initial_data_to_db(engine)
-        logger.info("Initial data loaded from YAML files")
+        # Not needed to serve requests, so do not delay readiness
+        app.state.prewarm_task = asyncio.create_task(_prewarm_build_cache(app))
 
         logger.info("Saber Build System started successfully")
 
@@ -76,11 +111,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     logger.info("Shutting down Saber Build System...")
 
+    prewarm_task = getattr(app.state, "prewarm_task", None)
+    if prewarm_task and not prewarm_task.done():
+        prewarm_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await prewarm_task
+
     try:
         redis_client = getattr(app.state, "redis_client", None)
         if redis_client:
             await redis_client.disconnect()
             logger.info("Redis connection closed")
+
+        await close_db_connections()
+        logger.info("Database connections closed")
     except Exception as e:
         logger.exception("Shutdown error")
 
@@ -96,6 +140,7 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
 
@@ -130,7 +175,7 @@ def register_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(DomainException)
     async def domain_exception_handler(request: Request, exc: DomainException):
         """Handle custom domain exceptions."""
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"error": exc.message, "type": exc.__class__.__name__},
         )
@@ -138,7 +183,7 @@ def register_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(BuildNotFoundException)
     async def build_not_found_handler(request: Request, exc: BuildNotFoundException):
         """Handle build not found exceptions."""
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content={"error": str(exc), "type": "BuildNotFound"},
         )
@@ -146,7 +191,7 @@ def register_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(TaskNotFoundException)
     async def task_not_found_handler(request: Request, exc: TaskNotFoundException):
         """Handle task not found exceptions."""
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content={"error": str(exc), "type": "TaskNotFound"},
         )
@@ -154,7 +199,7 @@ def register_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(CircularDependencyException)
     async def circular_dependency_handler(request: Request, exc: CircularDependencyException):
         """Handle circular dependency exceptions."""
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"error": exc.message, "cycle": exc.cycle, "type": "CircularDependency"},
         )
@@ -162,7 +207,7 @@ def register_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
         """Handle FastAPI HTTP exceptions."""
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={"error": exc.detail, "type": "HTTPException"},
         )
@@ -170,10 +215,9 @@ def register_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception):
         """Handle general exceptions."""
-        logger = logging.getLogger("app")
         logger.error(f"Unhandled exception: {exc}", exc_info=True)
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"error": "Internal server error", "type": "InternalError"},
         )
@@ -185,9 +229,6 @@ def register_middleware(app: FastAPI) -> None:
     @app.middleware("http")
     async def logging_middleware(request: Request, call_next):
         """Log all HTTP requests."""
-        logger = logging.getLogger("app")
-
-        import time
         start_time = request.state.start_time = time.time()
         client_ip = request.client.host if request.client else "unknown"
 
@@ -245,4 +286,6 @@ if __name__ == "__main__":
         port=settings.port,
         reload=settings.debug,
         log_level=settings.log_level.lower(),
+        loop="uvloop",
+        http="httptools",
     )
\ No newline at end of file
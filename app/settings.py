@@ -1,6 +1,6 @@
 """Application settings and configuration."""
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
 from pydantic import Field, computed_field
 from pydantic_settings import BaseSettings
@@ -22,7 +22,7 @@ class Settings(BaseSettings):
 
     # Computed database URL
     @computed_field
-    @property
+    @cached_property
     def database_url(self) -> str:
         return (
             f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}"
@@ -31,6 +31,8 @@ class Settings(BaseSettings):
 
     # Redis settings
     redis_url: str = Field("redis://localhost:6379")
+    redis_max_connections: int = Field(50)
+    redis_pool_timeout: int = Field(20)
 
     # JWT settings
     jwt_secret_key: str = Field("your-secret-key-change-in-production")
@@ -59,7 +61,9 @@ class Settings(BaseSettings):
 
     # Performance settings
     max_connections: int = Field(20)
+    max_overflow: int = Field(10)
     connection_timeout: int = Field(30)
+    pool_recycle: int = Field(1800)
 
     # File paths
     config_dir: str = Field("./config")
@@ -71,6 +75,7 @@ class Settings(BaseSettings):
         "env_file_encoding": "utf-8",
         "case_sensitive": False,
         "extra": "forbid",
+        "frozen": True,
     }
 
 
@@ -0,0 +1,25 @@
+"""Timestamp helpers for API responses."""
+
+import time
+from datetime import datetime, timezone
+from typing import Tuple
+
+_timestamp_cache: Tuple[float, str] = (0.0, "")
+
+
+def utc_now_iso() -> str:
+    """
+    Get current UTC timestamp in ISO format.
+
+    The string is rebuilt at most once per second, which is enough
+    precision for informational response timestamps.
+
+    Returns:
+        ISO timestamp with trailing "Z"
+    """
+    global _timestamp_cache
+    now = time.time()
+    if now - _timestamp_cache[0] >= 1.0:
+        timestamp = datetime.fromtimestamp(now, timezone.utc).isoformat()
+        _timestamp_cache = (now, timestamp.replace("+00:00", "Z"))
+    return _timestamp_cache[1]
@@ -71,11 +71,6 @@ def client():
     """Create test client with mocked dependencies."""
     from tests.integration.test_app import create_test_app
     
-    # Reset cached services before each test
-    import app.api.dependencies as deps
-    deps._auth_service = None
-    deps._build_service = None
-    
     # Create test app without database initialization
     app = create_test_app()
     
@@ -167,6 +162,7 @@ def mock_build_service():
     service.delete_build = AsyncMock()
     service.execute_build = AsyncMock()
     service.get_all_builds = AsyncMock()
+    service.paginate_builds = AsyncMock()
     service.get_build_status = AsyncMock()
     service.get_build_logs = AsyncMock()
     
@@ -174,6 +170,9 @@ def mock_build_service():
     service._task_repository = AsyncMock()
     service._task_repository.get_task = AsyncMock()
     service._task_repository.get_all_tasks = AsyncMock()
+    service._task_repository.paginate_tasks = AsyncMock()
+    service._task_repository.create_task = AsyncMock()
+    service._task_repository.patch_task = AsyncMock()
     service._task_repository.save_task = AsyncMock()
     service._task_repository.delete_task = AsyncMock()
     
@@ -210,6 +209,28 @@ def override_get_db(client, async_test_db):
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def record_commit_and_cache(client):
+    """Override database session and Redis client, recording their calls in order."""
+    app = client.app
+    calls = []
+    
+    session = AsyncMock()
+    session.commit.side_effect = lambda: calls.append("commit")
+    redis_client = AsyncMock()
+    redis_client.clear_pattern.side_effect = lambda pattern: calls.append(f"clear {pattern}")
+    
+    async def _override_get_db():
+        yield session
+    
+    from app.api.dependencies import get_database_session
+    app.dependency_overrides[get_database_session] = _override_get_db
+    app.state.redis_client = redis_client
+    yield calls
+    del app.state.redis_client
+    app.dependency_overrides.clear()
+
+
 @pytest.fixture
 def override_auth_dependency(client, mock_auth_service):
     """Override authentication service dependency."""
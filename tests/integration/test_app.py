@@ -4,6 +4,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1.endpoints.auth.routes import router as auth_router
 from app.api.v1.endpoints.health.routes import router as health_router
@@ -33,6 +34,7 @@ def create_test_app() -> FastAPI:
         title="Saber Build System Test",
         description="Test instance",
         version="1.0.0",
+        default_response_class=ORJSONResponse,
         lifespan=_test_lifespan,
     )
     
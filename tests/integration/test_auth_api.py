@@ -219,9 +219,8 @@ class TestAuthAPI:
         )
         
         # Verify response
-        assert response.status_code == 200
-        data = response.json()
-        assert "Tokens revoked successfully" in data["message"]
+        assert response.status_code == 204
+        assert response.content == b""
         
         # Verify service was called
         override_auth_dependency.revoke_user_tokens.assert_called_once_with(
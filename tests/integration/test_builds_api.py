@@ -8,7 +8,6 @@ class TestBuildsAPI:
                                   mock_build):
         """Test successful build creation."""
         # Setup mocks
-        override_build_dependency.get_build.return_value = None  # Build doesn't exist
         override_build_dependency.create_build.return_value = mock_build
 
         # Make request
@@ -28,15 +27,48 @@ class TestBuildsAPI:
         assert data["tasks"] == ["task1", "task2", "task3"]
         assert data["status"] == "pending"
 
-        # Verify service was called
-        override_build_dependency.get_build.assert_called_once_with("test_build")
+        # Verify existence check is folded into the insert
+        override_build_dependency.get_build.assert_not_called()
         override_build_dependency.create_build.assert_called_once()
 
+    def test_create_build_commits_before_clearing_cache(self, client, override_build_dependency,
+                                                        override_current_user, auth_headers,
+                                                        mock_build, record_commit_and_cache):
+        """Test that cached build responses are dropped only after the commit."""
+        override_build_dependency.create_build.return_value = mock_build
+
+        response = client.post(
+            "/api/v1/builds",
+            json={"name": "test_build", "tasks": ["task1"]},
+            headers=auth_headers
+        )
+
+        assert response.status_code == 201
+        assert record_commit_and_cache[:2] == ["commit", "clear saber:builds:*"]
+
+    def test_create_build_deduplicates_tasks(self, client, override_build_dependency, override_current_user,
+                                             auth_headers, mock_build):
+        """Test that repeated and blank task names are dropped before creation."""
+        override_build_dependency.create_build.return_value = mock_build
+
+        response = client.post(
+            "/api/v1/builds",
+            json={
+                "name": "test_build",
+                "tasks": ["task1", " task2 ", "task1", "", "task2", "task3"]
+            },
+            headers=auth_headers
+        )
+
+        assert response.status_code == 201
+        build = override_build_dependency.create_build.call_args.args[0]
+        assert build.tasks == ["task1", "task2", "task3"]
+
     def test_create_build_already_exists(self, client, override_build_dependency, override_current_user, auth_headers,
                                          mock_build):
         """Test creating build that already exists."""
-        # Setup mock - build already exists
-        override_build_dependency.get_build.return_value = mock_build
+        # Setup mock - insert conflicts with an existing build
+        override_build_dependency.create_build.return_value = None
 
         # Make request
         response = client.post(
@@ -120,7 +152,7 @@ class TestBuildsAPI:
                                  mock_build):
         """Test listing builds."""
         # Setup mock
-        override_build_dependency.get_all_builds.return_value = {"test_build": mock_build}
+        override_build_dependency.paginate_builds.return_value = ([mock_build], 1)
 
         # Make request
         response = client.get("/api/v1/builds", headers=auth_headers)
@@ -133,12 +165,12 @@ class TestBuildsAPI:
         assert data["builds"][0]["name"] == "test_build"
 
         # Verify service was called
-        override_build_dependency.get_all_builds.assert_called_once()
+        override_build_dependency.paginate_builds.assert_called_once_with(50, 0)
 
     def test_list_builds_empty(self, client, override_build_dependency, override_current_user, auth_headers):
         """Test listing builds when none exist."""
         # Setup mock
-        override_build_dependency.get_all_builds.return_value = {}
+        override_build_dependency.paginate_builds.return_value = ([], 0)
 
         # Make request
         response = client.get("/api/v1/builds", headers=auth_headers)
@@ -154,15 +186,15 @@ class TestBuildsAPI:
         """Test listing builds with pagination."""
         # Setup mock - create multiple builds
         from app.core.domain.entities import Build
-        builds = {
-            f"build_{i}": Build(
+        builds = [
+            Build(
                 name=f"build_{i}",
                 tasks=mock_build.tasks,
                 status=mock_build.status
             )
-            for i in range(20)
-        }
-        override_build_dependency.get_all_builds.return_value = builds
+            for i in range(10, 15)
+        ]
+        override_build_dependency.paginate_builds.return_value = (builds, 20)
 
         # Make request with pagination
         response = client.get(
@@ -176,8 +208,8 @@ class TestBuildsAPI:
         assert data["total"] == 20
         assert len(data["builds"]) == 5  # Limited to 5
 
-        # Verify service was called
-        override_build_dependency.get_all_builds.assert_called_once()
+        # Verify pagination was pushed down to the service
+        override_build_dependency.paginate_builds.assert_called_once_with(5, 10)
 
     def test_list_builds_no_auth(self, client):
         """Test listing builds without authentication."""
@@ -30,7 +30,7 @@ class TestGetBuildStatusAPI:
         
         assert data["build_name"] == "make_tests"
         assert data["status"] == "pending"
-        assert "created_at" in data
+        assert data["created_at"].endswith("Z")
         assert data["tasks"] == ["compile_exe", "pack_build"]
         assert data["task_statuses"] == {"compile_exe": "pending", "pack_build": "pending"}
         
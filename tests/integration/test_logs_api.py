@@ -6,11 +6,10 @@ from unittest.mock import Mock, patch
 class TestLogsAPI:
     """Test logs management API endpoints."""
     
-    @patch('app.api.v1.endpoints.logs.routes.get_log_statistics')
+    @patch('app.api.v1.endpoints.logs.routes.collect_log_statistics')
     def test_logs_statistics_success(self, mock_task, authenticated_client):
         """Test successful log statistics retrieval."""
-        mock_result = Mock()
-        mock_result.result = {
+        mock_task.return_value = {
             "task": "get_log_statistics",
             "timestamp": "2025-07-26T12:00:00Z",
             "logs_directory": "/app/logs",
@@ -32,8 +31,6 @@ class TestLogsAPI:
             "archives": {}
         }
         
-        mock_task.apply.return_value = mock_result
-        
         response = authenticated_client.get("/api/v1/logs/statistics")
         
         assert response.status_code == 200
@@ -45,7 +42,7 @@ class TestLogsAPI:
         assert "current_logs" in data
         
         # Verify mock was called
-        mock_task.apply.assert_called_once()
+        mock_task.assert_called_once_with()
     
     def test_logs_statistics_unauthorized(self, client):
         """Test log statistics without authentication."""
@@ -172,10 +169,10 @@ class TestLogsAPI:
         data = response.json()
         assert data["retention_days"] == -1
     
-    @patch('app.api.v1.endpoints.logs.routes.get_log_statistics')
+    @patch('app.api.v1.endpoints.logs.routes.collect_log_statistics')
     def test_logs_statistics_celery_error(self, mock_task, authenticated_client):
         """Test log statistics when Celery task fails."""
-        mock_task.apply.side_effect = Exception("Celery error")
+        mock_task.side_effect = Exception("Celery error")
         
         # This test verifies that Celery errors propagate correctly
         # In real environment, the exception would be caught by FastAPI
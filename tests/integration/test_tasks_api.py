@@ -9,8 +9,7 @@ class TestTasksAPI:
     def test_create_task_success(self, client, override_build_dependency, override_current_user, auth_headers, mock_task):
         """Test successful task creation."""
         # Setup mocks
-        override_build_dependency._task_repository.get_task.return_value = None  # Task doesn't exist
-        override_build_dependency._task_repository.save_task.return_value = mock_task
+        override_build_dependency._task_repository.create_task.return_value = mock_task
         
         # Make request
         response = client.post(
@@ -30,13 +29,13 @@ class TestTasksAPI:
         assert data["status"] == "pending"
         
         # Verify service was called
-        override_build_dependency._task_repository.get_task.assert_called_once_with("test_task")
-        override_build_dependency._task_repository.save_task.assert_called_once()
+        override_build_dependency._task_repository.create_task.assert_called_once()
+        override_build_dependency._task_repository.get_task.assert_not_called()
     
     def test_create_task_already_exists(self, client, override_build_dependency, override_current_user, auth_headers, mock_task):
         """Test creating task that already exists."""
         # Setup mock - task already exists
-        override_build_dependency._task_repository.get_task.return_value = mock_task
+        override_build_dependency._task_repository.create_task.return_value = None
         
         # Make request
         response = client.post(
@@ -78,6 +77,38 @@ class TestTasksAPI:
         
         assert response.status_code == 422
     
+    def test_create_task_self_dependency(self, client, override_build_dependency, override_current_user, auth_headers):
+        """Test creating task that depends on itself."""
+        response = client.post(
+            "/api/v1/tasks",
+            json={
+                "name": "test_task",
+                "dependencies": ["dep1", " test_task "]
+            },
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 422
+        override_build_dependency._task_repository.create_task.assert_not_called()
+    
+    def test_create_task_deduplicates_dependencies(self, client, override_build_dependency, override_current_user,
+                                                   auth_headers, mock_task):
+        """Test that repeated and blank dependencies are dropped before creation."""
+        override_build_dependency._task_repository.create_task.return_value = mock_task
+        
+        response = client.post(
+            "/api/v1/tasks",
+            json={
+                "name": "test_task",
+                "dependencies": ["dep1", " dep2 ", "dep1", "", "dep2"]
+            },
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 201
+        task = override_build_dependency._task_repository.create_task.call_args.args[0]
+        assert task.dependencies == {"dep1", "dep2"}
+    
     def test_get_task_success(self, client, override_build_dependency, override_current_user, auth_headers, mock_task):
         """Test successful task retrieval."""
         # Setup mock
@@ -118,7 +149,7 @@ class TestTasksAPI:
     def test_list_tasks_success(self, client, override_build_dependency, override_current_user, auth_headers, mock_task):
         """Test listing tasks."""
         # Setup mock
-        override_build_dependency._task_repository.get_all_tasks.return_value = {"test_task": mock_task}
+        override_build_dependency._task_repository.paginate_tasks.return_value = ([mock_task], 1)
         
         # Make request
         response = client.get("/api/v1/tasks", headers=auth_headers)
@@ -131,12 +162,12 @@ class TestTasksAPI:
         assert data["tasks"][0]["name"] == "test_task"
         
         # Verify service was called
-        override_build_dependency._task_repository.get_all_tasks.assert_called_once()
+        override_build_dependency._task_repository.paginate_tasks.assert_called_once_with(50, 0)
     
     def test_list_tasks_empty(self, client, override_build_dependency, override_current_user, auth_headers):
         """Test listing tasks when none exist."""
         # Setup mock
-        override_build_dependency._task_repository.get_all_tasks.return_value = {}
+        override_build_dependency._task_repository.paginate_tasks.return_value = ([], 0)
         
         # Make request
         response = client.get("/api/v1/tasks", headers=auth_headers)
@@ -151,15 +182,15 @@ class TestTasksAPI:
         """Test listing tasks with pagination."""
         # Setup mock - create multiple tasks
         from app.core.domain.entities import Task
-        tasks = {
-            f"task_{i}": Task(
+        tasks = [
+            Task(
                 name=f"task_{i}",
                 dependencies=set(),
                 status=TaskStatus.PENDING
             ) 
-            for i in range(20)
-        }
-        override_build_dependency._task_repository.get_all_tasks.return_value = tasks
+            for i in range(10, 15)
+        ]
+        override_build_dependency._task_repository.paginate_tasks.return_value = (tasks, 20)
         
         # Make request with pagination
         response = client.get(
@@ -173,8 +204,8 @@ class TestTasksAPI:
         assert data["total"] == 20
         assert len(data["tasks"]) == 5  # Limited to 5
         
-        # Verify service was called
-        override_build_dependency._task_repository.get_all_tasks.assert_called_once()
+        # Verify pagination is pushed down to the repository
+        override_build_dependency._task_repository.paginate_tasks.assert_called_once_with(5, 10)
     
     def test_list_tasks_no_auth(self, client):
         """Test listing tasks without authentication."""
@@ -184,9 +215,6 @@ class TestTasksAPI:
     
     def test_update_task_success(self, client, override_build_dependency, override_current_user, auth_headers, mock_task):
         """Test successful task update."""
-        # Setup mock - task exists
-        override_build_dependency._task_repository.get_task.return_value = mock_task
-        
         # Create updated task
         from app.core.domain.entities import Task
         updated_task = Task(
@@ -194,7 +222,7 @@ class TestTasksAPI:
             dependencies={"dep1", "dep2"},
             status=TaskStatus.RUNNING
         )
-        override_build_dependency._task_repository.save_task.return_value = updated_task
+        override_build_dependency._task_repository.patch_task.return_value = updated_task
         
         # Make request
         response = client.put(
@@ -214,13 +242,40 @@ class TestTasksAPI:
         assert data["status"] == "running"
         
         # Verify service was called
-        override_build_dependency._task_repository.get_task.assert_called_with("test_task")
-        override_build_dependency._task_repository.save_task.assert_called_once()
+        override_build_dependency._task_repository.patch_task.assert_called_once_with(
+            "test_task",
+            dependencies={"dep1", "dep2"},
+            status=TaskStatus.RUNNING,
+        )
+        override_build_dependency._task_repository.get_task.assert_not_called()
+    
+    def test_update_task_commits_before_clearing_cache(self, client, override_build_dependency,
+                                                       override_current_user, auth_headers,
+                                                       mock_task, record_commit_and_cache):
+        """Test that cached task data is dropped only after the commit."""
+        override_build_dependency._task_repository.patch_task.return_value = mock_task
+        override_build_dependency.invalidate_task_cache.side_effect = (
+            lambda name: record_commit_and_cache.append(f"invalidate {name}")
+        )
+        
+        response = client.put(
+            "/api/v1/tasks/test_task",
+            json={"status": "completed"},
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 200
+        assert record_commit_and_cache[:4] == [
+            "commit",
+            "invalidate test_task",
+            "clear saber:tasks:*",
+            "clear saber:topology:*",
+        ]
     
     def test_update_task_not_found(self, client, override_build_dependency, override_current_user, auth_headers):
         """Test updating non-existent task."""
         # Setup mock - task doesn't exist
-        override_build_dependency._task_repository.get_task.return_value = None
+        override_build_dependency._task_repository.patch_task.return_value = None
         
         # Make request
         response = client.put(
@@ -159,7 +159,7 @@ class TestTopologyAPI:
             "task3": Task(name="task3", dependencies={"task2"}, status=TaskStatus.PENDING),
         }
         
-        override_build_dependency._task_repository.get_task.side_effect = lambda name: tasks.get(name)
+        override_build_dependency._task_repository.get_tasks.return_value = tasks
         
         # Mock topological sort result
         from app.core.domain.entities import SortedTaskList
@@ -188,7 +188,11 @@ class TestTopologyAPI:
         
         # Verify service was called
         override_build_dependency.get_build.assert_called_once_with("test_build")
-        override_build_dependency.detect_cycles.assert_called_once_with("test_build")
+        override_build_dependency.detect_cycles.assert_called_once_with("test_build", tasks)
+        override_build_dependency._task_repository.get_tasks.assert_called_once_with(
+            ["task1", "task2", "task3"]
+        )
+        override_build_dependency._task_repository.get_task.assert_not_called()
     
     def test_validate_build_dependencies_with_cycles(self, client, override_build_dependency, override_current_user, auth_headers):
         """Test validation when build has circular dependencies."""
@@ -208,7 +212,7 @@ class TestTopologyAPI:
             "task2": Task(name="task2", dependencies={"task1"}, status=TaskStatus.PENDING),
         }
         
-        override_build_dependency._task_repository.get_task.side_effect = lambda name: tasks.get(name)
+        override_build_dependency._task_repository.get_tasks.return_value = tasks
         
         # Make request
         response = client.get("/api/v1/topology/validate/cyclic_build", headers=auth_headers)
@@ -243,7 +247,7 @@ class TestTopologyAPI:
             "task2": Task(name="task2", dependencies={"task1"}, status=TaskStatus.PENDING),
         }
         
-        override_build_dependency._task_repository.get_task.side_effect = lambda name: tasks.get(name)
+        override_build_dependency._task_repository.get_tasks.return_value = tasks
         
         # Make request
         response = client.get("/api/v1/topology/validate/incomplete_build", headers=auth_headers)
@@ -0,0 +1,109 @@
+"""Tests for batched user lookups."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+from app.core.auth.batching import BatchedUserRepository, UserBatchLoader
+from app.core.auth.entities import User
+
+
+def _user(user_id: int) -> User:
+    """Create user entity with given ID."""
+    return User(
+        id=user_id,
+        username=f"user{user_id}",
+        email=f"user{user_id}@example.com",
+        hashed_password="hashed_password",
+    )
+
+
+class TestUserBatchLoader:
+    """Test cases for UserBatchLoader."""
+
+    @pytest.mark.asyncio
+    async def test_idle_lookup_is_sent_without_waiting(self):
+        """Test that a lookup is dispatched at once when no batch is running."""
+        load_users = AsyncMock(return_value={1: _user(1)})
+        loader = UserBatchLoader(load_users, max_wait=60)
+
+        user = await asyncio.wait_for(loader.load(1), timeout=1)
+
+        assert user.id == 1
+        load_users.assert_awaited_once_with([1])
+
+    @pytest.mark.asyncio
+    async def test_lookups_during_running_batch_share_one_query(self):
+        """Test that lookups arriving while a query runs are batched together."""
+        first_batch_started = asyncio.Event()
+        release_first_batch = asyncio.Event()
+        calls = []
+
+        async def load_users(user_ids):
+            calls.append(user_ids)
+            if len(calls) == 1:
+                first_batch_started.set()
+                await release_first_batch.wait()
+            return {i: _user(i) for i in user_ids if i != 3}
+
+        loader = UserBatchLoader(load_users)
+        first = asyncio.ensure_future(loader.load(1))
+        await first_batch_started.wait()
+
+        results = asyncio.gather(
+            loader.load(2), loader.load(1), loader.load(3)
+        )
+        release_first_batch.set()
+
+        assert [user.id if user else None for user in await results] == [2, 1, None]
+        assert (await first).id == 1
+        assert calls == [[1], [2, 1, 3]]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_sent_without_waiting(self):
+        """Test that reaching the batch size dispatches during a running batch."""
+        release_first_batch = asyncio.Event()
+        calls = []
+
+        async def load_users(user_ids):
+            calls.append(user_ids)
+            if len(calls) == 1:
+                await release_first_batch.wait()
+            return {i: _user(i) for i in user_ids}
+
+        loader = UserBatchLoader(load_users, max_batch_size=2, max_wait=60)
+        first = asyncio.ensure_future(loader.load(1))
+        await asyncio.sleep(0)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(loader.load(2), loader.load(3)), timeout=1
+        )
+
+        assert [user.id for user in results] == [2, 3]
+        assert calls == [[1], [2, 3]]
+        release_first_batch.set()
+        assert (await first).id == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self):
+        """Test that a failed bulk query fails all waiting lookups."""
+        loader = UserBatchLoader(AsyncMock(side_effect=RuntimeError("db down")))
+
+        results = await asyncio.gather(
+            loader.load(1), loader.load(2), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_repository_routes_id_lookups_through_loader(self):
+        """Test that only ID lookups go through the batch loader."""
+        repository = AsyncMock()
+        repository.get_user_by_username.return_value = _user(1)
+        load_users = AsyncMock(return_value={1: _user(1)})
+        batched = BatchedUserRepository(repository, UserBatchLoader(load_users))
+
+        assert (await batched.get_user_by_id(1)).id == 1
+        assert (await batched.get_user_by_username("user1")).id == 1
+        repository.get_user_by_id.assert_not_called()
+        load_users.assert_awaited_once_with([1])
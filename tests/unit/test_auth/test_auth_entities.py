@@ -1,7 +1,7 @@
 """Tests for authentication entities."""
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from app.core.auth.entities import User, RefreshToken, TokenPair, TokenPayload
 
@@ -78,6 +78,27 @@ class TestUser:
         assert user.created_at is None
         assert user.updated_at is None
 
+    def test_user_from_trusted_matches_constructor(self):
+        """Test that trusted construction builds an equal user."""
+        kwargs = dict(
+            id=1,
+            username="testuser",
+            email="test@example.com",
+            hashed_password="hashed_password_123",
+        )
+
+        assert User.from_trusted(**kwargs) == User(**kwargs)
+
+    def test_user_hash_uses_id_and_keeps_field_equality(self):
+        """Test that users hash by ID while equality still compares fields."""
+        user = User(id=1, username="testuser", email="test@example.com", hashed_password="hash")
+        renamed = User(id=1, username="renamed", email="test@example.com", hashed_password="hash")
+
+        assert hash(user) == hash(renamed) == hash(1)
+        assert user != renamed
+        same = User(id=1, username="testuser", email="test@example.com", hashed_password="hash")
+        assert {user: "cached"}[same] == "cached"
+
 
 class TestRefreshToken:
     """Test cases for RefreshToken entity."""
@@ -137,6 +158,25 @@ class TestRefreshToken:
         assert expired_token.is_expired() is True
         assert valid_token.is_expired() is False
 
+    def test_refresh_token_is_expired_timezone_aware(self):
+        """Test expiration check for timezone-aware expiration times."""
+        expired_token = RefreshToken(
+            id=1,
+            user_id=123,
+            token="expired_token",
+            expires_at=datetime.now(timezone.utc) - timedelta(minutes=1),
+        )
+        
+        valid_token = RefreshToken(
+            id=2,
+            user_id=123,
+            token="valid_token",
+            expires_at=datetime.now(timezone.utc) + timedelta(minutes=1),
+        )
+        
+        assert expired_token.is_expired() is True
+        assert valid_token.is_expired() is False
+
     def test_refresh_token_is_valid(self):
         """Test refresh token validity check."""
         valid_token = RefreshToken(
@@ -167,6 +207,21 @@ class TestRefreshToken:
         assert expired_token.is_valid() is False
         assert revoked_token.is_valid() is False
 
+    def test_refresh_token_from_trusted(self):
+        """Test that trusted construction keeps expiration checks working."""
+        expires_at = datetime.utcnow() - timedelta(minutes=1)
+        token = RefreshToken.from_trusted(
+            id=1,
+            user_id=123,
+            token="expired_token",
+            expires_at=expires_at,
+        )
+
+        assert token == RefreshToken(
+            id=1, user_id=123, token="expired_token", expires_at=expires_at
+        )
+        assert token.is_expired() is True
+
 
 class TestTokenPair:
     """Test cases for TokenPair entity."""
@@ -1,7 +1,8 @@
 """Tests for authentication services."""
 
+import threading
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, patch
 
 from app.core.auth.entities import User, RefreshToken, TokenPair
@@ -14,6 +15,13 @@ from app.core.auth.exceptions import (
     UserAlreadyExistsException,
     InactiveUserException,
 )
+from app.core.auth.cache import (
+    AccessTokenCache,
+    CachedUserRepository,
+    TokenPayloadCache,
+    TokenUserCache,
+    UserLookupCache,
+)
 from app.core.auth.services import PasswordService, TokenService, AuthenticationService
 
 
@@ -81,6 +89,12 @@ class TestPasswordService:
         assert hashed.startswith("$2b$")
         assert len(hashed) > 50
 
+    def test_hash_password_uses_configured_rounds(self):
+        """Test that bcrypt cost factor is configurable."""
+        hashed = PasswordService(rounds=4).hash_password("test_password_123")
+        
+        assert hashed.startswith("$2b$04$")
+
     def test_verify_password_correct(self, password_service):
         """Test password verification with correct password."""
         password = "test_password_123"
@@ -106,6 +120,23 @@ class TestPasswordService:
         assert password_service.verify_password(password, hash1) is True
         assert password_service.verify_password(password, hash2) is True
 
+    @pytest.mark.asyncio
+    async def test_hash_and_verify_password_async(self, password_service):
+        """Test hashing and verification in the password worker pool."""
+        password = "test_password_123"
+        hashed = await password_service.hash_password_async(password)
+        
+        assert hashed.startswith("$2b$")
+        assert await password_service.verify_password_async(password, hashed) is True
+        assert await password_service.verify_password_async("wrong", hashed) is False
+
+    def test_dummy_hash_matches_cost_factor(self):
+        """Test that dummy hash costs as much as a real password hash."""
+        password_service = PasswordService(rounds=4)
+        
+        assert password_service.dummy_hash.startswith("$2b$04$")
+        assert password_service.verify_password("password", password_service.dummy_hash) is False
+
 
 class TestTokenService:
     """Test cases for TokenService."""
@@ -167,16 +198,169 @@ class TestTokenService:
             token_service.decode_token("invalid.jwt.token")
 
     @patch('app.core.auth.services.get_settings')
-    def test_decode_token_expired(self, mock_settings, token_service):
+    def test_decode_token_expired(self, mock_settings, token_service, mock_user):
         """Test expired token decoding."""
         mock_settings.return_value.jwt_secret_key = "test_secret"
         
-        from jose import JWTError
-        with patch('app.core.auth.services.jwt.decode') as mock_decode:
-            mock_decode.side_effect = JWTError("Token has expired")
-            
+        with patch('app.core.auth.services.time.time', return_value=1_000_000):
+            token = token_service.create_access_token(mock_user)
+        
+        with pytest.raises(ExpiredTokenException):
+            token_service.decode_token(token)
+
+    def test_decode_token_wrong_key(self, token_service, mock_user):
+        """Test that tokens signed with another key are rejected."""
+        from jose import jwk
+        
+        token = token_service.create_access_token(mock_user)
+        token_service._signing_key = jwk.construct("other_secret", "HS256")
+        
+        with pytest.raises(InvalidTokenException):
+            token_service.decode_token(token)
+
+    def test_decode_token_tampered_claims(self, token_service, mock_user):
+        """Test that changed claims fail signature verification."""
+        from jose.utils import base64url_encode
+
+        header, _, signature = token_service.create_access_token(mock_user).split(".")
+        claims = base64url_encode(b'{"sub":"2","username":"admin","exp":9999999999,"iat":0}')
+
+        with pytest.raises(InvalidTokenException):
+            token_service.decode_token(f"{header}.{claims.decode()}.{signature}")
+
+    def test_decode_token_foreign_algorithm(self, token_service, mock_user):
+        """Test that tokens with another header algorithm are rejected."""
+        from jose import jws
+
+        token = jws.sign(
+            {"sub": "1", "username": "testuser", "exp": 9999999999, "iat": 0},
+            token_service._secret_key,
+            algorithm="HS512",
+        )
+
+        with pytest.raises(InvalidTokenException):
+            token_service.decode_token(token)
+
+    def test_signing_key_uses_cryptography_backend(self, token_service):
+        """Test that HMAC signing runs on the OpenSSL-backed key."""
+        from jose.backends.cryptography_backend import CryptographyHMACKey
+
+        assert isinstance(token_service._signing_key, CryptographyHMACKey)
+
+    def test_decode_token_reuses_verified_payload(
+        self, mock_user_repository, mock_refresh_token_repository, mock_user
+    ):
+        """Test that a cached token is not verified again."""
+        cache = TokenPayloadCache()
+        service = TokenService(mock_user_repository, mock_refresh_token_repository, cache)
+        token = service.create_access_token(mock_user)
+        
+        first = service.decode_token(token)
+        with patch('app.core.auth.services.jws.verify') as mock_verify:
+            second = service.decode_token(token)
+        
+        assert first == second
+        mock_verify.assert_not_called()
+
+    def test_issued_token_decodes_without_verification(
+        self, mock_user_repository, mock_refresh_token_repository, mock_user
+    ):
+        """Test that issuing a token seeds the payload cache."""
+        cache = TokenPayloadCache()
+        service = TokenService(mock_user_repository, mock_refresh_token_repository, cache)
+        token = service.create_access_token(mock_user)
+        
+        with patch.object(service, '_verify_signature') as mock_verify:
+            payload = service.decode_token(token)
+        
+        mock_verify.assert_not_called()
+        assert payload.sub == str(mock_user.id)
+        assert payload.username == mock_user.username
+
+    def test_decode_token_cached_payload_expires(
+        self, mock_user_repository, mock_refresh_token_repository, mock_user
+    ):
+        """Test that cached payloads still honour token expiration."""
+        cache = TokenPayloadCache()
+        service = TokenService(mock_user_repository, mock_refresh_token_repository, cache)
+        token = service.create_access_token(mock_user)
+        payload = service.decode_token(token)
+        
+        with patch('app.core.auth.services.time.time', return_value=payload.exp + 1):
             with pytest.raises(ExpiredTokenException):
-                token_service.decode_token("expired.jwt.token")
+                service.decode_token(token)
+        
+        assert cache.get(token) is None
+
+    def test_access_token_reused_within_window(
+        self, mock_user_repository, mock_refresh_token_repository, mock_user
+    ):
+        """Test that repeated issuing for a user reuses the signed token."""
+        service = TokenService(
+            mock_user_repository,
+            mock_refresh_token_repository,
+            access_token_cache=AccessTokenCache(ttl=60),
+        )
+        other_user = User(
+            id=2,
+            username="other",
+            email="other@example.com",
+            hashed_password="hashed_password",
+        )
+        
+        first = service.create_access_token(mock_user)
+        with patch('app.core.auth.services.jws.sign') as mock_sign:
+            second = service.create_access_token(mock_user)
+        
+        assert first == second
+        mock_sign.assert_not_called()
+        assert service.create_access_token(other_user) != first
+
+    def test_token_pair_reports_time_left_on_reused_token(
+        self, mock_user_repository, mock_refresh_token_repository, mock_user
+    ):
+        """Test that expires_in counts down for a reused access token."""
+        service = TokenService(
+            mock_user_repository,
+            mock_refresh_token_repository,
+            access_token_cache=AccessTokenCache(ttl=60),
+        )
+        
+        with patch('app.core.auth.services.time.time', return_value=1_000_000):
+            first = service.create_token_pair(mock_user)
+        with patch('app.core.auth.services.time.time', return_value=1_000_010):
+            second = service.create_token_pair(mock_user)
+        
+        assert second.access_token == first.access_token
+        assert first.expires_in == 1800
+        assert second.expires_in == 1790
+
+    def test_access_token_reissued_after_window(
+        self, mock_user_repository, mock_refresh_token_repository, mock_user
+    ):
+        """Test that a new token is signed once the reuse window passes."""
+        service = TokenService(
+            mock_user_repository,
+            mock_refresh_token_repository,
+            access_token_cache=AccessTokenCache(ttl=0),
+        )
+        
+        service.create_access_token(mock_user)
+        with patch('app.core.auth.services.jws.sign', return_value="new") as mock_sign:
+            token = service.create_access_token(mock_user)
+        
+        assert token == "new"
+        mock_sign.assert_called_once()
+
+    def test_access_token_compatible_with_jose(self, token_service, mock_user):
+        """Test that issued tokens decode with the standard JWT decoder."""
+        from jose import jwt
+        
+        token = token_service.create_access_token(mock_user)
+        claims = jwt.decode(token, token_service._secret_key, algorithms=["HS256"])
+        
+        assert claims["sub"] == str(mock_user.id)
+        assert claims["exp"] - claims["iat"] == 30 * 60
 
     @pytest.mark.asyncio
     async def test_refresh_access_token_success(
@@ -195,8 +379,9 @@ class TestTokenService:
             is_revoked=False,
         )
         
-        mock_refresh_token_repository.get_refresh_token.return_value = refresh_token
-        mock_user_repository.get_user_by_id.return_value = mock_user
+        mock_refresh_token_repository.get_refresh_token_with_user.return_value = (
+            refresh_token, mock_user
+        )
         
         with patch.object(token_service, 'create_token_pair') as mock_create:
             mock_token_pair = TokenPair("new_access", "new_refresh", "bearer", 1800)
@@ -205,17 +390,17 @@ class TestTokenService:
             result = await token_service.refresh_access_token("valid_refresh_token")
             
             assert result == mock_token_pair
-            mock_refresh_token_repository.get_refresh_token.assert_called_once_with(
+            mock_refresh_token_repository.get_refresh_token_with_user.assert_called_once_with(
                 "valid_refresh_token"
             )
-            mock_user_repository.get_user_by_id.assert_called_once_with(mock_user.id)
+            mock_user_repository.get_user_by_id.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_refresh_access_token_not_found(
         self, token_service, mock_refresh_token_repository
     ):
         """Test refresh token not found."""
-        mock_refresh_token_repository.get_refresh_token.return_value = None
+        mock_refresh_token_repository.get_refresh_token_with_user.return_value = None
         
         with pytest.raises(InvalidTokenException, match="Refresh token not found"):
             await token_service.refresh_access_token("nonexistent_token")
@@ -233,7 +418,9 @@ class TestTokenService:
             is_revoked=True,
         )
         
-        mock_refresh_token_repository.get_refresh_token.return_value = refresh_token
+        mock_refresh_token_repository.get_refresh_token_with_user.return_value = (
+            refresh_token, None
+        )
         
         with pytest.raises(RevokedTokenException):
             await token_service.refresh_access_token("revoked_token")
@@ -251,7 +438,9 @@ class TestTokenService:
             is_revoked=False,
         )
         
-        mock_refresh_token_repository.get_refresh_token.return_value = refresh_token
+        mock_refresh_token_repository.get_refresh_token_with_user.return_value = (
+            refresh_token, None
+        )
         
         with pytest.raises(ExpiredTokenException):
             await token_service.refresh_access_token("expired_token")
@@ -284,6 +473,47 @@ class TestAuthenticationService:
                 assert result == mock_token_pair
                 mock_verify.assert_called_once_with("password", mock_user.hashed_password)
 
+    @pytest.mark.asyncio
+    async def test_authenticate_user_saves_refresh_token_expiry(
+        self,
+        auth_service,
+        mock_user,
+        mock_user_repository,
+        mock_refresh_token_repository,
+    ):
+        """Test that issued refresh tokens expire in 7 days (UTC)."""
+        mock_user_repository.get_user_by_username.return_value = mock_user
+
+        with patch.object(auth_service._password_service, 'verify_password', return_value=True):
+            with patch('app.core.auth.services.time.time', return_value=1_000_000):
+                await auth_service.authenticate_user("testuser", "password")
+
+        saved = mock_refresh_token_repository.save_refresh_token.call_args.args[0]
+        assert saved.expires_at == datetime.fromtimestamp(1_000_000 + 7 * 86400, tz=timezone.utc)
+
+    @pytest.mark.asyncio
+    async def test_authenticate_user_verifies_off_event_loop(
+        self,
+        auth_service,
+        mock_user,
+        mock_user_repository,
+    ):
+        """Test that bcrypt verification does not run on the event loop thread."""
+        mock_user_repository.get_user_by_username.return_value = mock_user
+        loop_thread = threading.get_ident()
+        verify_threads = []
+
+        def verify(password, hashed_password):
+            verify_threads.append(threading.get_ident())
+            return False
+
+        with patch.object(auth_service._password_service, 'verify_password', side_effect=verify):
+            with pytest.raises(InvalidCredentialsException):
+                await auth_service.authenticate_user("testuser", "password")
+
+        assert len(verify_threads) == 1
+        assert verify_threads[0] != loop_thread
+
     @pytest.mark.asyncio
     async def test_authenticate_user_invalid_credentials(
         self, auth_service, mock_user_repository
@@ -294,6 +524,23 @@ class TestAuthenticationService:
         with pytest.raises(InvalidCredentialsException):
             await auth_service.authenticate_user("nonexistent", "password")
 
+    @pytest.mark.asyncio
+    async def test_authenticate_unknown_user_checks_dummy_hash(
+        self, auth_service, mock_user_repository
+    ):
+        """Test that unknown users still cost one bcrypt verification."""
+        mock_user_repository.get_user_by_username.return_value = None
+
+        with patch.object(
+            auth_service._password_service, 'verify_password', return_value=True
+        ) as mock_verify:
+            with pytest.raises(InvalidCredentialsException):
+                await auth_service.authenticate_user("nonexistent", "password")
+
+        mock_verify.assert_called_once_with(
+            "password", auth_service._password_service.dummy_hash
+        )
+
     @pytest.mark.asyncio
     async def test_authenticate_user_inactive(
         self, auth_service, mock_user_repository
@@ -315,6 +562,60 @@ class TestAuthenticationService:
             with pytest.raises(InactiveUserException):
                 await auth_service.authenticate_user("inactive", "password")
 
+    @pytest.mark.asyncio
+    async def test_refresh_token_rotates_token_of_user(
+        self,
+        auth_service,
+        mock_user,
+        mock_refresh_token_repository,
+    ):
+        """Test that refreshing replaces the old token without decoding the new one."""
+        mock_refresh_token_repository.get_refresh_token_with_user.return_value = (
+            RefreshToken(
+                id=1,
+                user_id=mock_user.id,
+                token="valid_refresh",
+                expires_at=datetime.utcnow() + timedelta(days=1),
+                is_revoked=False,
+            ),
+            mock_user,
+        )
+
+        with patch.object(auth_service._token_service, 'decode_token') as mock_decode:
+            token_pair = await auth_service.refresh_token("valid_refresh")
+
+        mock_decode.assert_not_called()
+        old_token, new_token, expires_at = (
+            mock_refresh_token_repository.rotate_refresh_token.call_args.args
+        )
+        assert old_token == "valid_refresh"
+        assert new_token == token_pair.refresh_token
+        assert expires_at > datetime.now(timezone.utc) + timedelta(days=6)
+        mock_refresh_token_repository.save_refresh_token.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_refresh_token_rejects_concurrent_rotation(
+        self,
+        auth_service,
+        mock_user,
+        mock_refresh_token_repository,
+    ):
+        """Test that a token rotated by another request cannot be reused."""
+        mock_refresh_token_repository.get_refresh_token_with_user.return_value = (
+            RefreshToken(
+                id=1,
+                user_id=mock_user.id,
+                token="valid_refresh",
+                expires_at=datetime.utcnow() + timedelta(days=1),
+                is_revoked=False,
+            ),
+            mock_user,
+        )
+        mock_refresh_token_repository.rotate_refresh_token.return_value = None
+
+        with pytest.raises(RevokedTokenException):
+            await auth_service.refresh_token("valid_refresh")
+
     @pytest.mark.asyncio
     async def test_register_user_success(
         self, auth_service, mock_user_repository
@@ -401,4 +702,147 @@ class TestAuthenticationService:
         result = await auth_service.revoke_user_tokens(1)
         
         assert result == 3
-        mock_refresh_token_repository.revoke_user_tokens.assert_called_once_with(1)
\ No newline at end of file
+        mock_refresh_token_repository.revoke_user_tokens.assert_called_once_with(1)
+
+class TestTokenUserCache:
+    """Test cases for caching users resolved from access tokens."""
+
+    @pytest.fixture
+    def cached_auth_service(
+        self,
+        mock_user_repository,
+        mock_refresh_token_repository,
+        password_service,
+        token_service,
+    ):
+        """Create authentication service with a token user cache."""
+        return AuthenticationService(
+            mock_user_repository,
+            mock_refresh_token_repository,
+            password_service,
+            token_service,
+            TokenUserCache(maxsize=2, ttl=60),
+        )
+
+    @pytest.fixture
+    def valid_payload(self, mock_user):
+        """Create payload of a token valid for one hour."""
+        from app.core.auth.entities import TokenPayload
+
+        now = int(datetime.utcnow().timestamp())
+        return TokenPayload(
+            sub=str(mock_user.id),
+            username=mock_user.username,
+            exp=now + 3600,
+            iat=now,
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeated_token_skips_decode_and_lookup(
+        self, cached_auth_service, mock_user, mock_user_repository, valid_payload
+    ):
+        """Test that a cached token resolves without decode or DB access."""
+        mock_user_repository.get_user_by_id.return_value = mock_user
+
+        with patch.object(
+            cached_auth_service._token_service, 'decode_token', return_value=valid_payload
+        ) as mock_decode:
+            first = await cached_auth_service.get_current_user("valid_token")
+            second = await cached_auth_service.get_current_user("valid_token")
+
+        assert first == second == mock_user
+        mock_decode.assert_called_once_with("valid_token")
+        mock_user_repository.get_user_by_id.assert_called_once_with(mock_user.id)
+
+    @pytest.mark.asyncio
+    async def test_revoke_invalidates_cached_tokens(
+        self,
+        cached_auth_service,
+        mock_user,
+        mock_user_repository,
+        mock_refresh_token_repository,
+        valid_payload,
+    ):
+        """Test that revoking user tokens drops cached entries."""
+        mock_user_repository.get_user_by_id.return_value = mock_user
+        mock_refresh_token_repository.revoke_user_tokens.return_value = 1
+
+        with patch.object(
+            cached_auth_service._token_service, 'decode_token', return_value=valid_payload
+        ) as mock_decode:
+            await cached_auth_service.get_current_user("valid_token")
+            await cached_auth_service.revoke_user_tokens(mock_user.id)
+            await cached_auth_service.get_current_user("valid_token")
+
+        assert mock_decode.call_count == 2
+
+    def test_cache_evicts_oldest_entry(self, mock_user):
+        """Test that cache size stays bounded."""
+        cache = TokenUserCache(maxsize=2, ttl=60)
+
+        cache.set("a", mock_user)
+        cache.set("b", mock_user)
+        cache.get("a")
+        cache.set("c", mock_user)
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == mock_user
+
+    def test_expired_token_is_not_cached(self, mock_user):
+        """Test that entries never outlive the token expiration."""
+        cache = TokenUserCache(ttl=60)
+
+        cache.set("expired", mock_user, token_exp=int(datetime.utcnow().timestamp()) - 1)
+
+        assert cache.get("expired") is None
+
+
+class TestCachedUserRepository:
+    """Test cases for the cached user repository."""
+
+    @pytest.fixture
+    def cached_repository(self, mock_user_repository):
+        """Create cached repository over the mock repository."""
+        return CachedUserRepository(mock_user_repository, UserLookupCache(ttl=60))
+
+    @pytest.mark.asyncio
+    async def test_lookups_share_cached_user(
+        self, cached_repository, mock_user, mock_user_repository
+    ):
+        """Test that a user loaded by id is served by id and username."""
+        mock_user_repository.get_user_by_id.return_value = mock_user
+
+        await cached_repository.get_user_by_id(mock_user.id)
+        by_id = await cached_repository.get_user_by_id(mock_user.id)
+        by_username = await cached_repository.get_user_by_username(mock_user.username)
+
+        assert by_id == by_username == mock_user
+        mock_user_repository.get_user_by_id.assert_called_once_with(mock_user.id)
+        mock_user_repository.get_user_by_username.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_both_keys(
+        self, cached_repository, mock_user, mock_user_repository
+    ):
+        """Test that updating a user drops its cached entry."""
+        mock_user_repository.get_user_by_id.return_value = mock_user
+        mock_user_repository.get_user_by_username.return_value = mock_user
+        mock_user_repository.update_user.return_value = mock_user
+
+        await cached_repository.get_user_by_id(mock_user.id)
+        await cached_repository.update_user(mock_user)
+        await cached_repository.get_user_by_id(mock_user.id)
+        await cached_repository.get_user_by_username(mock_user.username)
+
+        assert mock_user_repository.get_user_by_id.call_count == 2
+        mock_user_repository.get_user_by_username.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_missing_user_is_not_cached(self, cached_repository, mock_user_repository):
+        """Test that negative lookups always reach the repository."""
+        mock_user_repository.get_user_by_id.return_value = None
+
+        assert await cached_repository.get_user_by_id(1) is None
+        assert await cached_repository.get_user_by_id(1) is None
+        assert mock_user_repository.get_user_by_id.call_count == 2
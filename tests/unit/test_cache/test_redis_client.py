@@ -2,7 +2,9 @@
 
 import pytest
 from datetime import timedelta
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from redis.asyncio import BlockingConnectionPool
 
 from app.infrastructure.cache.redis_client import RedisClient
 
@@ -25,14 +27,25 @@ class TestRedisClient:
     @pytest.mark.asyncio
     async def test_connect_success(self, redis_client):
         """Test successful Redis connection."""
-        with patch('redis.asyncio.from_url') as mock_from_url:
-            mock_redis = AsyncMock()
-            mock_from_url.return_value = mock_redis
-            
-            await redis_client.connect()
-            
-            assert redis_client._redis == mock_redis
-            mock_from_url.assert_called_once()
+        await redis_client.connect()
+        pool = redis_client._redis.connection_pool
+
+        assert isinstance(pool, BlockingConnectionPool)
+        assert pool.max_connections == redis_client._max_connections
+        assert pool.timeout == redis_client._pool_timeout
+
+        await redis_client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_connect_reuses_client(self, redis_client):
+        """Test that repeated connects keep the same pooled client."""
+        await redis_client.connect()
+        client = redis_client._redis
+
+        await redis_client.connect()
+
+        assert redis_client._redis is client
+        await redis_client.disconnect()
 
     @pytest.mark.asyncio
     async def test_disconnect(self, redis_client, mock_redis):
@@ -42,6 +55,7 @@ class TestRedisClient:
         await redis_client.disconnect()
         
         mock_redis.close.assert_called_once()
+        mock_redis.connection_pool.disconnect.assert_called_once()
         assert redis_client._redis is None
 
     @pytest.mark.asyncio
@@ -249,6 +263,35 @@ class TestRedisClient:
         
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_check_roundtrip_uses_single_pipeline(self, redis_client, mock_redis):
+        """Test that set/get/delete check is sent as one pipeline."""
+        pipe = MagicMock()
+        pipe.__aenter__.return_value = pipe
+        pipe.execute = AsyncMock(return_value=[True, '"value"', 1])
+        mock_redis.pipeline = MagicMock(return_value=pipe)
+        redis_client._redis = mock_redis
+
+        result = await redis_client.check_roundtrip("test_key", "value")
+
+        assert result is True
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        pipe.set.assert_called_once_with("test_key", '"value"')
+        pipe.get.assert_called_once_with("test_key")
+        pipe.delete.assert_called_once_with("test_key")
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_check_roundtrip_mismatch(self, redis_client, mock_redis):
+        """Test roundtrip check failure when read value differs."""
+        pipe = MagicMock()
+        pipe.__aenter__.return_value = pipe
+        pipe.execute = AsyncMock(return_value=[True, None, 0])
+        mock_redis.pipeline = MagicMock(return_value=pipe)
+        redis_client._redis = mock_redis
+
+        assert await redis_client.check_roundtrip("test_key", "value") is False
+
     @pytest.mark.asyncio
     async def test_get_info_success(self, redis_client, mock_redis):
         """Test successful get info operation."""
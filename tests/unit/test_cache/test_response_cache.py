@@ -0,0 +1,106 @@
+"""Tests for API response caching."""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+from app.api.cache import cache_response, clear_response_cache, endpoint_cache_key
+
+
+class _Payload(BaseModel):
+    name: str
+
+
+def _request(redis_client=None):
+    """Create request stub with app state."""
+    state = SimpleNamespace()
+    if redis_client is not None:
+        state.redis_client = redis_client
+    return SimpleNamespace(app=SimpleNamespace(state=state))
+
+
+async def _endpoint(request, build_name, current_user=None, build_service=None):
+    return _Payload(name=build_name)
+
+
+class TestResponseCache:
+    """Test cases for endpoint response caching."""
+
+    def test_key_ignores_injected_dependencies(self):
+        """Test that cache key depends only on request parameters."""
+        key_a = endpoint_cache_key(
+            "ns", _endpoint, {"request": object(), "build_name": "b", "current_user": 1}
+        )
+        key_b = endpoint_cache_key(
+            "ns", _endpoint, {"request": object(), "build_name": "b", "current_user": 2}
+        )
+        key_c = endpoint_cache_key("ns", _endpoint, {"build_name": "c"})
+
+        assert key_a == key_b
+        assert key_a != key_c
+        assert key_a.startswith("ns:_endpoint:")
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_endpoint(self):
+        """Test that cached payload is returned without calling endpoint."""
+        redis_client = AsyncMock()
+        redis_client.get.return_value = '{"name":"cached"}'
+        calls = []
+
+        async def endpoint(request, build_name):
+            calls.append(build_name)
+
+        wrapped = cache_response(ttl=30, namespace="ns")(endpoint)
+        result = await wrapped(request=_request(redis_client), build_name="b")
+
+        assert result.body == b'{"name":"cached"}'
+        assert result.media_type == "application/json"
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_stores_json_payload(self):
+        """Test that endpoint result is stored on cache miss."""
+        redis_client = AsyncMock()
+        redis_client.get.return_value = None
+
+        wrapped = cache_response(ttl=30, namespace="ns")(_endpoint)
+        result = await wrapped(request=_request(redis_client), build_name="b")
+
+        assert result == _Payload(name="b")
+        redis_client.set.assert_called_once()
+        assert redis_client.set.call_args.args[1:] == ('{"name":"b"}', 30)
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_stores_json_response_body(self):
+        """Test that JSON responses returned by endpoints are cached as-is."""
+        redis_client = AsyncMock()
+        redis_client.get.return_value = None
+
+        async def endpoint(request, build_name):
+            return ORJSONResponse({"name": build_name})
+
+        wrapped = cache_response(ttl=30, namespace="ns")(endpoint)
+        await wrapped(request=_request(redis_client), build_name="b")
+
+        assert redis_client.set.call_args.args[1:] == ('{"name":"b"}', 30)
+
+    @pytest.mark.asyncio
+    async def test_no_redis_bypasses_cache(self):
+        """Test that endpoints work when no Redis client is configured."""
+        wrapped = cache_response(ttl=30, namespace="ns")(_endpoint)
+
+        result = await wrapped(request=_request(), build_name="b")
+
+        assert result == _Payload(name="b")
+
+    @pytest.mark.asyncio
+    async def test_clear_response_cache(self):
+        """Test namespace invalidation."""
+        redis_client = AsyncMock()
+
+        await clear_response_cache(_request(redis_client), ["ns"])
+
+        redis_client.clear_pattern.assert_called_once_with("ns:*")
@@ -0,0 +1,94 @@
+"""Tests for Alembic data migration helpers."""
+
+import pytest
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+
+from app.infrastructure.database.migrations import batched
+
+items = sa.Table(
+    "items",
+    sa.MetaData(),
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("value", sa.String, nullable=True),
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Create file-backed SQLite engine with five unprocessed rows."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'migration.sqlite'}")
+    with engine.begin() as connection:
+        items.metadata.create_all(connection)
+        connection.execute(items.insert(), [{"id": i} for i in range(1, 6)])
+    yield engine
+    engine.dispose()
+
+
+def _run_migration(engine, upgrade):
+    """Run upgrade inside a transactional Alembic migration context."""
+    with engine.connect() as connection:
+        # SQLite has no transactional DDL in Alembic, force the PostgreSQL
+        # behaviour so the migration runs inside one outer transaction
+        context = MigrationContext.configure(
+            connection, opts={"transactional_ddl": True}
+        )
+        with Operations.context(context), context.begin_transaction():
+            upgrade(connection)
+
+
+def _processed_ids(engine):
+    """Get IDs of rows written by the migration, read on a new connection."""
+    with engine.connect() as connection:
+        query = sa.select(items.c.id).where(items.c.value.is_not(None))
+        return connection.execute(query.order_by(items.c.id)).scalars().all()
+
+
+class TestBatched:
+    """Test cases for batched."""
+
+    def test_yields_every_row_page_by_page(self, engine):
+        """Test that rows arrive in ordered pages of the requested size."""
+        pages = []
+
+        def upgrade(connection):
+            query = sa.select(items.c.id).order_by(items.c.id)
+            for rows in batched(query, page=2):
+                pages.append([row.id for row in rows])
+                connection.execute(
+                    items.update()
+                    .where(items.c.id.in_([row.id for row in rows]))
+                    .values(value="done")
+                )
+
+        _run_migration(engine, upgrade)
+
+        assert pages == [[1, 2], [3, 4], [5]]
+        assert _processed_ids(engine) == [1, 2, 3, 4, 5]
+
+    def test_commits_each_page(self, engine):
+        """Test that finished pages survive a failure later in the migration."""
+        def upgrade(connection):
+            query = sa.select(items.c.id).order_by(items.c.id)
+            for page_number, rows in enumerate(batched(query, page=2)):
+                if page_number == 2:
+                    raise RuntimeError("migration failed")
+                connection.execute(
+                    items.update()
+                    .where(items.c.id.in_([row.id for row in rows]))
+                    .values(value="done")
+                )
+
+        with pytest.raises(RuntimeError):
+            _run_migration(engine, upgrade)
+
+        assert _processed_ids(engine) == [1, 2, 3, 4]
+
+    def test_empty_query_yields_nothing(self, engine):
+        """Test that a query without rows yields no pages."""
+        def upgrade(connection):
+            query = sa.select(items.c.id).where(items.c.id > 5)
+            assert list(batched(query)) == []
+
+        _run_migration(engine, upgrade)
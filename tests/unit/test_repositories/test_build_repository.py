@@ -4,6 +4,7 @@ import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
 
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.domain.entities import Build
@@ -128,6 +129,55 @@ class TestSqlBuildRepository:
         assert "build1" in result
         assert "build2" in result
 
+    @pytest.mark.asyncio
+    async def test_paginate_builds(self, build_repository, mock_session):
+        """Test getting a page of builds with total count."""
+        build_models = [
+            BuildModel(name="build1", tasks=["task1"], status="pending"),
+        ]
+        
+        page_result = MagicMock()
+        page_result.scalars.return_value.all.return_value = build_models
+        count_result = MagicMock()
+        count_result.scalar_one.return_value = 3
+        mock_session.execute.side_effect = [page_result, count_result]
+
+        builds, total = await build_repository.paginate_builds(limit=1, offset=2)
+
+        assert total == 3
+        assert [build.name for build in builds] == ["build1"]
+        assert mock_session.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_create_build_inserted(self, build_repository, mock_session, sample_build):
+        """Test creating build with a single conflict-aware insert."""
+        mock_session.get_bind.return_value.dialect.name = "postgresql"
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = BuildModel(
+            name=sample_build.name, tasks=sample_build.tasks, status="pending"
+        )
+        mock_session.execute.return_value = mock_result
+
+        result = await build_repository.create_build(sample_build)
+
+        assert result.name == sample_build.name
+        assert result.status == BuildStatus.PENDING
+        mock_session.execute.assert_called_once()
+        stmt = mock_session.execute.call_args[0][0]
+        assert "ON CONFLICT" in str(stmt.compile(dialect=postgresql.dialect()))
+
+    @pytest.mark.asyncio
+    async def test_create_build_conflict(self, build_repository, mock_session, sample_build):
+        """Test creating build that already exists."""
+        mock_session.get_bind.return_value.dialect.name = "postgresql"
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        result = await build_repository.create_build(sample_build)
+
+        assert result is None
+
     @pytest.mark.asyncio
     async def test_save_new_build(self, build_repository, mock_session, sample_build):
         """Test saving new build."""
@@ -0,0 +1,167 @@
+"""Tests for refresh token repository implementation."""
+
+import hashlib
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Delete, Insert, Update
+
+from app.core.auth.entities import RefreshToken
+from app.infrastructure.database.repositories.refresh_token_repository import (
+    SqlRefreshTokenRepository,
+    hash_token,
+)
+
+
+@pytest.fixture
+def mock_session():
+    """Create mock async session."""
+    session = AsyncMock(spec=AsyncSession)
+    session.execute = AsyncMock()
+    session.flush = AsyncMock()
+    session.add = MagicMock()
+    return session
+
+
+@pytest.fixture
+def refresh_token_repository(mock_session):
+    """Create refresh token repository with mock session."""
+    return SqlRefreshTokenRepository(mock_session)
+
+
+class TestSqlRefreshTokenRepository:
+    """Test cases for SqlRefreshTokenRepository."""
+
+    def test_hash_token(self):
+        """Test that token lookup key is its SHA-256 digest."""
+        assert hash_token("token") == hashlib.sha256(b"token").digest()
+        assert len(hash_token("x" * 255)) == 32
+
+    @pytest.mark.asyncio
+    async def test_save_refresh_token_stores_hash(
+        self, refresh_token_repository, mock_session
+    ):
+        """Test that saved tokens carry their lookup hash."""
+        token = RefreshToken(
+            id=None,
+            user_id=1,
+            token="refresh",
+            expires_at=datetime.utcnow() + timedelta(days=7),
+        )
+
+        await refresh_token_repository.save_refresh_token(token)
+
+        model = mock_session.add.call_args.args[0]
+        assert model.token == "refresh"
+        assert model.token_hash == hash_token("refresh")
+
+    @pytest.mark.asyncio
+    async def test_get_refresh_token_queries_by_hash(
+        self, refresh_token_repository, mock_session
+    ):
+        """Test that lookups compare the token hash, not the raw token."""
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = result
+
+        assert await refresh_token_repository.get_refresh_token("refresh") is None
+
+        statement = mock_session.execute.call_args.args[0]
+        params = statement.compile().params
+        assert list(params.values()) == [hash_token("refresh")]
+
+    @pytest.mark.asyncio
+    async def test_get_refresh_token_with_user_single_query(
+        self, refresh_token_repository, mock_session
+    ):
+        """Test that token and owner are loaded with one joined SELECT."""
+        token_model = MagicMock(
+            id=1, user_id=7, token="refresh", expires_at=datetime.utcnow(),
+            is_revoked=False, created_at=None,
+        )
+        user_model = MagicMock(
+            id=7, username="user", email="user@example.com",
+            hashed_password="hashed", is_active=True,
+            created_at=None, updated_at=None,
+        )
+        result = MagicMock()
+        result.one_or_none.return_value = (token_model, user_model)
+        mock_session.execute.return_value = result
+
+        token, user = await refresh_token_repository.get_refresh_token_with_user("refresh")
+
+        assert (token.id, token.user_id) == (1, 7)
+        assert (user.id, user.username) == (7, "user")
+        mock_session.execute.assert_called_once()
+        statement = str(mock_session.execute.call_args.args[0])
+        assert "JOIN users" in statement
+
+    @pytest.mark.asyncio
+    async def test_rotate_refresh_token_single_statement(
+        self, refresh_token_repository, mock_session
+    ):
+        """Test that revoke and insert run as one guarded statement."""
+        result = MagicMock()
+        result.one_or_none.return_value = MagicMock(id=2, user_id=7, created_at=None)
+        mock_session.execute.return_value = result
+        expires_at = datetime.now(timezone.utc) + timedelta(days=7)
+
+        rotated = await refresh_token_repository.rotate_refresh_token(
+            "old", "new", expires_at
+        )
+
+        assert (rotated.id, rotated.user_id, rotated.token) == (2, 7, "new")
+        assert rotated.expires_at == expires_at
+        mock_session.execute.assert_called_once()
+        statement = mock_session.execute.call_args.args[0]
+        assert isinstance(statement, Insert)
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("WITH revoked AS")
+        assert "FROM revoked" in sql
+        mock_session.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rotate_refresh_token_inactive(
+        self, refresh_token_repository, mock_session
+    ):
+        """Test that nothing is returned when the old token was not active."""
+        result = MagicMock()
+        result.one_or_none.return_value = None
+        mock_session.execute.return_value = result
+        expires_at = datetime.now(timezone.utc) + timedelta(days=7)
+
+        assert await refresh_token_repository.rotate_refresh_token(
+            "old", "new", expires_at
+        ) is None
+
+    @pytest.mark.asyncio
+    async def test_cleanup_expired_tokens_single_delete(
+        self, refresh_token_repository, mock_session
+    ):
+        """Test that expired tokens are removed with one DELETE statement."""
+        mock_session.execute.return_value = MagicMock(rowcount=3)
+
+        removed = await refresh_token_repository.cleanup_expired_tokens()
+
+        assert removed == 3
+        mock_session.execute.assert_called_once()
+        statement = mock_session.execute.call_args.args[0]
+        assert isinstance(statement, Delete)
+        assert statement.table.name == "refresh_tokens"
+        mock_session.delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_revoke_user_tokens_single_update(
+        self, refresh_token_repository, mock_session
+    ):
+        """Test that user tokens are revoked with one UPDATE statement."""
+        mock_session.execute.return_value = MagicMock(rowcount=2)
+
+        revoked = await refresh_token_repository.revoke_user_tokens(1)
+
+        assert revoked == 2
+        mock_session.execute.assert_called_once()
+        assert isinstance(mock_session.execute.call_args.args[0], Update)
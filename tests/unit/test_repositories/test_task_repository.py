@@ -4,6 +4,7 @@ import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
 
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.domain.entities import Task
@@ -128,6 +129,83 @@ class TestSqlTaskRepository:
         assert "task1" in result
         assert "task2" in result
 
+    @pytest.mark.asyncio
+    async def test_paginate_tasks(self, task_repository, mock_session):
+        """Test getting a page of tasks with total count."""
+        task_models = [
+            TaskModel(name="task2", dependencies=["task1"], status="pending"),
+        ]
+        
+        page_result = MagicMock()
+        page_result.scalars.return_value.all.return_value = task_models
+        count_result = MagicMock()
+        count_result.scalar_one.return_value = 3
+        mock_session.execute.side_effect = [page_result, count_result]
+
+        tasks, total = await task_repository.paginate_tasks(limit=1, offset=1)
+
+        assert total == 3
+        assert [task.name for task in tasks] == ["task2"]
+        assert mock_session.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_create_task_inserted(self, task_repository, mock_session, sample_task):
+        """Test creating task with a single conflict-aware insert."""
+        mock_session.get_bind.return_value.dialect.name = "postgresql"
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = TaskModel(
+            name=sample_task.name, dependencies=["dep1", "dep2"], status="pending"
+        )
+        mock_session.execute.return_value = mock_result
+
+        result = await task_repository.create_task(sample_task)
+
+        assert result.name == sample_task.name
+        assert result.dependencies == {"dep1", "dep2"}
+        mock_session.execute.assert_called_once()
+        stmt = mock_session.execute.call_args[0][0]
+        assert "ON CONFLICT" in str(stmt.compile(dialect=postgresql.dialect()))
+
+    @pytest.mark.asyncio
+    async def test_create_task_conflict(self, task_repository, mock_session, sample_task):
+        """Test creating task that already exists."""
+        mock_session.get_bind.return_value.dialect.name = "postgresql"
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        result = await task_repository.create_task(sample_task)
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_patch_task_updates_given_fields(self, task_repository, mock_session):
+        """Test patching task with a single UPDATE ... RETURNING statement."""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = TaskModel(
+            name="test_task", dependencies=["dep1"], status="running"
+        )
+        mock_session.execute.return_value = mock_result
+
+        result = await task_repository.patch_task("test_task", status=TaskStatus.RUNNING)
+
+        assert result.status == TaskStatus.RUNNING
+        mock_session.execute.assert_called_once()
+        compiled = mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect())
+        assert "RETURNING" in str(compiled)
+        assert "dependencies" not in compiled.params
+
+    @pytest.mark.asyncio
+    async def test_patch_task_not_found(self, task_repository, mock_session):
+        """Test patching task that does not exist."""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        result = await task_repository.patch_task("missing", dependencies={"dep1"})
+
+        assert result is None
+
     @pytest.mark.asyncio
     async def test_save_new_task(self, task_repository, mock_session, sample_task):
         """Test saving new task."""
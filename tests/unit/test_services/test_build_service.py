@@ -41,6 +41,25 @@ def build_service(mock_build_repository, mock_task_repository, mock_topology_ser
     )
 
 
+@pytest.fixture
+def mock_cache_service():
+    """Create mock cache service."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def cached_build_service(
+    mock_build_repository, mock_task_repository, mock_topology_service, mock_cache_service
+):
+    """Create build service with a mocked cache service."""
+    return BuildService(
+        mock_build_repository,
+        mock_task_repository,
+        mock_topology_service,
+        mock_cache_service,
+    )
+
+
 @pytest.fixture
 def sample_tasks():
     """Create sample tasks for testing."""
@@ -131,6 +150,17 @@ class TestBuildService:
         assert result == builds
         mock_build_repository.get_all_builds.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_paginate_builds(self, build_service, mock_build_repository):
+        """Test getting a page of builds."""
+        builds = [Build(name="build1", tasks=["task1"])]
+        mock_build_repository.paginate_builds.return_value = (builds, 7)
+        
+        result = await build_service.paginate_builds(limit=1, offset=0)
+        
+        assert result == (builds, 7)
+        mock_build_repository.paginate_builds.assert_called_once_with(1, 0)
+
     @pytest.mark.asyncio
     async def test_create_build_success(
         self,
@@ -145,7 +175,7 @@ class TestBuildService:
         mock_task_repository.get_tasks.return_value = sample_tasks
         mock_topology_service.detect_cycles.return_value = []
         mock_topology_service.validate_dependencies.return_value = []
-        mock_build_repository.save_build.return_value = sample_build
+        mock_build_repository.create_build.return_value = sample_build
         
         result = await build_service.create_build(sample_build)
         
@@ -155,7 +185,7 @@ class TestBuildService:
         mock_topology_service.validate_dependencies.assert_called_once_with(
             sample_build, sample_tasks
         )
-        mock_build_repository.save_build.assert_called_once_with(sample_build)
+        mock_build_repository.create_build.assert_called_once_with(sample_build)
 
     @pytest.mark.asyncio
     async def test_create_build_missing_tasks(
@@ -347,6 +377,12 @@ class TestBuildService:
         
         completed_build = save_calls[1][0][0]
         assert completed_build.status == BuildStatus.COMPLETED
+        
+        # Verify task statuses are written in one batch
+        mock_task_repository.save_task.assert_not_called()
+        mock_task_repository.save_tasks.assert_called_once()
+        saved_tasks = mock_task_repository.save_tasks.call_args[0][0]
+        assert all(task.status == TaskStatus.COMPLETED for task in saved_tasks)
 
     @pytest.mark.asyncio
     async def test_execute_build_not_found(
@@ -492,6 +528,165 @@ class TestBuildService:
         assert "missing_dep" in issues
         assert "Circular dependency: task_a -> task_b -> task_a" in issues
 
+    @pytest.mark.asyncio
+    async def test_get_topological_sort_cache_hit(
+        self,
+        cached_build_service,
+        mock_cache_service,
+        mock_build_repository,
+        mock_task_repository,
+        mock_topology_service,
+        sample_build,
+        sample_tasks,
+        sample_sorted_tasks,
+    ):
+        """Test that cached sort result skips cycle detection and sorting."""
+        mock_cache_service.get_sorted_tasks.return_value = sample_sorted_tasks
+        mock_build_repository.get_build.return_value = sample_build
+        mock_task_repository.get_tasks.return_value = sample_tasks
+        
+        result = await cached_build_service.get_topological_sort("test_build")
+        
+        assert result == sample_sorted_tasks
+        mock_cache_service.get_sorted_tasks.assert_called_once_with(
+            "test_build", SortAlgorithm.KAHN, sample_build, sample_tasks
+        )
+        mock_topology_service.detect_cycles.assert_not_called()
+        mock_topology_service.sort_tasks.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_topological_sort_caches_result(
+        self,
+        cached_build_service,
+        mock_cache_service,
+        mock_build_repository,
+        mock_task_repository,
+        mock_topology_service,
+        sample_build,
+        sample_tasks,
+        sample_sorted_tasks,
+    ):
+        """Test that computed sort result is stored in cache."""
+        mock_cache_service.get_sorted_tasks.return_value = None
+        mock_build_repository.get_build.return_value = sample_build
+        mock_task_repository.get_tasks.return_value = sample_tasks
+        mock_topology_service.detect_cycles.return_value = []
+        mock_topology_service.sort_tasks = AsyncMock(return_value=sample_sorted_tasks)
+        
+        result = await cached_build_service.get_topological_sort("test_build")
+        
+        assert result == sample_sorted_tasks
+        mock_cache_service.cache_sorted_tasks.assert_called_once_with(
+            sample_sorted_tasks, SortAlgorithm.KAHN, sample_build, sample_tasks
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_topological_sort_loads_dependency_closure(
+        self,
+        build_service,
+        mock_build_repository,
+        mock_task_repository,
+        mock_topology_service,
+        sample_tasks,
+        sample_sorted_tasks,
+    ):
+        """Test that only the build tasks and their dependencies are read."""
+        build = Build(name="test_build", tasks=["task_c"], status=BuildStatus.PENDING)
+        mock_build_repository.get_build.return_value = build
+        mock_task_repository.get_tasks.side_effect = lambda names: {
+            name: sample_tasks[name] for name in names
+        }
+        mock_topology_service.detect_cycles.return_value = []
+        mock_topology_service.sort_tasks = AsyncMock(return_value=sample_sorted_tasks)
+        
+        await build_service.get_topological_sort("test_build")
+        
+        assert [call.args[0] for call in mock_task_repository.get_tasks.call_args_list] == [
+            ["task_c"],
+            ["task_b"],
+            ["task_a"],
+        ]
+        mock_task_repository.get_all_tasks.assert_not_called()
+        mock_topology_service.sort_tasks.assert_called_once_with(build, sample_tasks)
+
+    @pytest.mark.asyncio
+    async def test_detect_cycles_with_loaded_tasks(
+        self,
+        cached_build_service,
+        mock_cache_service,
+        mock_build_repository,
+        mock_task_repository,
+        mock_topology_service,
+        sample_tasks,
+    ):
+        """Test cycle detection reuses tasks loaded by the caller."""
+        mock_topology_service.detect_cycles.return_value = []
+        
+        cycles = await cached_build_service.detect_cycles("test_build", sample_tasks)
+        
+        assert cycles == []
+        mock_build_repository.get_build.assert_not_called()
+        mock_task_repository.get_tasks.assert_not_called()
+        mock_cache_service.get_cycles.assert_not_called()
+        mock_topology_service.detect_cycles.assert_called_once_with(sample_tasks)
+
+    @pytest.mark.asyncio
+    async def test_detect_cycles_cache_hit(
+        self,
+        cached_build_service,
+        mock_cache_service,
+        mock_build_repository,
+        mock_task_repository,
+        mock_topology_service,
+        sample_build,
+        sample_tasks,
+    ):
+        """Test that cached cycles for the current graph skip detection."""
+        mock_build_repository.get_build.return_value = sample_build
+        mock_task_repository.get_tasks.return_value = sample_tasks
+        mock_cache_service.get_cycles.return_value = [["task_a", "task_b", "task_a"]]
+        
+        cycles = await cached_build_service.detect_cycles("test_build")
+        
+        assert cycles == [["task_a", "task_b", "task_a"]]
+        mock_cache_service.get_cycles.assert_called_once_with(sample_build, sample_tasks)
+        mock_topology_service.detect_cycles.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_detect_cycles_caches_result(
+        self,
+        cached_build_service,
+        mock_cache_service,
+        mock_build_repository,
+        mock_task_repository,
+        mock_topology_service,
+        sample_build,
+        sample_tasks,
+    ):
+        """Test that computed cycles are stored in cache."""
+        mock_cache_service.get_cycles.return_value = None
+        mock_build_repository.get_build.return_value = sample_build
+        mock_task_repository.get_tasks.return_value = sample_tasks
+        mock_topology_service.detect_cycles.return_value = []
+        
+        cycles = await cached_build_service.detect_cycles("test_build")
+        
+        assert cycles == []
+        mock_cache_service.cache_cycles.assert_called_once_with(
+            [], sample_build, sample_tasks
+        )
+
+    @pytest.mark.asyncio
+    async def test_delete_build_invalidates_cache(
+        self, cached_build_service, mock_cache_service, mock_build_repository
+    ):
+        """Test that deleting a build drops its cached data."""
+        mock_build_repository.delete_build.return_value = True
+        
+        await cached_build_service.delete_build("test_build")
+        
+        mock_cache_service.invalidate_build.assert_called_once_with("test_build")
+
     @pytest.mark.asyncio
     async def test_reload_builds_from_config(self, build_service):
         """Test reloading builds from configuration."""
@@ -70,6 +70,28 @@ def complex_build():
     )
 
 
+class TestTask:
+    """Test cases for Task entity."""
+
+    def test_dependencies_normalized_to_frozenset(self):
+        """Test that dependencies are stored immutably and task is hashable."""
+        task = Task(name="task_b", dependencies=["task_a", "task_a"])
+        
+        assert task.dependencies == frozenset({"task_a"})
+        assert isinstance(task.dependencies, frozenset)
+        assert task.can_execute({"task_a"})
+        assert {task: 1}[Task(name="task_b", dependencies={"task_a"})] == 1
+
+
+class TestBuild:
+    """Test cases for Build entity."""
+
+    def test_duplicate_tasks_rejected(self):
+        """Test that a build listing a task twice is invalid."""
+        with pytest.raises(ValueError, match="duplicate tasks"):
+            Build(name="build", tasks=["task_a", "task_b", "task_a"])
+
+
 class TestTopologyService:
     """Test cases for TopologyService."""
 
@@ -90,6 +112,18 @@ class TestTopologyService:
         assert result.tasks.index("task_a") < result.tasks.index("task_d")
         assert result.tasks.index("task_b") < result.tasks.index("task_d")
 
+    @pytest.mark.asyncio
+    async def test_sort_tasks_kahn_keeps_build_order(self, topology_service):
+        """Test that independent dependents follow build task order."""
+        dependents = [f"task_{i}" for i in range(20)]
+        tasks = {"root": Task(name="root", dependencies=set())}
+        tasks.update({name: Task(name=name, dependencies={"root"}) for name in dependents})
+        build = Build(name="fan_out", tasks=["root", *dependents])
+
+        result = await topology_service.sort_tasks(build, tasks, SortAlgorithm.KAHN)
+
+        assert result.tasks == ["root", *dependents]
+
     @pytest.mark.asyncio
     async def test_sort_tasks_dfs_algorithm(self, topology_service, simple_build, simple_tasks):
         """Test DFS algorithm sorting."""